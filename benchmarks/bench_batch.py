@@ -0,0 +1,58 @@
+"""Benchmark: serial vs process-pool analysis of many saves.
+
+Usage:
+    python benchmarks/bench_batch.py [--saves N] [--vessels N] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.science_database import ScienceDatabase
+from parsers.sfs_parser import SFSParser
+from utils.batch_analyzer import BatchAnalyzer
+from synthetic_save import build_save_text
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--saves', type=int, default=24)
+    arg_parser.add_argument('--vessels', type=int, default=200)
+    arg_parser.add_argument('--workers', type=int, default=None)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as ksp_dir:
+        for index in range(args.saves):
+            save_dir = os.path.join(ksp_dir, 'saves', f'Career {index:02d}')
+            os.makedirs(save_dir)
+            with open(os.path.join(save_dir, 'persistent.sfs'), 'w', encoding='utf-8') as f:
+                f.write(build_save_text(vessel_count=args.vessels, seed=index))
+
+        save_games = SFSParser(ksp_directory=ksp_dir).find_save_games()
+        analyzer = BatchAnalyzer(ScienceDatabase(), max_workers=args.workers)
+
+        start = time.perf_counter()
+        serial = analyzer.analyze(save_games, parallel=False)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = analyzer.analyze(save_games, parallel=True)
+        parallel_time = time.perf_counter() - start
+
+    if [s['total_earned_science'] for s in serial] != [s['total_earned_science'] for s in parallel]:
+        print("ERROR: serial and parallel results disagree")
+        sys.exit(1)
+
+    print(f"Saves:     {len(save_games)} ({args.vessels} vessels each)")
+    print(f"Workers:   {analyzer.max_workers}")
+    print(f"Serial:    {serial_time * 1000:8.1f} ms ({len(save_games) / serial_time:6.1f} saves/s)")
+    print(f"Parallel:  {parallel_time * 1000:8.1f} ms ({len(save_games) / parallel_time:6.1f} saves/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: catalogue generation vs loading the compiled snapshot.
+
+The stock catalogue is scaled up by cloning every body (as a large planet
+pack would), to show how startup grows with catalogue size.
+
+Usage:
+    python benchmarks/bench_catalogue_snapshot.py [--scale N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.science_database import ScienceDatabase
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
+
+
+def write_scaled_data(data_dir, scale):
+    """Copy the stock data, with every body cloned scale times."""
+    os.makedirs(data_dir)
+    shutil.copy(os.path.join(DATA_DIR, 'experiments.json'), data_dir)
+    with open(os.path.join(DATA_DIR, 'celestial_bodies.json')) as f:
+        bodies = json.load(f)
+    bodies['bodies'] = [
+        dict(body, name=body['name'] if copy == 0 else f"{body['name']}{copy}")
+        for copy in range(scale) for body in bodies['bodies']
+    ]
+    with open(os.path.join(data_dir, 'celestial_bodies.json'), 'w') as f:
+        json.dump(bodies, f)
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 50])
+    args = arg_parser.parse_args()
+
+    print(f"{'scale':>5} {'rows':>9} {'generate':>10} {'cold+save':>10} "
+          f"{'snapshot':>10} {'1 body':>8} {'snapshot size':>14}")
+    for scale in args.scale:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = os.path.join(tmp, 'data')
+            snapshot_dir = os.path.join(tmp, 'catalogue')
+            write_scaled_data(data_dir, scale)
+
+            generate, db = _time(lambda: ScienceDatabase(data_dir, use_snapshot=False))
+            cold, _ = _time(lambda: ScienceDatabase(data_dir, snapshot_dir))
+            warm, snap_db = _time(lambda: ScienceDatabase(data_dir, snapshot_dir))
+            assert snap_db.loaded_from_snapshot
+            query, _ = _time(lambda: snap_db.get_experiments_by_body('Mun'))
+            size = sum(os.path.getsize(os.path.join(snapshot_dir, name))
+                       for name in os.listdir(snapshot_dir))
+
+            print(f"{scale:>5} {db.get_total_experiment_count():>9,} "
+                  f"{generate * 1000:>8.1f}ms {cold * 1000:>8.1f}ms "
+                  f"{warm * 1000:>8.1f}ms {query * 1000:>6.2f}ms {size / 1024:>11.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Microbenchmark: dataclass ExperimentID vs interned slot-based ExperimentID.
+
+The "before" numbers use a copy of the original dataclass, whose hash and
+equality rebuild the KSP id string on every call.
+
+Usage:
+    python benchmarks/bench_experiment_id.py
+"""
+
+import os
+import sys
+import timeit
+from dataclasses import dataclass
+from typing import Optional
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.experiment import ExperimentID
+from models.science_database import ScienceDatabase
+
+
+@dataclass
+class LegacyExperimentID:
+    """The original dataclass implementation."""
+
+    experiment_type: str
+    body: str
+    situation: str
+    biome: Optional[str] = None
+
+    def to_ksp_id(self) -> str:
+        biome_part = self.biome if self.biome else ""
+        return f"{self.experiment_type}@{self.body}{self.situation}{biome_part}"
+
+    def __hash__(self) -> int:
+        return hash(self.to_ksp_id())
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LegacyExperimentID):
+            return False
+        return self.to_ksp_id() == other.to_ksp_id()
+
+
+def _lookup_workload(id_class, fields):
+    """
+    Mimic calculate_available_science: a save dict keyed by IDs built by the
+    extractor, probed with IDs built by the database.
+    """
+    save_ids = {id_class(*f): True for f in fields[::3]}
+    catalogue_ids = [id_class(*f) for f in fields]
+    return lambda: sum(1 for exp_id in catalogue_ids if save_ids.get(exp_id))
+
+
+def main():
+    db = ScienceDatabase()
+    fields = [
+        (e.experiment_id.experiment_type, e.experiment_id.body,
+         e.experiment_id.situation, e.experiment_id.biome)
+        for e in db.get_all_experiments()
+    ]
+    repeat = 200
+
+    print(f"Catalogue: {len(fields)} subjects, {repeat} repetitions\n")
+    print(f"{'Operation':<28} {'Before (ms)':>12} {'After (ms)':>12} {'Speedup':>8}")
+
+    cases = [
+        ("Construct all IDs",
+         lambda: [LegacyExperimentID(*f) for f in fields],
+         lambda: [ExperimentID(*f) for f in fields]),
+    ]
+
+    legacy_ids = [LegacyExperimentID(*f) for f in fields]
+    interned_ids = [ExperimentID(*f) for f in fields]
+    cases.append(("Hash all IDs",
+                  lambda: [hash(i) for i in legacy_ids],
+                  lambda: [hash(i) for i in interned_ids]))
+    cases.append(("Catalogue dict lookups",
+                  _lookup_workload(LegacyExperimentID, fields),
+                  _lookup_workload(ExperimentID, fields)))
+
+    for label, before, after in cases:
+        before_time = min(timeit.repeat(before, number=repeat, repeat=3)) / repeat
+        after_time = min(timeit.repeat(after, number=repeat, repeat=3)) / repeat
+        print(f"{label:<28} {before_time * 1000:>12.3f} {after_time * 1000:>12.3f} "
+              f"{before_time / after_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark: GameData definition loading - serial, parallel and cached.
+
+Builds a synthetic GameData folder of part configs with a few science and
+planet pack configs mixed in.
+
+Usage:
+    python benchmarks/bench_gamedata.py [--files N] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parsers.gamedata_loader import GameDataLoader
+
+PART = """PART
+{{
+    name = part{index}
+    module = Part
+    author = Bench
+    MODULE
+    {{
+        name = ModuleFuelTank
+        capacity = {index}
+    }}
+    RESOURCE
+    {{
+        name = LiquidFuel
+        amount = 90
+        maxAmount = 90
+    }}
+}}
+"""
+
+EXPERIMENT = """EXPERIMENT_DEFINITION
+{{
+    id = benchExperiment{index}
+    title = Bench Experiment {index}
+    baseValue = 10
+    scienceCap = 20
+    situationMask = 63
+    biomeMask = 3
+}}
+"""
+
+BODY = """@Kopernicus
+{{
+    Body
+    {{
+        name = BenchPlanet{index}
+        Template {{ name = Duna }}
+        Properties {{ Biomes {{ Biome {{ name = Bench Lowlands }} Biome {{ name = Bench Peaks }} }} }}
+    }}
+}}
+"""
+
+
+def write_gamedata(directory, file_count):
+    """Write file_count configs, one in 50 defining science or bodies."""
+    for index in range(file_count):
+        mod_dir = os.path.join(directory, f"Mod{index % 40}", "Parts")
+        os.makedirs(mod_dir, exist_ok=True)
+        template = (EXPERIMENT if index % 100 == 0 else
+                    BODY if index % 100 == 50 else PART)
+        with open(os.path.join(mod_dir, f"file{index}.cfg"), 'w') as f:
+            f.write(template.format(index=index))
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--files', type=int, default=3000)
+    arg_parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        gamedata = os.path.join(tmp, 'GameData')
+        write_gamedata(gamedata, args.files)
+
+        serial, result = _time(lambda: GameDataLoader(
+            gamedata, cache_dir=os.path.join(tmp, 'serial'), max_workers=1).load())
+        parallel, _ = _time(lambda: GameDataLoader(
+            gamedata, cache_dir=os.path.join(tmp, 'parallel'), max_workers=args.workers).load())
+        cached, _ = _time(lambda: GameDataLoader(
+            gamedata, cache_dir=os.path.join(tmp, 'parallel')).load())
+
+    print(f"Files: {args.files:,} ({len(result['experiments'])} experiments, "
+          f"{len(result['bodies'])} bodies)")
+    print(f"Cold, serial:            {serial * 1000:8.1f} ms")
+    print(f"Cold, {args.workers} workers:         {parallel * 1000:8.1f} ms")
+    print(f"Cached (no changes):     {cached * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: science history recording and trend queries.
+
+Records a synthetic career of --snapshots loads, each completing or
+improving --per-snapshot subjects of the stock catalogue, then times the
+trend queries the GUI and the history command run. Also reports the rows
+logged against what storing every subject of every snapshot would take.
+
+Usage:
+    python benchmarks/bench_history.py [--snapshots N] [--per-snapshot N]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.experiment import CompletedExperiment
+from models.save_data import SaveGameData
+from models.science_database import ScienceDatabase
+from utils.science_history import ScienceHistory
+
+
+def _best(func, repeat=5):
+    """Best wall time of func over repeat runs, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--snapshots', type=int, default=3000)
+    arg_parser.add_argument('--per-snapshot', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(42)
+    experiments = ScienceDatabase().get_all_experiments()
+    values = {}
+    save_data = SaveGameData("Bench Career")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = ScienceHistory(os.path.join(tmp, 'history.sqlite3'))
+        save_path = os.path.join(tmp, 'persistent.sfs')
+        full_rows = 0
+
+        start = time.perf_counter()
+        for snapshot in range(args.snapshots):
+            for exp in rng.sample(experiments, args.per_snapshot):
+                exp_id = exp.experiment_id
+                earned = min(values.get(exp_id, 0.0) + rng.uniform(1, 10), 30.0)
+                values[exp_id] = earned
+                save_data.add_completed_experiment(CompletedExperiment(exp_id, earned, 30.0))
+            history.record("Bench Career", save_path, save_data, recorded_at=float(snapshot))
+            full_rows += len(values)
+        elapsed = time.perf_counter() - start
+
+        with sqlite3.connect(history.path) as conn:
+            logged = conn.execute("SELECT COUNT(*) FROM changes").fetchone()[0]
+        print(f"{args.snapshots:,} snapshots, {len(values):,} subjects at the end")
+        print(f"  record: {elapsed / args.snapshots * 1000:.2f}ms per snapshot")
+        print(f"  rows logged: {logged:,} (every subject of every snapshot: {full_rows:,})")
+
+        print(f"\n{'query':>40} {'rows':>7} {'time':>9}")
+        for label, query in (
+            ("total, last 50", lambda: history.trend("Bench Career")),
+            ("per body, last 50", lambda: history.trend("Bench Career", by='body')),
+            ("per experiment, last 50", lambda: history.trend("Bench Career", by='experiment')),
+            ("per body, all", lambda: history.trend("Bench Career", by='body', limit=None)),
+            ("subjects at the middle snapshot",
+             lambda: history.subjects_at(save_path, args.snapshots / 2)),
+        ):
+            rows = len(query())
+            print(f"{label:>40} {rows:>7,} {_best(query) * 1000:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark: ingesting save backups into the science history.
+
+Writes --backups timestamped backups of one synthetic save, then ingests
+them serially and with a process pool (each into a fresh history), and
+times a second run, which skips every file by fingerprint.
+
+Usage:
+    python benchmarks/bench_ingest.py [--backups N] [--vessels N] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.science_database import ScienceDatabase
+from parsers.sfs_parser import SFSParser
+from utils.save_ingest import SaveIngester
+from utils.science_history import ScienceHistory
+from synthetic_save import build_save_text
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--backups', type=int, default=24)
+    arg_parser.add_argument('--vessels', type=int, default=200)
+    arg_parser.add_argument('--workers', type=int, default=None)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_dir = os.path.join(tmp, 'ksp', 'saves', 'Career')
+        os.makedirs(os.path.join(save_dir, 'Backup'))
+        with open(os.path.join(save_dir, 'persistent.sfs'), 'w', encoding='utf-8') as f:
+            f.write(build_save_text(vessel_count=args.vessels, science_count=400))
+        for index in range(args.backups):
+            name = f"persistent (2024{index // 28 + 1:02d}{index % 28 + 1:02d}T120000).sfs"
+            with open(os.path.join(save_dir, 'Backup', name), 'w', encoding='utf-8') as f:
+                f.write(build_save_text(vessel_count=args.vessels,
+                                        science_count=10 + index * 390 // args.backups))
+
+        save_files = SFSParser(ksp_directory=os.path.join(tmp, 'ksp')).find_save_files()
+        science_db = ScienceDatabase()
+
+        timings = {}
+        trends = {}
+        for mode, parallel in (('serial', False), ('parallel', True)):
+            history = ScienceHistory(os.path.join(tmp, f'{mode}.sqlite3'))
+            ingester = SaveIngester(science_db, history, max_workers=args.workers)
+            start = time.perf_counter()
+            [summary] = ingester.ingest(save_files, parallel=parallel)
+            timings[mode] = time.perf_counter() - start
+            trends[mode] = history.trend("Career", limit=None)
+
+        start = time.perf_counter()
+        [rerun] = ingester.ingest(save_files)
+        timings['rerun'] = time.perf_counter() - start
+
+    if trends['serial'] != trends['parallel']:
+        print("ERROR: serial and parallel timelines disagree")
+        sys.exit(1)
+
+    print(f"Files:     {summary['files']} ({args.vessels} vessels each), "
+          f"{summary['recorded']} snapshots recorded")
+    print(f"Workers:   {ingester.max_workers}")
+    print(f"Serial:    {timings['serial'] * 1000:8.1f} ms")
+    print(f"Parallel:  {timings['parallel'] * 1000:8.1f} ms")
+    print(f"Re-run:    {timings['rerun'] * 1000:8.1f} ms ({rerun['skipped']} skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark: heuristic from_ksp_id vs compiled, memoized KspIdDecoder.
+
+Usage:
+    python benchmarks/bench_ksp_id_decoder.py [--ids N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.experiment import ExperimentID
+from models.ksp_id_decoder import KspIdDecoder
+from models.science_database import ScienceDatabase
+
+
+def _time(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--ids', type=int, default=5000)
+    args = arg_parser.parse_args()
+
+    db = ScienceDatabase()
+    catalogue = [e.experiment_id.to_ksp_id() for e in db.get_all_experiments()]
+    rng = random.Random(1)
+    ids = [rng.choice(catalogue) for _ in range(args.ids)]
+
+    heuristic = _time(lambda: [ExperimentID.from_ksp_id(i) for i in ids])
+
+    decoder = KspIdDecoder(db.bodies)
+    cold = _time(lambda: decoder.decode_many(ids))
+    warm = _time(lambda: decoder.decode_many(ids))
+
+    print(f"Ids: {len(ids)} ({len(set(ids))} distinct)")
+    print(f"Heuristic from_ksp_id:   {heuristic * 1000:8.2f} ms")
+    print(f"Decoder, cold memo:      {cold * 1000:8.2f} ms")
+    print(f"Decoder, warm memo:      {warm * 1000:8.2f} ms")
+    print(f"Memo: {decoder.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
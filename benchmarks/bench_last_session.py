@@ -0,0 +1,78 @@
+"""Benchmark: warm start from the last session vs. computing results cold.
+
+For a scaled catalogue (every body cloned --scale times) and an empty
+save, compares what must happen before the first save can be shown: cold,
+building the catalogue and calculating availability and statistics; warm,
+reading the last session and indexing its rows. Also times writing the
+session, which happens when the window closes.
+
+Usage:
+    python benchmarks/bench_last_session.py [--scale N ...]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_catalogue_snapshot import write_scaled_data
+from models.experiment_index import ExperimentIndex
+from models.save_data import SaveGameData
+from models.science_database import ScienceDatabase
+from utils.last_session import LastSession
+from utils.science_calculator import ScienceCalculator
+
+
+def _best(func, repeat=3):
+    """Best wall time of func over repeat runs, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 50])
+    args = arg_parser.parse_args()
+
+    print(f"{'rows':>8} {'cold':>10} {'warm':>10} {'write':>10} {'size':>10}")
+    for scale in args.scale:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = os.path.join(tmp, 'data')
+            write_scaled_data(data_dir, scale)
+            save_path = os.path.join(tmp, 'persistent.sfs')
+            open(save_path, 'w').close()
+            save_data = SaveGameData("Bench")
+
+            def cold():
+                db = ScienceDatabase(data_dir, use_snapshot=False)
+                calculator = ScienceCalculator(db)
+                available = calculator.calculate_available_science(save_data)
+                ExperimentIndex(available)
+                return db, available, calculator.calculate_statistics(available, save_data)
+
+            db, available, stats = cold()
+            session = LastSession(os.path.join(tmp, 'last_session.json'))
+
+            def write():
+                session.save("Bench", save_path, save_data, available, stats,
+                             filters={}, choices={}, catalogue_hash=db.source_hash)
+
+            def warm():
+                ExperimentIndex(session.load()['available'])
+
+            written = _best(write)
+            print(f"{len(available):>8,} {_best(cold) * 1000:>8.1f}ms {_best(warm) * 1000:>8.1f}ms "
+                  f"{written * 1000:>8.1f}ms {os.path.getsize(session.path) / 1024:>8.0f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark: cold load vs parse cache hit.
+
+Usage:
+    python benchmarks/bench_parse_cache.py [--vessels N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parsers.parse_cache import ParseCache
+from parsers.sfs_parser import SFSParser
+from synthetic_save import write_synthetic_save
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--vessels', type=int, default=300)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_path = str(write_synthetic_save(os.path.join(tmp, 'persistent.sfs'),
+                                             vessel_count=args.vessels))
+        cache = ParseCache(cache_dir=os.path.join(tmp, 'cache'))
+        parser = SFSParser(ksp_directory=tmp, cache=cache)
+
+        start = time.perf_counter()
+        parser.load_science_data(save_path, "bench")
+        cold = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parser.load_science_data(save_path, "bench")
+        warm = time.perf_counter() - start
+
+        # Touch without changing content: falls back to the content hash
+        stat = os.stat(save_path)
+        os.utime(save_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        start = time.perf_counter()
+        parser.load_science_data(save_path, "bench")
+        touched = time.perf_counter() - start
+
+        size_mb = os.path.getsize(save_path) / (1024 * 1024)
+        stats = cache.get_stats()
+
+    print(f"Save size:          {size_mb:.1f} MB")
+    print(f"Cold load (miss):   {cold * 1000:8.2f} ms")
+    print(f"Cache hit:          {warm * 1000:8.2f} ms")
+    print(f"Hit after touch:    {touched * 1000:8.2f} ms")
+    print(f"Hits/misses:        {stats['hits']}/{stats['misses']}")
+
+
+if __name__ == "__main__":
+    main()
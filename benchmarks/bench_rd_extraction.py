@@ -0,0 +1,67 @@
+"""Benchmark: full sfsutils parse vs R&D-only extraction.
+
+Usage:
+    python benchmarks/bench_rd_extraction.py [--vessels N] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parsers.sfs_parser import SFSParser
+from parsers.science_extractor import ScienceExtractor
+from synthetic_save import write_synthetic_save
+
+
+def _best_of(repeat, func):
+    """Run func repeat times and return (best seconds, last result)."""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--vessels', type=int, default=300)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    parser = SFSParser(ksp_directory=tempfile.gettempdir())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_path = write_synthetic_save(os.path.join(tmp, 'persistent.sfs'),
+                                         vessel_count=args.vessels)
+        size_mb = save_path.stat().st_size / (1024 * 1024)
+
+        def full_parse():
+            parsed = parser.parse_save_file(str(save_path))
+            return ScienceExtractor.extract_science_data(parsed, "bench")
+
+        def rd_only():
+            return parser.load_science_data(str(save_path), "bench")
+
+        full_time, full_data = _best_of(args.repeat, full_parse)
+        rd_time, rd_data = _best_of(args.repeat, rd_only)
+
+    if full_data.completed_experiments.keys() != rd_data.completed_experiments.keys():
+        print("ERROR: extraction paths disagree")
+        sys.exit(1)
+
+    print(f"Save size:        {size_mb:.1f} MB ({args.vessels} vessels)")
+    print(f"Science entries:  {rd_data.get_completed_count()}")
+    print(f"Full parse:       {full_time * 1000:8.1f} ms")
+    print(f"R&D-only scan:    {rd_time * 1000:8.1f} ms")
+    print(f"Speedup:          {full_time / rd_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
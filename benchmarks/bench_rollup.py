@@ -0,0 +1,98 @@
+"""Benchmark: per-level regrouping vs single-pass ScienceRollup.
+
+The baseline mirrors how the tree used to compute group totals: nested
+defaultdicts, with every level flattening its subtree again.
+
+Usage:
+    python benchmarks/bench_rollup.py [--scale N ...]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_catalogue_snapshot import write_scaled_data
+from models.save_data import SaveGameData
+from models.science_database import ScienceDatabase
+from models.science_rollup import ScienceRollup
+from utils.science_calculator import ScienceCalculator
+
+
+def _summary(experiments):
+    total = sum(exp.available_science for exp in experiments)
+    completed = sum(1 for exp in experiments if exp.available_science <= 0.1)
+    return total, len(experiments), completed
+
+
+def regroup(experiments, mode):
+    """Totals for every group the old way (flatten per level)."""
+    groups = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    for exp in experiments:
+        a, b, c = ScienceRollup.key_path(mode, exp)
+        groups[a][b][c].append(exp)
+
+    totals = {}
+    for a, level_b in groups.items():
+        totals[(a,)] = _summary([e for bs in level_b.values() for cs in bs.values() for e in cs])
+        for b, level_c in level_b.items():
+            totals[(a, b)] = _summary([e for cs in level_c.values() for e in cs])
+            for c, exps in level_c.items():
+                totals[(a, b, c)] = _summary(exps)
+    totals[()] = _summary(experiments)
+    return totals
+
+
+def _best(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scale', type=int, nargs='+', default=[1, 10])
+    args = arg_parser.parse_args()
+
+    modes = tuple(ScienceRollup.MODES)
+    print(f"{'rows':>9} {'regroup x3':>11} {'rollup x3':>10} {'regroup 1':>10} "
+          f"{'rollup 1':>9} {'update 10':>10}")
+    for scale in args.scale:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = os.path.join(tmp, 'data')
+            write_scaled_data(data_dir, scale)
+            db = ScienceDatabase(data_dir, use_snapshot=False)
+            available = ScienceCalculator(db).calculate_available_science(SaveGameData())
+
+            baseline = _best(lambda: [regroup(available, mode) for mode in modes])
+            rollup_all = _best(lambda: ScienceRollup(available, modes))
+            regroup_one = _best(lambda: regroup(available, 'Body'))
+            rollup_one = _best(lambda: ScienceRollup(available, ('Body',)))
+
+            # A reload that changes a few subjects: remove and re-add them
+            rollup = ScienceRollup(available, ('Body',))
+            changed = available[::max(1, len(available) // 10)][:10]
+
+            def update():
+                for exp in changed:
+                    rollup.remove(exp)
+                    rollup.add(exp)
+
+            updated = _best(update)
+
+            print(f"{len(available):>9,} {baseline * 1000:>9.1f}ms {rollup_all * 1000:>8.1f}ms "
+                  f"{regroup_one * 1000:>8.1f}ms {rollup_one * 1000:>7.1f}ms "
+                  f"{updated * 1000:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
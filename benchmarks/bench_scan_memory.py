@@ -0,0 +1,65 @@
+"""Benchmark: peak Python memory of the save extraction paths.
+
+Compares the full sfsutils parse, the text line scan and the memory-mapped
+byte scan. Peak allocations are measured with tracemalloc; mapped file pages
+belong to the OS page cache and are not counted.
+
+Usage:
+    python benchmarks/bench_scan_memory.py [--vessels N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parsers.sfs_parser import SFSParser
+from parsers.science_extractor import ScienceExtractor
+from synthetic_save import write_synthetic_save
+
+
+def _measure(func):
+    """Return (seconds, peak bytes, result) for one call of func."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--vessels', type=int, default=600)
+    args = arg_parser.parse_args()
+
+    parser = SFSParser(ksp_directory=tempfile.gettempdir())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_path = str(write_synthetic_save(os.path.join(tmp, 'persistent.sfs'),
+                                             vessel_count=args.vessels))
+        size_mb = os.path.getsize(save_path) / (1024 * 1024)
+
+        paths = [
+            ("Full parse", lambda: ScienceExtractor.extract_science_data(
+                parser.parse_save_file(save_path), "bench")),
+            ("Line scan", lambda: parser.load_science_data(save_path, "bench", use_mmap=False)),
+            ("mmap scan", lambda: parser.load_science_data(save_path, "bench", use_mmap=True)),
+        ]
+
+        print(f"Save size: {size_mb:.1f} MB ({args.vessels} vessels)")
+        print(f"{'Path':<12} {'Time (ms)':>10} {'Peak (KB)':>12} {'Entries':>8}")
+        for label, func in paths:
+            elapsed, peak, save_data = _measure(func)
+            print(f"{label:<12} {elapsed * 1000:>10.1f} {peak / 1024:>12.0f} "
+                  f"{save_data.get_completed_count():>8}")
+
+
+if __name__ == "__main__":
+    main()
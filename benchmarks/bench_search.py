@@ -0,0 +1,74 @@
+"""Benchmark: free-text search, scanning vs SearchIndex.
+
+Usage:
+    python benchmarks/bench_search.py [--scale N ...]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_catalogue_snapshot import write_scaled_data
+from models.experiment import SITUATION_LABELS
+from models.science_database import ScienceDatabase
+from models.search_index import SearchIndex, label_tokens, query_words
+
+QUERIES = ("mun canyons surface sample", "crew", "s", "surface landed", "kerbin space high", "zzz")
+
+
+def scan(experiments, text):
+    """Search by tokenizing every experiment's labels."""
+    words = query_words(text)
+    result = []
+    for exp in experiments:
+        exp_id = exp.experiment_id
+        tokens = set()
+        for label in (exp.body_name, exp_id.experiment_type, exp.experiment_name, exp_id.situation,
+                      SITUATION_LABELS[exp_id.situation], exp_id.biome or ""):
+            tokens |= label_tokens(label)
+        if all(any(token.startswith(word) for token in tokens) for word in words):
+            result.append(exp)
+    return result
+
+
+def _best(func, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 50])
+    args = arg_parser.parse_args()
+
+    for scale in args.scale:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = os.path.join(tmp, 'data')
+            write_scaled_data(data_dir, scale)
+            db = ScienceDatabase(data_dir, use_snapshot=False)
+            experiments = db.get_all_experiments()
+
+            build = _best(lambda: SearchIndex.from_database(db))
+            search_index = db.get_search_index()
+            print(f"\n{len(experiments):,} experiments, index built in {build * 1000:.1f}ms")
+            print(f"{'query':>28} {'results':>8} {'scan':>10} {'index':>9}")
+            for query in QUERIES:
+                results = search_index.positions(query, db.index)
+                scanned = _best(lambda: scan(experiments, query), repeat=1)
+                indexed = _best(lambda: search_index.positions(query, db.index))
+                print(f"{query:>28} {len(results):>8,} {scanned * 1000:>8.1f}ms "
+                      f"{indexed * 1000:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
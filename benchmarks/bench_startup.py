@@ -0,0 +1,97 @@
+"""Benchmark: application startup milestones.
+
+Prints how long the data preparation takes that startup used to do before
+the window could paint (parser, GameData, catalogue, save scan), then -
+with a display - starts MainWindow and reports when the last session's
+results were shown (if saved), when the window painted, when the catalogue
+was ready and when the first save was loaded.
+
+Usage:
+    python benchmarks/bench_startup.py [--ksp-dir DIR] [--timeout SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.science_database import ScienceDatabase
+from parsers.gamedata_loader import load_gamedata
+from parsers.parse_cache import ParseCache
+from parsers.sfs_parser import SFSParser
+from gui.save_selector import SaveSelector
+
+
+def prepare_data(ksp_dir):
+    """Time each step of the data preparation, as run on the startup thread."""
+    steps = []
+
+    start = time.perf_counter()
+    parser = SFSParser(ksp_dir, cache=ParseCache())
+    steps.append(("parser + parse cache", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    mod_data = load_gamedata(parser.get_ksp_directory())
+    steps.append(("GameData definitions", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    science_db = ScienceDatabase(mod_data=mod_data)
+    science_db.get_id_decoder()
+    science_db.get_search_index()
+    steps.append(("catalogue + indexes", time.perf_counter() - start))
+
+    start = time.perf_counter()
+    SaveSelector.scan_saves(parser.get_ksp_directory() or "")
+    steps.append(("save scan", time.perf_counter() - start))
+    return steps
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--ksp-dir', help="KSP installation (default: auto-detect)")
+    arg_parser.add_argument('--timeout', type=float, default=30.0)
+    args = arg_parser.parse_args()
+
+    steps = prepare_data(args.ksp_dir)
+    print("Data preparation (used to block the first paint):")
+    for name, elapsed in steps:
+        print(f"  {name:<22} {elapsed * 1000:>8.1f}ms")
+    print(f"  {'total':<22} {sum(e for _, e in steps) * 1000:>8.1f}ms")
+
+    from gui.main_window import MainWindow
+    try:
+        app = MainWindow()
+    except tk.TclError as e:
+        print(f"\nTk unavailable, window milestones skipped: {e}")
+        return 0
+    if args.ksp_dir:
+        app.save_selector.ksp_dir_var.set(args.ksp_dir)
+
+    deadline = time.perf_counter() + args.timeout
+
+    def check():
+        done = "save" in app.startup_times or (
+            "catalogue" in app.startup_times and not app.selected_save and not app.loader.is_loading()
+        )
+        if done or time.perf_counter() > deadline:
+            app.root.destroy()
+        else:
+            app.root.after(10, check)
+
+    app.root.after(10, check)
+    app.run()
+
+    print("\nMainWindow milestones (since construction):")
+    for milestone in ("warm", "paint", "catalogue", "save"):
+        elapsed = app.startup_times.get(milestone)
+        shown = f"{elapsed * 1000:>8.1f}ms" if elapsed is not None else "       -"
+        print(f"  {milestone:<22} {shown}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
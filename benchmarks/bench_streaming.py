@@ -0,0 +1,84 @@
+"""Benchmark: streamed vs materialized available experiments.
+
+For a scaled catalogue (every body cloned --scale times) and an empty save,
+times what the experiments command does: the old way (calculate the full
+list, then filter or sort it) against iter_available_science with the
+filter pushed into the catalogue index, stopping early or keeping a
+bounded top N. Peak traced memory is shown for each.
+
+Usage:
+    python benchmarks/bench_streaming.py [--scale N ...]
+"""
+
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from itertools import islice
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_catalogue_snapshot import write_scaled_data
+from models.save_data import SaveGameData
+from models.science_database import ScienceDatabase
+from utils.science_calculator import ScienceCalculator
+
+
+def _measure(func):
+    """Wall time and peak traced memory of one call, in seconds and bytes."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 50])
+    args = arg_parser.parse_args()
+
+    save_data = SaveGameData("Bench")
+    science = lambda exp: exp.available_science
+
+    for scale in args.scale:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = os.path.join(tmp, 'data')
+            write_scaled_data(data_dir, scale)
+            db = ScienceDatabase(data_dir, use_snapshot=False)
+        calculator = ScienceCalculator(db, vectorized=False)
+        full = lambda: calculator.calculate_available_science(save_data)
+        stream = calculator.iter_available_science
+
+        cases = (
+            ("--body Mun",
+             lambda: [e for e in full() if e.body_name == 'Mun'],
+             lambda: list(stream(save_data, body='Mun'))),
+            ("--limit 20",
+             lambda: full()[:20],
+             lambda: list(islice(stream(save_data), 20))),
+            ("--top 20",
+             lambda: sorted(full(), key=science, reverse=True)[:20],
+             lambda: heapq.nlargest(20, stream(save_data), key=science)),
+        )
+
+        print(f"\n{len(db.get_all_experiments()):,} experiments")
+        print(f"{'command':>12} {'list':>10} {'peak':>9} {'stream':>10} {'peak':>9}")
+        for label, materialized, streamed in cases:
+            if materialized() != streamed():
+                print(f"ERROR: {label} results disagree")
+                sys.exit(1)
+            list_time, list_peak = _measure(materialized)
+            stream_time, stream_peak = _measure(streamed)
+            print(f"{label:>12} {list_time * 1000:>8.1f}ms {list_peak / 1024:>7.0f}KB "
+                  f"{stream_time * 1000:>8.1f}ms {stream_peak / 1024:>7.0f}KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark: eager vs lazy ExperimentTree.populate, and refresh, on a real Treeview.
+
+Needs a display (Tk can't start without one).
+
+Usage:
+    python benchmarks/bench_tree_populate.py [--scale N ...]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tkinter as tk
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_catalogue_snapshot import write_scaled_data
+from gui.experiment_tree import ExperimentTree
+from models.save_data import SaveGameData
+from models.science_database import ScienceDatabase
+from utils.config import GROUP_BY_OPTIONS
+from utils.science_calculator import ScienceCalculator
+
+
+def _count_rows(tree, item=""):
+    children = tree.get_children(item)
+    return len(children) + sum(_count_rows(tree, child) for child in children)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scale', type=int, nargs='+', default=[1, 10])
+    args = arg_parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Tk unavailable: {e}")
+        return 1
+    root.withdraw()
+
+    print(f"{'rows':>9} {'group by':>10} {'eager':>9} {'rows':>7} {'lazy':>8} {'rows':>5} "
+          f"{'first open':>11} {'refresh':>9}")
+    for scale in args.scale:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = os.path.join(tmp, 'data')
+            write_scaled_data(data_dir, scale)
+            db = ScienceDatabase(data_dir, use_snapshot=False)
+            available = ScienceCalculator(db).calculate_available_science(SaveGameData())
+
+            for group_by in GROUP_BY_OPTIONS:
+                results = []
+                for lazy in (False, True):
+                    widget = ExperimentTree(root, db, lazy=lazy)
+                    start = time.perf_counter()
+                    widget.populate(available, group_by)
+                    root.update_idletasks()
+                    results.append((time.perf_counter() - start, _count_rows(widget.tree)))
+                    if lazy:
+                        first = widget.tree.get_children()[0]
+                        start = time.perf_counter()
+                        widget.expand(first)
+                        root.update_idletasks()
+                        opened = time.perf_counter() - start
+                    else:
+                        # Same view again: reconciled against the rows in place
+                        start = time.perf_counter()
+                        widget.populate(available, group_by)
+                        root.update_idletasks()
+                        refresh = time.perf_counter() - start
+                    widget.destroy()
+
+                (eager, eager_rows), (lazy_time, lazy_rows) = results
+                print(f"{len(available):>9,} {group_by:>10} {eager * 1000:>7.1f}ms {eager_rows:>7,} "
+                      f"{lazy_time * 1000:>6.1f}ms {lazy_rows:>5,} {opened * 1000:>9.1f}ms "
+                      f"{refresh * 1000:>7.1f}ms")
+
+    root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Benchmark: per-experiment vs NumPy-vectorized availability calculation.
+
+Usage:
+    python benchmarks/bench_vectorized_availability.py [--scale N ...] [--completed F]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_catalogue_snapshot import write_scaled_data
+from models.experiment import CompletedExperiment
+from models.save_data import SaveGameData
+from models.science_database import ScienceDatabase
+from utils.science_calculator import ScienceCalculator
+
+
+def _best(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def build_save(db, fraction, seed=1):
+    """Mark a random fraction of the catalogue as (partly) completed."""
+    rng = random.Random(seed)
+    save_data = SaveGameData("bench")
+    for exp in db.get_all_experiments():
+        if rng.random() < fraction:
+            cap = rng.uniform(5, 50)
+            earned = cap if rng.random() < 0.7 else rng.uniform(0, cap)
+            save_data.add_completed_experiment(
+                CompletedExperiment(exp.experiment_id, earned, cap)
+            )
+    return save_data
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--scale', type=int, nargs='+', default=[1, 10, 50])
+    arg_parser.add_argument('--completed', type=float, default=0.3)
+    args = arg_parser.parse_args()
+
+    print(f"{'rows':>9} {'python':>10} {'numpy list':>11} {'numpy sums':>11} {'columns':>9}")
+    for scale in args.scale:
+        with tempfile.TemporaryDirectory() as tmp:
+            data_dir = os.path.join(tmp, 'data')
+            write_scaled_data(data_dir, scale)
+            db = ScienceDatabase(data_dir, use_snapshot=False)
+            save_data = build_save(db, args.completed)
+
+            python_calc = ScienceCalculator(db, vectorized=False)
+            numpy_calc = ScienceCalculator(db, vectorized=True)
+            build = _best(numpy_calc.get_columns, repeat=1)
+
+            assert python_calc.calculate_available_science(save_data) == \
+                numpy_calc.calculate_available_science(save_data)
+
+            python = _best(lambda: python_calc.calculate_available_science(save_data))
+            as_list = _best(lambda: numpy_calc.calculate_available_science(save_data))
+            sums = _best(lambda: numpy_calc.calculate_available_columns(save_data).sum_by('body'))
+
+            print(f"{len(db.get_all_experiments()):>9,} {python * 1000:>8.2f}ms "
+                  f"{as_list * 1000:>9.2f}ms {sums * 1000:>9.2f}ms {build * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Generate synthetic persistent.sfs files for benchmarks.
+
+The layout mirrors a real KSP 1 career save: a handful of SCENARIO nodes
+(including ResearchAndDevelopment with Tech and Science children) followed by
+a FLIGHTSTATE block holding the vessels, which is where nearly all of the
+bytes of a late-game save live.
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.science_database import ScienceDatabase
+
+
+def _node(lines, indent, name, values, children=()):
+    """Append a ConfigNode block to lines."""
+    tabs = "\t" * indent
+    lines.append(f"{tabs}{name}\n")
+    lines.append(f"{tabs}{{\n")
+    for key, value in values:
+        lines.append(f"{tabs}\t{key} = {value}\n")
+    for child in children:
+        child(lines, indent + 1)
+    lines.append(f"{tabs}}}\n")
+
+
+def _science_entries(science_count: int, rng: random.Random):
+    """Pick science subjects from the stock catalogue."""
+    db = ScienceDatabase()
+    possible = db.get_all_experiments()
+    chosen = rng.sample(possible, min(science_count, len(possible)))
+    for possible_exp in chosen:
+        cap = round(rng.uniform(5, 60), 2)
+        sci = cap if rng.random() < 0.6 else round(cap * rng.random(), 2)
+        yield possible_exp.experiment_id.to_ksp_id(), possible_exp.experiment_name, sci, cap
+
+
+def build_save_text(vessel_count: int = 200, parts_per_vessel: int = 40,
+                    science_count: int = 400, seed: int = 1) -> str:
+    """
+    Build the text of a synthetic save file.
+
+    Args:
+        vessel_count: Number of VESSEL blocks in FLIGHTSTATE
+        parts_per_vessel: Number of PART blocks per vessel
+        science_count: Number of Science nodes in the R&D scenario
+        seed: Random seed, so runs are reproducible
+
+    Returns:
+        Save file contents in ConfigNode format
+    """
+    rng = random.Random(seed)
+    lines = []
+
+    def parameters(out, indent):
+        _node(out, indent, "PARAMETERS", [("preset", "Normal")], [
+            lambda o, i: _node(o, i, "FLIGHT", [("CanQuickSave", "True"), ("CanQuickLoad", "True")]),
+            lambda o, i: _node(o, i, "CAREER", [("StartingFunds", "25000"), ("StartingScience", "0")]),
+        ])
+
+    def progress(out, indent):
+        _node(out, indent, "SCENARIO", [("name", "ProgressTracking"), ("scene", "7, 8, 5")], [
+            lambda o, i: _node(o, i, "Progress", [], [
+                lambda o2, i2: _node(o2, i2, "FirstLaunch", [("completed", "1234.5")]),
+                lambda o2, i2: _node(o2, i2, "Kerbin", [("reached", "1234.5")]),
+            ]),
+        ])
+
+    def research(out, indent):
+        children = []
+        for tech_id in ("start", "basicRocketry", "engineering101", "survivability"):
+            children.append(lambda o, i, t=tech_id: _node(
+                o, i, "Tech", [("id", t), ("state", "Available"), ("cost", "5")],
+                [lambda o2, i2: _node(o2, i2, "Unlocks", [("part", "mk1pod.v2")])]
+            ))
+        for ksp_id, name, sci, cap in _science_entries(science_count, rng):
+            children.append(lambda o, i, k=ksp_id, n=name, s=sci, c=cap: _node(
+                o, i, "Science",
+                [("id", k), ("title", f"{n} data"), ("dsc", "1"), ("scv", "0"),
+                 ("sbv", "1"), ("sci", s), ("asc", "True"), ("cap", c)]
+            ))
+        _node(out, indent, "SCENARIO",
+              [("name", "ResearchAndDevelopment"), ("scene", "7, 8, 5, 6"), ("sci", "512.3")],
+              children)
+
+    def vessel(out, indent, index):
+        def part(o, i, p):
+            _node(o, i, "PART", [
+                ("name", f"part{p}"), ("cid", str(rng.randint(1, 10 ** 9))),
+                ("uid", str(rng.randint(1, 10 ** 9))), ("mid", str(rng.randint(1, 10 ** 9))),
+                ("position", "0,1.25,0"), ("rotation", "0,0,0,1"), ("mass", "0.84"),
+                ("temp", "289.3"), ("expt", "0.5"), ("state", "0"),
+            ], [
+                lambda o2, i2: _node(o2, i2, "EVENTS", []),
+                lambda o2, i2: _node(o2, i2, "ACTIONS", []),
+                lambda o2, i2: _node(o2, i2, "MODULE", [("name", "ModuleCommand"), ("isEnabled", "True")]),
+                lambda o2, i2: _node(o2, i2, "RESOURCE", [("name", "LiquidFuel"), ("amount", "90"), ("maxAmount", "90")]),
+            ])
+
+        _node(out, indent, "VESSEL", [
+            ("pid", f"{index:032x}"), ("name", f"Vessel {index}"), ("type", "Ship"),
+            ("sit", "ORBITING"), ("landed", "False"), ("splashed", "False"),
+        ], [
+            lambda o, i: _node(o, i, "ORBIT", [("SMA", "700000"), ("ECC", "0.01"), ("REF", "1")]),
+            *[lambda o, i, p=p: part(o, i, p) for p in range(parts_per_vessel)],
+        ])
+
+    def flightstate(out, indent):
+        _node(out, indent, "FLIGHTSTATE", [("version", "1.12.5"), ("UT", "8123456.7")],
+              [lambda o, i, v=v: vessel(o, i, v) for v in range(vessel_count)])
+
+    _node(lines, 0, "GAME", [("version", "1.12.5"), ("Title", "Synthetic Career"), ("Mode", "CAREER")],
+          [parameters, progress, research, flightstate])
+    return "".join(lines)
+
+
+def write_synthetic_save(path, **kwargs) -> Path:
+    """Write a synthetic save to path and return it as a Path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(build_save_text(**kwargs))
+    return path
@@ -0,0 +1,364 @@
+"""Headless command-line entry point for KSP Science Tracker.
+
+Only non-GUI modules are imported, so this starts quickly and runs without a
+display (cron jobs, CI reports, scripting across many saves).
+
+Examples:
+    python src/cli.py saves
+    python src/cli.py experiments "My Career" --body Mun --format csv
+    python src/cli.py experiments "My Career" --top 20
+    python src/cli.py stats --all --format csv --output stats.csv
+    python src/cli.py stats "My Career" --by body
+    python src/cli.py history "My Career" --by body --limit 50
+    python src/cli.py ingest --all
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import os
+import sqlite3
+import sys
+import textwrap
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+from models.experiment import AvailableExperiment
+from models.save_data import SaveGameData
+from models.science_rollup import ScienceRollup
+from models.science_database import ScienceDatabase
+from parsers.sfs_parser import SFSParser
+from parsers.parse_cache import ParseCache
+from parsers.gamedata_loader import load_gamedata
+from utils.save_ingest import SaveIngester
+from utils.science_calculator import ScienceCalculator
+from utils.science_history import ScienceHistory, TREND_GROUPS
+
+
+EXPERIMENT_FIELDS = [
+    'save', 'ksp_id', 'experiment_type', 'experiment_name', 'body',
+    'situation', 'biome', 'available_science', 'is_partial'
+]
+
+STATISTICS_FIELDS = [
+    'save', 'total_possible_experiments', 'total_completed_experiments',
+    'total_available_experiments', 'total_available_science',
+    'total_earned_science', 'completion_percentage'
+]
+
+GROUP_FIELDS = ['save', 'group', 'available_experiments', 'available_science']
+
+HISTORY_SAVE_FIELDS = ['save', 'path', 'snapshots', 'first', 'last']
+HISTORY_FIELDS = ['recorded_at', 'earned', 'subjects']
+HISTORY_GROUP_FIELDS = ['recorded_at', 'group', 'earned', 'subjects']
+
+INGEST_FIELDS = ['save', 'files', 'recorded', 'unchanged', 'skipped', 'failed']
+
+# stats --by choices -> ScienceRollup grouping modes
+GROUP_BY_MODES = {'body': 'Body', 'experiment': 'Experiment', 'situation': 'Situation'}
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    arg_parser = argparse.ArgumentParser(
+        prog="ksp-science-tracker",
+        description="Report available KSP science without the GUI."
+    )
+    arg_parser.add_argument(
+        '--ksp-dir',
+        help="KSP installation directory (auto-detected if omitted)"
+    )
+    arg_parser.add_argument(
+        '--no-cache', action='store_true',
+        help="Don't use or update the parse cache or the catalogue snapshot"
+    )
+    arg_parser.add_argument(
+        '--no-mods', action='store_true',
+        help="Use only the stock catalogue, ignoring definitions in GameData"
+    )
+    arg_parser.add_argument(
+        '--history-db',
+        help="Science history database (defaults to one in the user cache)"
+    )
+    arg_parser.add_argument(
+        '--no-history', action='store_true',
+        help="Don't record loaded saves in the science history"
+    )
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('saves', help="List save games")
+
+    for name, help_text in (('experiments', "List available experiments"),
+                            ('stats', "Show science statistics"),
+                            ('ingest', "Record backups and quicksaves in the science history")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument(
+            'save', nargs='*',
+            help="Save name or path to a .sfs file (repeatable)"
+        )
+        command.add_argument('--all', action='store_true', help="Use every save game")
+        command.add_argument('--format', choices=('json', 'csv'), default='json')
+        command.add_argument('--output', '-o', help="Write to this file instead of stdout")
+        if name == 'experiments':
+            command.add_argument('--body', help="Only this celestial body (e.g. Mun)")
+            command.add_argument('--type', dest='experiment_type',
+                                 help="Only this experiment type id (e.g. crewReport)")
+            command.add_argument('--situation', help="Only this situation (e.g. SrfLanded)")
+            count = command.add_mutually_exclusive_group()
+            count.add_argument('--limit', type=int,
+                               help="Only the first N experiments per save, in catalogue order")
+            count.add_argument('--top', type=int,
+                               help="Only the N experiments per save with the most science left")
+        elif name == 'ingest':
+            command.add_argument('--serial', action='store_true',
+                                 help="Parse in this process instead of in parallel")
+        else:
+            command.add_argument('--by', choices=sorted(GROUP_BY_MODES),
+                                 help="Break available science down by body, experiment or situation")
+
+    command = commands.add_parser(
+        'history', help="Show science earned over recorded loads (lists saves if none given)"
+    )
+    command.add_argument('save', nargs='?', help="Save name or path to its .sfs file")
+    command.add_argument('--by', choices=sorted(TREND_GROUPS),
+                         help="Break science earned down by body or experiment")
+    command.add_argument('--limit', type=int, default=50,
+                         help="Most recent snapshots to show (default 50, 0 for all)")
+    command.add_argument('--format', choices=('json', 'csv'), default='json')
+    command.add_argument('--output', '-o', help="Write to this file instead of stdout")
+
+    return arg_parser
+
+
+def resolve_saves(parser: SFSParser, names: List[str],
+                  use_all: bool) -> List[Tuple[str, str]]:
+    """
+    Turn command-line save arguments into (save_name, save_path) tuples.
+
+    Raises:
+        ValueError: If a save name cannot be found
+    """
+    save_games = parser.find_save_games()
+    if use_all:
+        return save_games
+
+    by_name = dict(save_games)
+    resolved = []
+    for name in names:
+        if os.path.isfile(name):
+            resolved.append((os.path.basename(os.path.dirname(os.path.abspath(name))), name))
+        elif name in by_name:
+            resolved.append((name, by_name[name]))
+        else:
+            raise ValueError(f"Save not found: {name}")
+    return resolved
+
+
+def select_experiments(calculator: ScienceCalculator, save_data: SaveGameData,
+                       body: Optional[str] = None,
+                       experiment_type: Optional[str] = None,
+                       situation: Optional[str] = None,
+                       limit: Optional[int] = None,
+                       top: Optional[int] = None) -> Iterable[AvailableExperiment]:
+    """
+    Stream a save's available experiments matching body, type and situation.
+
+    With limit, stops after the first limit experiments; with top, keeps
+    only the top experiments with the most science left (ties in catalogue
+    order). Either way the full list is never built.
+    """
+    experiments = calculator.iter_available_science(
+        save_data, body=body, experiment_type=experiment_type, situation=situation
+    )
+    if top:
+        return heapq.nlargest(top, experiments, key=lambda exp: exp.available_science)
+    if limit:
+        return islice(experiments, limit)
+    return experiments
+
+
+def experiment_row(save_name: str, exp: AvailableExperiment) -> Dict[str, object]:
+    """Flatten an available experiment for output."""
+    exp_id = exp.experiment_id
+    return {
+        'save': save_name,
+        'ksp_id': exp_id.to_ksp_id(),
+        'experiment_type': exp_id.experiment_type,
+        'experiment_name': exp.experiment_name,
+        'body': exp.body_name,
+        'situation': exp_id.situation,
+        'biome': exp_id.biome or "",
+        'available_science': round(exp.available_science, 2),
+        'is_partial': exp.is_partial,
+    }
+
+
+def group_rows(save_name: str, rollup: ScienceRollup, mode: str) -> List[Dict[str, object]]:
+    """Flatten the outermost groups of a rollup for output."""
+    rows = []
+    for key in rollup.children(mode):
+        aggregate = rollup.get(mode, (key,))
+        rows.append({
+            'save': save_name,
+            'group': key,
+            'available_experiments': aggregate.count,
+            'available_science': round(aggregate.total, 2),
+        })
+    return rows
+
+
+def format_time(timestamp: Optional[float]) -> str:
+    """Format a history timestamp as local ISO time ('' if none)."""
+    if timestamp is None:
+        return ""
+    return datetime.fromtimestamp(timestamp).isoformat(sep=' ', timespec='seconds')
+
+
+def run_history(args: argparse.Namespace, history: ScienceHistory, out: TextIO) -> int:
+    """Run the history command."""
+    if not args.save:
+        rows = history.saves()
+        for row in rows:
+            row['first'] = format_time(row['first'])
+            row['last'] = format_time(row['last'])
+        write_rows(rows, HISTORY_SAVE_FIELDS, args.format, out)
+        return 0
+
+    rows = history.trend(args.save, by=args.by, limit=args.limit or None)
+    if not rows:
+        raise ValueError(f"No history recorded for save: {args.save}")
+    for row in rows:
+        row['recorded_at'] = format_time(row['recorded_at'])
+        row['earned'] = round(row['earned'], 2)
+    write_rows(rows, HISTORY_GROUP_FIELDS if args.by else HISTORY_FIELDS, args.format, out)
+    return 0
+
+
+def write_rows(rows: Iterable[Dict[str, object]], fields: List[str], fmt: str, out: TextIO):
+    """Write rows as JSON or CSV as they come, without collecting them."""
+    if fmt == 'csv':
+        writer = csv.DictWriter(out, fieldnames=fields, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+        return
+
+    # Same text as json.dump(list(rows), out, indent=2). If producing a
+    # row fails (e.g. a save can't be read), the array is still closed
+    separator = "[\n"
+    try:
+        for row in rows:
+            out.write(separator)
+            out.write(textwrap.indent(json.dumps(row, indent=2), "  "))
+            separator = ",\n"
+    finally:
+        out.write("[]\n" if separator == "[\n" else "\n]\n")
+
+
+def run(args: argparse.Namespace, out: TextIO) -> int:
+    """Run a parsed command. Returns the process exit code."""
+    history = None if args.no_history else ScienceHistory(args.history_db)
+    if args.command in ('history', 'ingest') and history is None:
+        print(f"--no-history can't be used with the {args.command} command", file=sys.stderr)
+        return 2
+    if args.command == 'history':
+        return run_history(args, history, out)
+
+    parser = SFSParser(
+        ksp_directory=args.ksp_dir,
+        cache=None if args.no_cache else ParseCache()
+    )
+    try:
+        return run_save_command(args, parser, history, out)
+    finally:
+        # Cache hits are only written to the index lazily
+        if parser.cache is not None:
+            parser.cache.flush()
+
+
+def run_save_command(args: argparse.Namespace, parser: SFSParser,
+                     history: Optional[ScienceHistory], out: TextIO) -> int:
+    """Run a command that reads saves. Returns the process exit code."""
+    if args.command == 'saves':
+        rows = [{'save': name, 'path': path} for name, path in parser.find_save_games()]
+        write_rows(rows, ['save', 'path'], 'json', out)
+        return 0
+
+    saves = resolve_saves(parser, args.save, args.all)
+    if not saves:
+        print("No save games given (name one, or use --all)", file=sys.stderr)
+        return 2
+
+    science_db = ScienceDatabase(
+        mod_data=None if args.no_mods else load_gamedata(parser.get_ksp_directory()),
+        use_snapshot=not args.no_cache
+    )
+    parser.id_decoder = science_db.get_id_decoder()
+
+    if args.command == 'ingest':
+        names = {save_name for save_name, _ in saves}
+        save_files = [entry for entry in parser.find_save_files() if entry[0] in names]
+        rows = SaveIngester(science_db, history).ingest(save_files, parallel=not args.serial)
+        if args.format == 'csv':
+            for row in rows:
+                row['failed'] = "; ".join(row['failed'])
+        write_rows(rows, INGEST_FIELDS, args.format, out)
+        return 0
+
+    calculator = ScienceCalculator(science_db)
+
+    def load(save_name: str, save_path: str) -> SaveGameData:
+        save_data = parser.load_science_data(save_path, save_name)
+        if history is not None:
+            try:
+                history.record(save_name, save_path, save_data)
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Warning: Science history not recorded: {e}", file=sys.stderr)
+        return save_data
+
+    if args.command == 'experiments':
+        # Streamed: each save is loaded as the rows before it are written
+        rows = (
+            experiment_row(save_name, exp)
+            for save_name, save_path in saves
+            for exp in select_experiments(
+                calculator, load(save_name, save_path),
+                args.body, args.experiment_type, args.situation, args.limit, args.top
+            )
+        )
+        write_rows(rows, EXPERIMENT_FIELDS, args.format, out)
+        return 0
+
+    rows = []
+    for save_name, save_path in saves:
+        save_data = load(save_name, save_path)
+        available = calculator.calculate_available_science(save_data)
+        mode = GROUP_BY_MODES.get(args.by)
+        rollup = ScienceRollup(available, modes=(mode,) if mode else ())
+        if mode:
+            rows.extend(group_rows(save_name, rollup, mode))
+        else:
+            stats = calculator.calculate_statistics(available, save_data, rollup)
+            rows.append({'save': save_name, **stats})
+
+    write_rows(rows, GROUP_FIELDS if args.by else STATISTICS_FIELDS, args.format, out)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse arguments and run the command."""
+    args = build_arg_parser().parse_args(argv)
+    out = open(args.output, 'w', newline='', encoding='utf-8') if getattr(args, 'output', None) else sys.stdout
+    try:
+        return run(args, out)
+    except (FileNotFoundError, ValueError, sqlite3.Error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Window summarizing every save in the KSP installation."""
+
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Tuple
+
+from models.science_database import ScienceDatabase
+from utils.batch_analyzer import BatchAnalyzer
+
+
+class BatchWindow(tk.Toplevel):
+    """Toplevel showing a per-save summary table."""
+
+    COLUMNS = (
+        ("earned", "Science Earned", 120),
+        ("available", "Available Science", 130),
+        ("completed", "Completed", 110),
+        ("percent", "Completion", 90),
+    )
+
+    def __init__(self, parent, science_db: ScienceDatabase,
+                 save_games: List[Tuple[str, str]]):
+        """
+        Initialize batch window and start analyzing.
+
+        Args:
+            parent: Parent widget
+            science_db: Science database
+            save_games: List of (save_name, save_path) tuples to analyze
+        """
+        super().__init__(parent)
+        self.title("All Saves")
+        self.geometry("700x400")
+
+        self.analyzer = BatchAnalyzer(science_db)
+        self.save_games = save_games
+        self._results: queue.Queue = queue.Queue()
+
+        self._build_ui()
+        self._start()
+
+    def _build_ui(self):
+        """Build the summary table."""
+        frame = ttk.Frame(self, padding=5)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        vsb = ttk.Scrollbar(frame, orient="vertical")
+        self.table = ttk.Treeview(
+            frame,
+            columns=[key for key, _, _ in self.COLUMNS],
+            yscrollcommand=vsb.set
+        )
+        vsb.config(command=self.table.yview)
+
+        self.table.heading("#0", text="Save", anchor=tk.W)
+        self.table.column("#0", width=200, anchor=tk.W)
+        for key, title, width in self.COLUMNS:
+            self.table.heading(key, text=title, anchor=tk.E)
+            self.table.column(key, width=width, anchor=tk.E)
+
+        self.table.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+
+        self.status_label = ttk.Label(self, text="", foreground="gray")
+        self.status_label.pack(fill=tk.X, padx=5, pady=2)
+
+    def _start(self):
+        """Run the analysis on a worker thread."""
+        self.status_label.config(
+            text=f"Analyzing {len(self.save_games)} save(s) on "
+                 f"{self.analyzer.max_workers} process(es)..."
+        )
+
+        def run():
+            try:
+                self._results.put(self.analyzer.analyze(self.save_games))
+            except Exception as e:
+                self._results.put(e)
+
+        threading.Thread(target=run, name="BatchAnalyzer", daemon=True).start()
+        self.after(100, self._poll)
+
+    def _poll(self):
+        """Show results once the worker is done."""
+        if not self.winfo_exists():
+            return
+
+        try:
+            result = self._results.get_nowait()
+        except queue.Empty:
+            self.after(100, self._poll)
+            return
+
+        if isinstance(result, Exception):
+            self.status_label.config(text=f"Analysis failed: {result}", foreground="red")
+            return
+
+        for summary in result:
+            self._insert_summary(summary)
+
+        failed = sum(1 for summary in result if summary['error'])
+        status = f"Analyzed {len(result)} save(s)"
+        if failed:
+            status += f", {failed} failed"
+        self.status_label.config(text=status)
+
+    def _insert_summary(self, summary: Dict[str, object]):
+        """Add one save's row to the table."""
+        if summary['error']:
+            values = ("", "", "", f"Error: {summary['error']}")
+        else:
+            values = (
+                f"{summary['total_earned_science']:.1f}",
+                f"{summary['total_available_science']:.1f}",
+                f"{summary['total_completed_experiments']}/{summary['total_possible_experiments']}",
+                f"{summary['completion_percentage']:.1f}%",
+            )
+        self.table.insert("", "end", text=summary['save_name'], values=values)
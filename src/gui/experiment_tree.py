@@ -1,33 +1,71 @@
 """Tree view widget for displaying experiments."""
 
+import time
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
-from typing import List, Dict, Optional
-from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from models.experiment import AvailableExperiment
+from models.experiment import AvailableExperiment, ExperimentID, SITUATION_LABELS
 from models.science_database import ScienceDatabase
-from utils.config import TREE_COLUMN_WIDTH_NAME, TREE_COLUMN_WIDTH_SCIENCE
+from models.science_rollup import ScienceRollup, Aggregate, NO_BIOME
+from utils.config import (
+    TREE_COLUMN_WIDTH_NAME, TREE_COLUMN_WIDTH_SCIENCE,
+    TREE_LAZY_POPULATE, TREE_FRAME_BUDGET_MS
+)
 
 
 class ExperimentTree(ttk.Frame):
     """Tree view for displaying science experiments hierarchically."""
 
-    def __init__(self, parent, science_db: ScienceDatabase):
+    EMPTY_IID = "empty"
+
+    def __init__(self, parent, science_db: Optional[ScienceDatabase],
+                 lazy: bool = TREE_LAZY_POPULATE):
         """
         Initialize experiment tree.
 
         Args:
             parent: Parent widget
-            science_db: Science database for experiment names
+            science_db: Science database for experiment names (may be set
+                       later, once loaded)
+            lazy: Insert a group's rows only when it is first expanded
         """
         super().__init__(parent)
         self.science_db = science_db
+        self.lazy = lazy
+
+        # Aggregates of what is shown, and what is inserted so populate
+        # and update_experiments can edit in place
+        self.rollup: Optional[ScienceRollup] = None
+        self.group_by: Optional[str] = None
+        self._experiments: Dict[ExperimentID, List[AvailableExperiment]] = {}
+        # Item id -> (text, science) of every row inserted
+        self._rendered: Dict[str, Tuple[str, str]] = {}
+        # Item id -> group path of every group node inserted
+        self._groups: Dict[str, tuple] = {}
+        # Group node -> (placeholder child, group path), for groups not
+        # expanded yet
+        self._placeholders: Dict[str, Tuple[str, tuple]] = {}
+
+        # Running "Expand All": step generator and pending after() id
+        self._job: Optional[Iterator[None]] = None
+        self._job_after: Optional[str] = None
 
         self._build_ui()
 
     def _build_ui(self):
         """Build the tree view UI."""
+        # Toolbar
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Button(toolbar, text="Expand All", command=self.expand_all).pack(side=tk.LEFT)
+        ttk.Button(toolbar, text="Collapse All", command=self.collapse_all).pack(side=tk.LEFT, padx=5)
+
+        # Shown only while Expand All is running
+        self.progress = ttk.Progressbar(toolbar, mode='determinate', length=200)
+
         # Create tree with scrollbars
         tree_frame = ttk.Frame(self)
         tree_frame.pack(fill=tk.BOTH, expand=True)
@@ -62,281 +100,294 @@ class ExperimentTree(ttk.Frame):
         self.tree.column("#0", width=TREE_COLUMN_WIDTH_NAME, anchor=tk.W)
         self.tree.column("science", width=TREE_COLUMN_WIDTH_SCIENCE, anchor=tk.E)
 
-    def populate(self, experiments: List[AvailableExperiment], group_by: str):
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+
+    def populate(self, experiments: List[AvailableExperiment], group_by: str,
+                 rollup: Optional[ScienceRollup] = None):
         """
-        Populate tree with experiments.
+        Show experiments, reusing the rows already in the tree.
+
+        Rows have stable ids derived from their group path or experiment
+        id, so the new view is diffed against the current tree: rows that
+        stay are updated in place (only if their text changed) and keep
+        their open/selected state, and only missing rows are inserted and
+        stale ones deleted. Group totals come from a ScienceRollup built in
+        one pass over the experiments.
+
+        In lazy mode a newly inserted group gets a placeholder child (so it
+        shows an expand arrow) that is replaced by its real children when it
+        is first opened.
 
         Args:
             experiments: List of available experiments
             group_by: Grouping mode ('Body', 'Experiment', or 'Situation')
+            rollup: Prebuilt rollup of the experiments covering group_by.
+                   The tree keeps it and update_experiments edits it.
         """
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.cancel_expand_all()
+        if group_by != self.group_by:
+            # Nothing can be reused across grouping modes
+            self.clear()
+        self.group_by = group_by
+        self.rollup = rollup if rollup is not None else ScienceRollup(experiments, modes=(group_by,))
+        self._experiments = {}
+        for exp in experiments:
+            self._experiments.setdefault(exp.experiment_id, []).append(exp)
 
-        if not experiments:
-            self.tree.insert("", "end", text="No experiments found", values=("",))
-            return
+        self._reconcile_level("", ())
+        self._show_empty_message()
 
-        # Group experiments
-        if group_by == "Body":
-            self._populate_by_body(experiments)
-        elif group_by == "Experiment":
-            self._populate_by_experiment(experiments)
-        elif group_by == "Situation":
-            self._populate_by_situation(experiments)
+    def _group_iid(self, path: tuple) -> str:
+        """Stable item id of a group node."""
+        return f"{self.group_by}/" + "/".join(path)
 
-    def _populate_by_body(self, experiments: List[AvailableExperiment]):
-        """Populate tree grouped by celestial body."""
-        # Group: Body → Situation → Biome → Experiment
-        body_groups = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    def _children_of(self, prefix: tuple) -> List[Tuple[str, Optional[tuple], Optional[AvailableExperiment]]]:
+        """
+        Rows a group should contain, in display order.
 
-        for exp in experiments:
-            exp_id = exp.experiment_id
-            body = exp.body_name
-            situation = exp_id.situation
-            biome = exp_id.biome or "No Biome"
-
-            body_groups[body][situation][biome].append(exp)
-
-        # Build tree
-        for body in sorted(body_groups.keys()):
-            # Calculate totals for body level
-            all_body_exps = [
-                exp
-                for situation in body_groups[body].values()
-                for biome in situation.values()
-                for exp in biome
-            ]
-            body_total = sum(exp.available_science for exp in all_body_exps)
-            body_completed = sum(1 for exp in all_body_exps if exp.available_science <= 0.1)
-            body_status = self._get_category_status(body_total, len(all_body_exps), body_completed)
-
-            body_node = self.tree.insert(
-                "", "end",
-                text=f"{body_status} {body}",
-                values=(f"{body_total:.1f}",),
-                open=False
-            )
-
-            for situation in sorted(body_groups[body].keys()):
-                # Calculate totals for situation level
-                all_situation_exps = [
-                    exp
-                    for biome in body_groups[body][situation].values()
-                    for exp in biome
-                ]
-                situation_total = sum(exp.available_science for exp in all_situation_exps)
-                situation_completed = sum(1 for exp in all_situation_exps if exp.available_science <= 0.1)
-                situation_status = self._get_category_status(
-                    situation_total, len(all_situation_exps), situation_completed
-                )
-
-                situation_node = self.tree.insert(
-                    body_node, "end",
-                    text=f"{situation_status} {self._format_situation(situation)}",
-                    values=(f"{situation_total:.1f}",),
-                    open=False
-                )
-
-                for biome in sorted(body_groups[body][situation].keys()):
-                    biome_exps = body_groups[body][situation][biome]
-                    biome_total = sum(exp.available_science for exp in biome_exps)
-                    biome_completed = sum(1 for exp in biome_exps if exp.available_science <= 0.1)
-
-                    # Only show biome level if biome exists
-                    if biome != "No Biome":
-                        biome_status = self._get_category_status(
-                            biome_total, len(biome_exps), biome_completed
-                        )
-                        biome_node = self.tree.insert(
-                            situation_node, "end",
-                            text=f"{biome_status} {biome}",
-                            values=(f"{biome_total:.1f}",),
-                            open=False
-                        )
-                        parent = biome_node
-                    else:
-                        parent = situation_node
-
-                    # Add individual experiments
-                    for exp in sorted(biome_exps, key=lambda e: e.experiment_name):
-                        status = self._get_experiment_status(exp)
-                        self.tree.insert(
-                            parent, "end",
-                            text=f"{status} {exp.experiment_name}",
-                            values=(f"{exp.available_science:.1f}",)
-                        )
-
-    def _populate_by_experiment(self, experiments: List[AvailableExperiment]):
-        """Populate tree grouped by experiment type."""
-        # Group: Experiment → Body → Situation → Biome
-        exp_groups = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+        Returns:
+            (iid, group path, None) for subgroups and (iid, None, experiment)
+            for experiment rows
+        """
+        levels = ScienceRollup.MODES[self.group_by]
+        if len(prefix) == len(levels):
+            return self._leaf_rows(self.rollup.members(self.group_by, prefix))
+
+        rows = []
+        for key in self.rollup.children(self.group_by, prefix):
+            path = prefix + (key,)
+            # Experiments without a biome hang directly off their situation/body
+            if levels[len(prefix)] == 'biome' and key == NO_BIOME:
+                rows.extend(self._leaf_rows(self.rollup.members(self.group_by, path)))
+            else:
+                rows.append((self._group_iid(path), path, None))
+        return rows
+
+    def _leaf_rows(self, experiments: List[AvailableExperiment]) -> list:
+        """Experiment rows, sorted for the grouping mode."""
+        if self.group_by == "Experiment":
+            # Add individual experiments (with biomes if applicable)
+            experiments = sorted(experiments, key=lambda e: e.experiment_id.biome or "")
+        else:
+            experiments = sorted(experiments, key=lambda e: e.experiment_name)
 
+        rows = []
+        seen: Dict[ExperimentID, int] = {}
         for exp in experiments:
-            exp_id = exp.experiment_id
-            exp_name = exp.experiment_name
-            body = exp.body_name
-            situation = exp_id.situation
-
-            exp_groups[exp_name][body][situation].append(exp)
-
-        # Build tree
-        for exp_name in sorted(exp_groups.keys()):
-            # Calculate totals for experiment level
-            all_exp_exps = [
-                exp
-                for body in exp_groups[exp_name].values()
-                for situation in body.values()
-                for exp in situation
-            ]
-            exp_total = sum(exp.available_science for exp in all_exp_exps)
-            exp_completed = sum(1 for exp in all_exp_exps if exp.available_science <= 0.1)
-            exp_status = self._get_category_status(exp_total, len(all_exp_exps), exp_completed)
-
-            exp_node = self.tree.insert(
-                "", "end",
-                text=f"{exp_status} {exp_name}",
-                values=(f"{exp_total:.1f}",),
-                open=False
-            )
-
-            for body in sorted(exp_groups[exp_name].keys()):
-                # Calculate totals for body level
-                all_body_exps = [
-                    exp
-                    for situation in exp_groups[exp_name][body].values()
-                    for exp in situation
-                ]
-                body_total = sum(exp.available_science for exp in all_body_exps)
-                body_completed = sum(1 for exp in all_body_exps if exp.available_science <= 0.1)
-                body_status = self._get_category_status(body_total, len(all_body_exps), body_completed)
-
-                body_node = self.tree.insert(
-                    exp_node, "end",
-                    text=f"{body_status} {body}",
-                    values=(f"{body_total:.1f}",),
-                    open=False
-                )
-
-                for situation in sorted(exp_groups[exp_name][body].keys()):
-                    situation_exps = exp_groups[exp_name][body][situation]
-                    situation_total = sum(exp.available_science for exp in situation_exps)
-                    situation_completed = sum(1 for exp in situation_exps if exp.available_science <= 0.1)
-                    situation_status = self._get_category_status(
-                        situation_total, len(situation_exps), situation_completed
-                    )
-
-                    situation_node = self.tree.insert(
-                        body_node, "end",
-                        text=f"{situation_status} {self._format_situation(situation)}",
-                        values=(f"{situation_total:.1f}",),
-                        open=False
-                    )
-
-                    # Add individual experiments (with biomes if applicable)
-                    for exp in sorted(situation_exps, key=lambda e: e.experiment_id.biome or ""):
-                        biome_str = f" - {exp.experiment_id.biome}" if exp.experiment_id.biome else ""
-                        status = self._get_experiment_status(exp)
-                        self.tree.insert(
-                            situation_node, "end",
-                            text=f"{status} {exp.body_name}{biome_str}",
-                            values=(f"{exp.available_science:.1f}",)
-                        )
-
-    def _populate_by_situation(self, experiments: List[AvailableExperiment]):
-        """Populate tree grouped by situation."""
-        # Group: Situation → Body → Biome → Experiment
-        situation_groups = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+            # Catalogue data may repeat an id; number the repeats
+            n = seen[exp.experiment_id] = seen.get(exp.experiment_id, -1) + 1
+            iid = f"{self.group_by}/@{exp.experiment_id.to_ksp_id()}"
+            rows.append((f"{iid}#{n}" if n else iid, None, exp))
+        return rows
 
-        for exp in experiments:
-            exp_id = exp.experiment_id
-            situation = exp_id.situation
-            body = exp.body_name
-            biome = exp_id.biome or "No Biome"
-
-            situation_groups[situation][body][biome].append(exp)
-
-        # Build tree
-        for situation in sorted(situation_groups.keys()):
-            # Calculate totals for situation level
-            all_situation_exps = [
-                exp
-                for body in situation_groups[situation].values()
-                for biome in body.values()
-                for exp in biome
-            ]
-            situation_total = sum(exp.available_science for exp in all_situation_exps)
-            situation_completed = sum(1 for exp in all_situation_exps if exp.available_science <= 0.1)
-            situation_status = self._get_category_status(
-                situation_total, len(all_situation_exps), situation_completed
-            )
-
-            situation_node = self.tree.insert(
-                "", "end",
-                text=f"{situation_status} {self._format_situation(situation)}",
-                values=(f"{situation_total:.1f}",),
-                open=False
-            )
-
-            for body in sorted(situation_groups[situation].keys()):
-                # Calculate totals for body level
-                all_body_exps = [
-                    exp
-                    for biome in situation_groups[situation][body].values()
-                    for exp in biome
-                ]
-                body_total = sum(exp.available_science for exp in all_body_exps)
-                body_completed = sum(1 for exp in all_body_exps if exp.available_science <= 0.1)
-                body_status = self._get_category_status(body_total, len(all_body_exps), body_completed)
-
-                body_node = self.tree.insert(
-                    situation_node, "end",
-                    text=f"{body_status} {body}",
-                    values=(f"{body_total:.1f}",),
-                    open=False
-                )
-
-                for biome in sorted(situation_groups[situation][body].keys()):
-                    biome_exps = situation_groups[situation][body][biome]
-                    biome_total = sum(exp.available_science for exp in biome_exps)
-                    biome_completed = sum(1 for exp in biome_exps if exp.available_science <= 0.1)
-
-                    if biome != "No Biome":
-                        biome_status = self._get_category_status(
-                            biome_total, len(biome_exps), biome_completed
-                        )
-                        biome_node = self.tree.insert(
-                            body_node, "end",
-                            text=f"{biome_status} {biome}",
-                            values=(f"{biome_total:.1f}",),
-                            open=False
-                        )
-                        parent = biome_node
+    def _reconcile_level(self, parent: str, prefix: tuple, recursive: bool = True):
+        """
+        Make a node's children match the rollup.
+
+        Args:
+            parent: Item id of the node ("" for the top level)
+            prefix: Group path of the node
+            recursive: Also reconcile the contents of expanded subgroups
+        """
+        rows = self._children_of(prefix)
+        wanted = {iid for iid, _, _ in rows}
+
+        current = self.tree.get_children(parent)
+        stale = [iid for iid in current if iid not in wanted]
+        if stale:
+            for iid in stale:
+                self._forget(iid)
+            self.tree.delete(*stale)
+        # Rows that stay, in tree order; remaining[0] is what sits at index
+        remaining = [iid for iid in current if iid in wanted]
+
+        for index, (iid, path, exp) in enumerate(rows):
+            text, science = self._render_group(path) if exp is None else self._render_leaf(exp)
+
+            if iid not in self._rendered:
+                self.tree.insert(parent, index, iid=iid, text=text, values=(science,), open=False)
+                self._rendered[iid] = (text, science)
+                if path is not None:
+                    self._groups[iid] = path
+                    if self.lazy:
+                        placeholder = self.tree.insert(iid, "end", text="", values=("",))
+                        self._placeholders[iid] = (placeholder, path)
                     else:
-                        parent = body_node
+                        self._reconcile_level(iid, path)
+                continue
+
+            if remaining and remaining[0] == iid:
+                remaining.pop(0)
+            else:
+                self.tree.move(iid, parent, index)
+                remaining.remove(iid)
+            if self._rendered[iid] != (text, science):
+                self.tree.item(iid, text=text, values=(science,))
+                self._rendered[iid] = (text, science)
+            if path is not None and recursive and iid not in self._placeholders:
+                self._reconcile_level(iid, path)
+
+    def _forget(self, iid: str):
+        """Drop bookkeeping of a row about to be deleted, and of its descendants."""
+        self._rendered.pop(iid, None)
+        if self._groups.pop(iid, None) is not None:
+            self._placeholders.pop(iid, None)
+            for child in self.tree.get_children(iid):
+                self._forget(child)
+
+    def _show_empty_message(self):
+        """Show a message row while the tree has nothing else."""
+        has_rows = any(iid != self.EMPTY_IID for iid in self.tree.get_children())
+        if has_rows and self.tree.exists(self.EMPTY_IID):
+            self.tree.delete(self.EMPTY_IID)
+        elif not has_rows and not self.tree.exists(self.EMPTY_IID):
+            self.tree.insert("", "end", iid=self.EMPTY_IID, text="No experiments found", values=("",))
+
+    def _on_open(self, event=None):
+        """Materialize the children of a group opened for the first time."""
+        self.expand(self.tree.focus())
+
+    def expand(self, node: str):
+        """Insert the children of a lazily populated group node, if not done yet."""
+        if node not in self._placeholders:
+            return
+        placeholder, path = self._placeholders.pop(node)
+        self.tree.delete(placeholder)
+        self._reconcile_level(node, path)
+
+    def expand_all(self):
+        """
+        Open every group, inserting rows in time-sliced batches.
+
+        Groups are opened outermost first, one group's rows per step. Steps
+        run until TREE_FRAME_BUDGET_MS is used up, then the rest is
+        scheduled with after() so the window stays responsive; the progress
+        bar shows rows inserted so far. populate and clear cancel a run that
+        hasn't finished.
+        """
+        self.cancel_expand_all()
+        if self.rollup is None:
+            return
 
-                    # Add individual experiments
-                    for exp in sorted(biome_exps, key=lambda e: e.experiment_name):
-                        status = self._get_experiment_status(exp)
-                        self.tree.insert(
-                            parent, "end",
-                            text=f"{status} {exp.experiment_name}",
-                            values=(f"{exp.available_science:.1f}",)
-                        )
+        levels = ScienceRollup.MODES[self.group_by]
+        groups = sum(
+            1 for level in range(len(levels))
+            for path in self.rollup.totals(self.group_by, level) if path[-1] != NO_BIOME
+        )
+        self.progress.config(maximum=max(1, self.rollup.root.count + groups))
+        self.progress.pack(side=tk.RIGHT)
+
+        self._job = self._expand_all_steps()
+        self._run_job()
+
+    def _expand_all_steps(self) -> Iterator[None]:
+        """Open groups breadth first, yielding after each one."""
+        pending = deque(self.tree.get_children())
+        while pending:
+            node = pending.popleft()
+            # Skip rows deleted by a live reload since they were queued
+            if node not in self._groups:
+                continue
+            self.expand(node)
+            self.tree.item(node, open=True)
+            pending.extend(child for child in self.tree.get_children(node) if child in self._groups)
+            yield
+
+    def _run_job(self):
+        """Run Expand All steps for one time slice, then reschedule."""
+        self._job_after = None
+        deadline = time.perf_counter() + TREE_FRAME_BUDGET_MS / 1000
+        for _ in self._job:
+            if time.perf_counter() >= deadline:
+                self.progress.config(value=len(self._rendered))
+                self._job_after = self.after(1, self._run_job)
+                return
+        self.cancel_expand_all()
+
+    def cancel_expand_all(self):
+        """Stop a running Expand All, keeping the rows inserted so far."""
+        if self._job_after is not None:
+            self.after_cancel(self._job_after)
+            self._job_after = None
+        self._job = None
+        self.progress.pack_forget()
+
+    def collapse_all(self):
+        """Close every group."""
+        self.cancel_expand_all()
+        for node in self._groups:
+            self.tree.item(node, open=False)
+
+    def _render_leaf(self, exp: AvailableExperiment) -> Tuple[str, str]:
+        """Text and science column of an experiment row."""
+        if self.group_by == "Experiment":
+            biome_str = f" - {exp.experiment_id.biome}" if exp.experiment_id.biome else ""
+            label = f"{exp.body_name}{biome_str}"
+        else:
+            label = exp.experiment_name
+        return f"{self._get_experiment_status(exp)} {label}", f"{exp.available_science:.1f}"
+
+    def _render_group(self, path: tuple) -> Tuple[str, str]:
+        """Text and science column of a group node."""
+        level = ScienceRollup.MODES[self.group_by][len(path) - 1]
+        key = path[-1]
+        label = self._format_situation(key) if level == 'situation' else key
+        aggregate: Aggregate = self.rollup.get(self.group_by, path)
+        status = self._get_category_status(aggregate.total, aggregate.count, aggregate.completed)
+        return f"{status} {label}", f"{aggregate.total:.1f}"
+
+    def update_experiments(self, updated: List[Tuple[AvailableExperiment, AvailableExperiment]],
+                           removed: List[AvailableExperiment]) -> bool:
+        """
+        Apply availability changes to the rows populate inserted.
+
+        Only the groups on the affected experiments' paths are reconciled.
+        Callers pass only changes that match the tree's current filters.
+
+        Args:
+            updated: (old, new) pairs for experiments still available
+            removed: Experiments no longer available
+
+        Returns:
+            False if a change doesn't map onto the shown experiments (the
+            caller should populate again); nothing is modified in that case
+        """
+        if self.rollup is None:
+            return False
+        new_by_id = {new.experiment_id: new for _, new in updated}
+        removed_ids = {exp.experiment_id for exp in removed}
+        if any(exp_id not in self._experiments for exp_id in new_by_id.keys() | removed_ids):
+            return False
+
+        # Groups not expanded yet only need the rollup updated
+        dirty = set()
+        for exp_id in removed_ids:
+            for old in self._experiments.pop(exp_id):
+                self.rollup.remove(old)
+                dirty.add(ScienceRollup.key_path(self.group_by, old))
+
+        for exp_id, new in new_by_id.items():
+            olds = self._experiments[exp_id]
+            for old in olds:
+                self.rollup.remove(old)
+                self.rollup.add(new)
+            self._experiments[exp_id] = [new] * len(olds)
+            dirty.add(ScienceRollup.key_path(self.group_by, new))
+
+        # Outermost first, so groups deleted with their parent are skipped
+        prefixes = {path[:depth] for path in dirty for depth in range(len(path) + 1)}
+        for prefix in sorted(prefixes, key=len):
+            node = self._group_iid(prefix) if prefix else ""
+            if prefix and (node not in self._groups or node in self._placeholders):
+                continue
+            self._reconcile_level(node, prefix, recursive=False)
+
+        self._show_empty_message()
+        return True
 
     def _format_situation(self, situation: str) -> str:
         """Format situation name for display."""
-        # Convert camelCase to readable format
-        situation_names = {
-            'SrfLanded': 'Surface (Landed)',
-            'SrfSplashed': 'Surface (Splashed)',
-            'FlyingLow': 'Flying (Low)',
-            'FlyingHigh': 'Flying (High)',
-            'InSpaceLow': 'Space (Low)',
-            'InSpaceHigh': 'Space (High)',
-        }
-        return situation_names.get(situation, situation)
+        return SITUATION_LABELS.get(situation, situation)
 
     def _get_experiment_status(self, exp: AvailableExperiment) -> str:
         """Get status symbol for an experiment."""
@@ -360,5 +411,11 @@ class ExperimentTree(ttk.Frame):
 
     def clear(self):
         """Clear all items from the tree."""
+        self.cancel_expand_all()
+        self.rollup = None
+        self._experiments.clear()
+        self._rendered.clear()
+        self._groups.clear()
+        self._placeholders.clear()
         for item in self.tree.get_children():
             self.tree.delete(item)
@@ -2,30 +2,37 @@
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from models.science_database import ScienceDatabase
-from utils.config import SHOW_OPTIONS, GROUP_BY_OPTIONS
+from utils.config import SHOW_OPTIONS, GROUP_BY_OPTIONS, SEARCH_DEBOUNCE_MS
 
 
 class FilterPanel(ttk.Frame):
     """Widget for filtering and grouping experiments."""
 
-    def __init__(self, parent, science_db: ScienceDatabase,
+    def __init__(self, parent, science_db: Optional[ScienceDatabase],
                  on_filter_changed: Callable):
         """
         Initialize filter panel.
 
         Args:
             parent: Parent widget
-            science_db: Science database for filter options
+            science_db: Science database for filter options. May be None
+                       until it is loaded; see set_database.
             on_filter_changed: Callback when filters change
         """
         super().__init__(parent)
-        self.science_db = science_db
+        self.science_db = None
         self.on_filter_changed = on_filter_changed
+        # (experiment_id, display name) of the experiment choices
+        self._experiment_types: List[Tuple[str, str]] = []
+        # Pending after() id of a debounced search
+        self._search_after: Optional[str] = None
 
         self._build_ui()
+        if science_db is not None:
+            self.set_database(science_db)
 
     def _build_ui(self):
         """Build the filter panel UI."""
@@ -36,11 +43,10 @@ class FilterPanel(ttk.Frame):
         # Body filter
         ttk.Label(filter_frame, text="Body:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
         self.body_var = tk.StringVar(value="All")
-        body_values = ["All"] + self.science_db.get_body_names()
         self.body_combo = ttk.Combobox(
             filter_frame,
             textvariable=self.body_var,
-            values=body_values,
+            values=["All"],
             state='readonly',
             width=20
         )
@@ -50,11 +56,10 @@ class FilterPanel(ttk.Frame):
         # Experiment type filter
         ttk.Label(filter_frame, text="Experiment:").grid(row=0, column=2, sticky=tk.W, padx=5, pady=5)
         self.experiment_var = tk.StringVar(value="All")
-        exp_values = ["All"] + [name for _, name in self.science_db.get_experiment_types()]
         self.experiment_combo = ttk.Combobox(
             filter_frame,
             textvariable=self.experiment_var,
-            values=exp_values,
+            values=["All"],
             state='readonly',
             width=25
         )
@@ -87,6 +92,75 @@ class FilterPanel(ttk.Frame):
         self.group_by_combo.grid(row=1, column=3, sticky=tk.W, padx=5, pady=5)
         self.group_by_combo.bind('<<ComboboxSelected>>', lambda e: self.on_filter_changed())
 
+        # Search as you type, once typing pauses
+        ttk.Label(filter_frame, text="Search:").grid(row=0, column=4, sticky=tk.W, padx=5, pady=5)
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(filter_frame, textvariable=self.search_var, width=30)
+        self.search_entry.grid(row=0, column=5, sticky=tk.W, padx=5, pady=5)
+        self.search_entry.bind('<Escape>', lambda e: self.search_var.set(""))
+        self.search_var.trace_add('write', lambda *args: self._schedule_search())
+
+    def set_database(self, science_db: ScienceDatabase):
+        """Fill the body and experiment choices from a science database."""
+        self.science_db = science_db
+        self.set_choices(science_db.get_body_names(), science_db.get_experiment_types())
+
+    def set_choices(self, body_names: List[str], experiment_types: List[Tuple[str, str]]):
+        """
+        Fill the body and experiment choices.
+
+        Args:
+            body_names: Body names
+            experiment_types: (experiment_id, display name) pairs
+        """
+        self._experiment_types = [tuple(exp_type) for exp_type in experiment_types]
+        self.body_combo['values'] = ["All"] + list(body_names)
+        self.experiment_combo['values'] = ["All"] + [name for _, name in self._experiment_types]
+
+    def get_choices(self) -> Dict[str, list]:
+        """Get the body and experiment choices, as set_choices takes them."""
+        return {
+            'body_names': list(self.body_combo['values'][1:]),
+            'experiment_types': [list(exp_type) for exp_type in self._experiment_types],
+        }
+
+    def get_state(self) -> Dict[str, str]:
+        """Get the filter selections (see set_state)."""
+        return {
+            'body': self.body_var.get(),
+            'experiment': self.experiment_var.get(),
+            'show': self.show_var.get(),
+            'group_by': self.group_by_var.get(),
+            'search': self.search_var.get(),
+        }
+
+    def set_state(self, state: Dict[str, str]):
+        """
+        Restore filter selections from get_state, without notifying.
+
+        Unknown keys are ignored and missing ones keep their value.
+        """
+        for key, var in (('body', self.body_var), ('experiment', self.experiment_var),
+                         ('show', self.show_var), ('group_by', self.group_by_var),
+                         ('search', self.search_var)):
+            if key in state:
+                var.set(state[key])
+        # Setting the search text schedules a search; the caller refreshes
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+            self._search_after = None
+
+    def _schedule_search(self):
+        """Run the search SEARCH_DEBOUNCE_MS after the last keystroke."""
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        """Apply the search text."""
+        self._search_after = None
+        self.on_filter_changed()
+
     def get_selected_body(self) -> Optional[str]:
         """Get selected body filter (None if 'All')."""
         body = self.body_var.get()
@@ -99,11 +173,15 @@ class FilterPanel(ttk.Frame):
             return None
 
         # Convert display name back to experiment ID
-        for exp_id, name in self.science_db.get_experiment_types():
+        for exp_id, name in self._experiment_types:
             if name == exp_name:
                 return exp_id
         return None
 
+    def get_search_text(self) -> str:
+        """Get the search query, normalized ('' if none)."""
+        return " ".join(self.search_var.get().lower().split())
+
     def get_show_mode(self) -> str:
         """Get show mode ('Available Only' or 'All Experiments')."""
         return self.show_var.get()
@@ -0,0 +1,108 @@
+"""Window showing a save's science over its recorded loads."""
+
+import sqlite3
+import tkinter as tk
+from datetime import datetime
+from tkinter import ttk
+from typing import Dict, List
+
+from utils.science_history import ScienceHistory
+
+
+class HistoryWindow(tk.Toplevel):
+    """Toplevel listing a save's recent snapshots, each broken down by body."""
+
+    COLUMNS = (
+        ("earned", "Science Earned", 120),
+        ("change", "Change", 90),
+        ("subjects", "Subjects", 90),
+    )
+
+    # Most recent snapshots shown
+    LIMIT = 50
+
+    def __init__(self, parent, history: ScienceHistory, save_name: str, save_path: str):
+        """
+        Initialize history window and show the save's history.
+
+        Args:
+            parent: Parent widget
+            history: Science history store
+            save_name: Name of the save
+            save_path: Path to its persistent.sfs file
+        """
+        super().__init__(parent)
+        self.title(f"Science History - {save_name}")
+        self.geometry("600x400")
+
+        self.history = history
+        self.save_path = save_path
+
+        self._build_ui()
+        self._show()
+
+    def _build_ui(self):
+        """Build the history table."""
+        frame = ttk.Frame(self, padding=5)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        vsb = ttk.Scrollbar(frame, orient="vertical")
+        self.table = ttk.Treeview(
+            frame,
+            columns=[key for key, _, _ in self.COLUMNS],
+            yscrollcommand=vsb.set
+        )
+        vsb.config(command=self.table.yview)
+
+        self.table.heading("#0", text="Recorded", anchor=tk.W)
+        self.table.column("#0", width=200, anchor=tk.W)
+        for key, title, width in self.COLUMNS:
+            self.table.heading(key, text=title, anchor=tk.E)
+            self.table.column(key, width=width, anchor=tk.E)
+
+        self.table.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+
+        self.status_label = ttk.Label(self, text="", foreground="gray")
+        self.status_label.pack(fill=tk.X, padx=5, pady=2)
+
+    def _show(self):
+        """Fill the table, newest snapshot first."""
+        try:
+            snapshots = self.history.trend(self.save_path, limit=self.LIMIT)
+            by_body = self.history.trend(self.save_path, by='body', limit=self.LIMIT)
+        except (sqlite3.Error, ValueError) as e:
+            self.status_label.config(text=f"Could not read the history: {e}", foreground="red")
+            return
+
+        if not snapshots:
+            self.status_label.config(text="Nothing recorded for this save yet")
+            return
+
+        bodies: Dict[float, List[dict]] = {}
+        for row in by_body:
+            bodies.setdefault(row['recorded_at'], []).append(row)
+
+        previous = None
+        rows = []
+        for snapshot in snapshots:
+            change = "" if previous is None else f"{snapshot['earned'] - previous:+.1f}"
+            previous = snapshot['earned']
+            rows.append((snapshot, change))
+
+        for snapshot, change in reversed(rows):
+            recorded_at = snapshot['recorded_at']
+            item = self.table.insert(
+                "", "end",
+                text=datetime.fromtimestamp(recorded_at).strftime("%Y-%m-%d %H:%M:%S"),
+                values=(f"{snapshot['earned']:.1f}", change, snapshot['subjects'])
+            )
+            for row in bodies.get(recorded_at, ()):
+                self.table.insert(
+                    item, "end", text=row['group'],
+                    values=(f"{row['earned']:.1f}", "", row['subjects'])
+                )
+
+        self.status_label.config(text=f"Last {len(snapshots)} recorded load(s)")
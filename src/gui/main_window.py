@@ -1,48 +1,322 @@
 """Main application window."""
 
+import queue
+import sqlite3
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from models.science_database import ScienceDatabase
 from models.save_data import SaveGameData
 from models.experiment import AvailableExperiment
+from models.experiment_index import ExperimentIndex
+from models.save_diff import diff_saves
+from models.science_rollup import ScienceRollup
+from models.search_index import SearchIndex
+from models.view_cache import FilteredView, ViewCache
 from parsers.sfs_parser import SFSParser
 from parsers.science_extractor import ScienceExtractor
-from utils.science_calculator import ScienceCalculator
+from parsers.parse_cache import ParseCache
+from parsers.gamedata_loader import load_gamedata
+from utils.science_calculator import ScienceCalculator, AvailabilityChanges
+from utils.file_watcher import FileWatcher
+from utils.last_session import LastSession
+from utils.science_history import ScienceHistory
 from utils.config import (
     APP_NAME, APP_VERSION,
     WINDOW_WIDTH, WINDOW_HEIGHT,
-    WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT
+    WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
+    VIEW_CACHE_SIZE, SEARCH_EXPAND_LIMIT
 )
 
 from .save_selector import SaveSelector
 from .filter_panel import FilterPanel
 from .experiment_tree import ExperimentTree
+from .save_loader import SaveLoader, LoadRequest
+from .batch_window import BatchWindow
+from .history_window import HistoryWindow
 
 
 class MainWindow:
     """Main application window."""
 
     def __init__(self):
-        """Initialize main window."""
+        """
+        Initialize main window.
+
+        Only the widgets are built here. The catalogue, parser and save list
+        are prepared on a background thread once the window has been drawn
+        (see _start_background_init), and the first save loads after that.
+        If the last session was saved, its results are shown right away and
+        revalidated against the save file once the catalogue is ready.
+        """
+        # Milestone -> seconds since construction (see benchmarks/bench_startup.py)
+        self._started = time.perf_counter()
+        self.startup_times: Dict[str, float] = {}
+
         self.root = tk.Tk()
         self.root.title(f"{APP_NAME} v{APP_VERSION}")
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.minsize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
 
-        # Initialize data components
-        self.science_db = ScienceDatabase()
-        self.calculator = ScienceCalculator(self.science_db)
-        self.parser = SFSParser()
+        # Data components, set by _on_data_ready
+        self.parser: Optional[SFSParser] = None
+        self.science_db: Optional[ScienceDatabase] = None
+        self.calculator: Optional[ScienceCalculator] = None
         self.extractor = ScienceExtractor()
+        self._init_events: queue.Queue = queue.Queue()
+        self._init_started = False
+        # KSP directory whose catalogue is being rebuilt, if any
+        self._pending_ksp_dir: Optional[str] = None
 
         # Current state
         self.save_data: Optional[SaveGameData] = None
         self.available_experiments: List[AvailableExperiment] = []
+        self.available_index = ExperimentIndex([])
+        self.current_save: Optional[tuple] = None
+        self.stats: Optional[dict] = None
+        # The above as one tuple the loader thread reads at once:
+        # (current_save, save_data, available_experiments, stats)
+        self._shown: tuple = (None, None, [], None)
+        # Filtered views of available_experiments, per filter combination
+        self.view_cache = ViewCache(VIEW_CACHE_SIZE)
+
+        self.selected_save: Optional[tuple] = None
+        self._stats_text = ""
+
+        # Results shown at exit, for the next start
+        self.last_session = LastSession()
+        self._session: Optional[dict] = None
+        # Search index over the session's experiments until the catalogue loads
+        self._session_search_index: Optional[SearchIndex] = None
+
+        # Saves are loaded on a worker thread; live reloads go through it too
+        self.loader = SaveLoader(
+            self.root,
+            self._load_save,
+            on_progress=self._on_load_progress,
+            on_done=self._on_load_done,
+            on_error=self._on_load_error
+        )
+        self.watcher: Optional[FileWatcher] = None
+        # Every loaded save is recorded here (on the loader thread)
+        self.history = ScienceHistory()
 
         self._build_ui()
-        self._show_welcome()
+        self.stats_label.config(text="Loading experiment catalogue...")
+
+        self._show_last_session()
+
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind("<Map>", self._on_first_map)
+
+    def _show_last_session(self):
+        """Show the results saved at the end of the last session, if any."""
+        session = self.last_session.load()
+        if session is None:
+            return
+
+        self._session = session
+        choices = session['choices']
+        self.filter_panel.set_choices(choices['body_names'], choices['experiment_types'])
+        self.filter_panel.set_state(session['filters'])
+        self.save_selector.show_selected_name(session['save_name'])
+
+        available = session['available']
+        self._apply_loaded_save(
+            session['save_name'], session['save_path'], session['save_data'],
+            available, ExperimentIndex(available), session['stats']
+        )
+        self.selected_save = self.current_save
+        self._mark("warm")
+
+    def _save_session(self):
+        """Save the shown results for the next start."""
+        if self.science_db is None or self.current_save is None or self.stats is None:
+            return
+        self.last_session.save(
+            *self.current_save, self.save_data, self.available_experiments, self.stats,
+            filters=self.filter_panel.get_state(),
+            choices=self.filter_panel.get_choices(),
+            catalogue_hash=self.science_db.source_hash
+        )
+
+    def _get_search_index(self) -> SearchIndex:
+        """Get the search index of the catalogue, or of the session's results."""
+        if self.science_db is not None:
+            return self.science_db.get_search_index()
+        if self._session_search_index is None:
+            self._session_search_index = SearchIndex.from_experiments(self.available_experiments)
+        return self._session_search_index
+
+    def _mark(self, milestone: str):
+        """Record the time of a startup milestone, the first time only."""
+        self.startup_times.setdefault(milestone, time.perf_counter() - self._started)
+
+    def _on_first_map(self, event):
+        """Start background initialization once the window is on screen."""
+        if event.widget is not self.root or self._init_started:
+            return
+        self._init_started = True
+        # Idle callbacks run after the pending redraws, i.e. after first paint
+        self.root.after_idle(self._start_background_init)
+
+    def _start_background_init(self):
+        """Build the catalogue and scan saves on a worker thread."""
+        self._mark("paint")
+        ksp_dir = self.save_selector.get_ksp_directory()
+        threading.Thread(
+            target=self._prepare_data, args=(ksp_dir,), name="Startup", daemon=True
+        ).start()
+        self._poll_init()
+
+    def _prepare_data(self, ksp_dir: str):
+        """
+        Create the parser and catalogue and find saves. Runs on the worker.
+
+        Posts ("ready", (parser, science_db, ksp_dir, save_games)) or
+        ("error", exception) to _init_events.
+        """
+        try:
+            parser = SFSParser(ksp_dir or None, cache=ParseCache())
+            science_db = ScienceDatabase(mod_data=load_gamedata(parser.get_ksp_directory()))
+            parser.id_decoder = science_db.get_id_decoder()
+            science_db.get_search_index()
+            save_games = SaveSelector.scan_saves(ksp_dir)
+        except Exception as e:
+            self._init_events.put(("error", e))
+            return
+        self._init_events.put(("ready", (parser, science_db, ksp_dir, save_games)))
+
+    def _poll_init(self):
+        """Deliver a background initialization or catalogue result on the Tk thread."""
+        try:
+            kind, payload = self._init_events.get_nowait()
+        except queue.Empty:
+            self.root.after(SaveLoader.POLL_INTERVAL_MS, self._poll_init)
+            return
+
+        if kind == "ready":
+            self._on_data_ready(*payload)
+        elif kind == "catalogue":
+            self._on_catalogue_ready(*payload)
+        else:
+            # No startup catalogue for a rebuilt one to replace
+            self._pending_ksp_dir = None
+            self.stats_label.config(text="Failed to load the experiment catalogue")
+            messagebox.showerror("Error", f"Failed to load the experiment catalogue:\n{payload}")
+
+    def _on_data_ready(self, parser: SFSParser, science_db: ScienceDatabase,
+                       ksp_dir: str, save_games: Optional[List[tuple]]):
+        """Install the background-built data and load a save when idle."""
+        self._mark("catalogue")
+        self.parser = parser
+        self._install_catalogue(science_db)
+        if self._session is not None and self._session['catalogue_hash'] != science_db.source_hash:
+            # Computed from other definitions: recalculate rather than patch
+            self._discard_stats()
+        if self.save_data is None:
+            self._show_welcome()
+        self.root.after_idle(self._load_initial_save, ksp_dir, save_games)
+
+    def _install_catalogue(self, science_db: ScienceDatabase):
+        """Use a science database for everything that is loaded from now on."""
+        self.science_db = science_db
+        self.parser.id_decoder = science_db.get_id_decoder()
+        self.calculator = ScienceCalculator(science_db)
+        self.filter_panel.set_database(science_db)
+        self.experiment_tree.science_db = science_db
+        self._session_search_index = None
+
+    def _discard_stats(self):
+        """Make the next load of the shown save recalculate rather than patch it."""
+        self.stats = None
+        self._shown = self._shown[:3] + (None,)
+
+    def _on_ksp_directory_changed(self, ksp_dir: str):
+        """
+        Rebuild the catalogue from another KSP installation's GameData.
+
+        The catalogue is built on a worker; the save selected meanwhile is
+        loaded once it is ready, so it is never decoded with the old mods.
+        """
+        self._pending_ksp_dir = ksp_dir
+        self._stop_watching()
+        self.stats_label.config(text="Loading experiment catalogue...")
+        threading.Thread(
+            target=self._prepare_catalogue, args=(ksp_dir,), name="Catalogue", daemon=True
+        ).start()
+        self._poll_init()
+
+    def _prepare_catalogue(self, ksp_dir: str):
+        """
+        Build the catalogue for a KSP directory. Runs on the worker.
+
+        Posts ("catalogue", (ksp_dir, science_db, error)) to _init_events;
+        science_db is None if it failed.
+        """
+        try:
+            science_db = ScienceDatabase(mod_data=load_gamedata(ksp_dir))
+            science_db.get_search_index()
+        except Exception as e:
+            self._init_events.put(("catalogue", (ksp_dir, None, e)))
+            return
+        self._init_events.put(("catalogue", (ksp_dir, science_db, None)))
+
+    def _on_catalogue_ready(self, ksp_dir: str, science_db: Optional[ScienceDatabase],
+                            error: Optional[Exception]):
+        """Install a rebuilt catalogue and load the selected save with it."""
+        if ksp_dir != self._pending_ksp_dir:
+            # Another directory was picked since
+            return
+        if self.parser is None:
+            # Still starting up; install over the startup catalogue
+            self.root.after(SaveLoader.POLL_INTERVAL_MS, self._on_catalogue_ready,
+                            ksp_dir, science_db, error)
+            return
+        self._pending_ksp_dir = None
+
+        if science_db is None:
+            messagebox.showerror(
+                "Error", f"Failed to load the experiment catalogue for {ksp_dir}:\n{error}"
+            )
+        else:
+            self.parser.set_ksp_directory(ksp_dir)
+            self._install_catalogue(science_db)
+            # Computed from other definitions: recalculate rather than patch
+            self._discard_stats()
+
+        if self.selected_save is not None:
+            self.loader.start(*self.selected_save)
+        else:
+            self._show_welcome()
+
+    def _load_initial_save(self, ksp_dir: str, save_games: Optional[List[tuple]]):
+        """
+        Load the save picked while starting up, or else the first one found.
+
+        The last session's save is already shown, so it is only revalidated:
+        it reloads quietly, and the tree changes only if the save did.
+        """
+        if self._pending_ksp_dir is not None:
+            # Another directory was picked; _on_catalogue_ready loads its save
+            return
+
+        session = self._session
+        if session is not None and self.selected_save == self.current_save:
+            if self.save_selector.get_ksp_directory() == ksp_dir:
+                self.save_selector.show_save_games(
+                    ksp_dir, save_games, select=session['save_name'], notify=False
+                )
+            self.loader.start(*self.selected_save, quiet=True)
+            self._start_watching(*self.selected_save)
+        elif self.selected_save is not None:
+            self.loader.start(*self.selected_save)
+        elif self.save_selector.get_ksp_directory() == ksp_dir:
+            # Selects the first save, which loads it
+            self.save_selector.show_save_games(ksp_dir, save_games)
 
     def _build_ui(self):
         """Build the main window UI."""
@@ -53,7 +327,16 @@ class MainWindow:
         # File menu
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        self.watch_var = tk.BooleanVar(value=True)
+        file_menu.add_checkbutton(
+            label="Reload Save When It Changes",
+            variable=self.watch_var,
+            command=self._on_watch_toggled
+        )
+        file_menu.add_command(label="Analyze All Saves...", command=self._show_batch_analysis)
+        file_menu.add_command(label="Science History...", command=self._show_history)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self._on_close)
 
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -73,16 +356,27 @@ class MainWindow:
             text="Load a save game to view available science",
             font=("TkDefaultFont", 10, "bold")
         )
-        self.stats_label.pack()
+        self.stats_label.pack(side=tk.LEFT, expand=True)
+
+        self.cancel_button = ttk.Button(
+            stats_frame,
+            text="Cancel",
+            command=self._on_cancel_load,
+            state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.RIGHT)
 
-        # Save selector at top
-        self.save_selector = SaveSelector(main_container, self._on_save_selected)
+        # Save selector at top; saves are scanned in the background
+        self.save_selector = SaveSelector(
+            main_container, self._on_save_selected, scan=False,
+            on_directory_changed=self._on_ksp_directory_changed
+        )
         self.save_selector.pack(fill=tk.X, side=tk.TOP)
 
         # Filter panel
         self.filter_panel = FilterPanel(
             main_container,
-            self.science_db,
+            None,
             self._on_filter_changed
         )
         self.filter_panel.pack(fill=tk.X, side=tk.TOP)
@@ -110,52 +404,220 @@ class MainWindow:
         )
         messagebox.showinfo("About", about_text)
 
+    def _show_batch_analysis(self):
+        """Open the all-saves summary window."""
+        if self.science_db is None:
+            messagebox.showinfo("Analyze All Saves", "Still loading the experiment catalogue.")
+            return
+        save_games = self.save_selector.parser.find_save_games()
+        if not save_games:
+            messagebox.showinfo("Analyze All Saves", "No save games found.")
+            return
+        BatchWindow(self.root, self.science_db, save_games)
+
+    def _show_history(self):
+        """Open the shown save's science history."""
+        if self.current_save is None:
+            messagebox.showinfo("Science History", "Load a save game first.")
+            return
+        HistoryWindow(self.root, self.history, *self.current_save)
+
     def _on_save_selected(self, save_name: str, save_path: str):
         """
         Handle save game selection.
 
+        The save is loaded on a worker thread; picking another save while
+        one is loading supersedes it.
+
         Args:
             save_name: Name of the save
             save_path: Path to persistent.sfs file
         """
+        self.selected_save = (save_name, save_path)
+        if self.science_db is None or self._pending_ksp_dir is not None:
+            # Loaded by _load_initial_save or _on_catalogue_ready once the
+            # catalogue is ready
+            return
+        self.loader.start(save_name, save_path)
+
+    def _load_save(self, request: LoadRequest, report) -> tuple:
+        """
+        Parse, extract and calculate a save. Runs on the loader thread.
+
+        Args:
+            request: Load request
+            report: Callback(stage) for progress; raises if cancelled
+
+        Returns:
+            Tuple of (save_data, available_experiments, available_index,
+            stats, changes, base). When the same save is reloaded, changes
+            is the AvailabilityChanges from the shown result (base), else None.
+        """
+        # Snapshot of what is shown; replaced as a whole on the Tk thread
+        shown_save, base, base_available, base_stats = self._shown
+        same_save = (request.save_name, request.save_path) == shown_save
+
+        # Only the R&D scenario is read; vessels etc. are skipped
+        save_data = self.parser.load_science_data(
+            request.save_path, request.save_name, progress=report
+        )
         try:
-            # Parse save file
-            self.stats_label.config(text="Loading save file...")
-            self.root.update_idletasks()
+            self.history.record(request.save_name, request.save_path, save_data)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            print(f"Warning: Science history not recorded: {e}")
+
+        report('calculate')
+        changes = None
+        if same_save and base is not None and base_stats is not None:
+            # Reload of the shown save: recalculate only the changed subjects
+            delta = diff_saves(base, save_data)
+            changes = self.calculator.apply_delta(base_available, delta, save_data)
+            available = changes.available
+            stats = self.calculator.update_statistics(base_stats, changes, delta, save_data)
+        else:
+            available = self.calculator.calculate_available_science(save_data)
+            stats = self.calculator.calculate_statistics(available, save_data)
+        available_index = ExperimentIndex(available)
+        return save_data, available, available_index, stats, changes, base
+
+    def _on_load_progress(self, request: LoadRequest, stage: str):
+        """Show load progress in the stats bar."""
+        if stage == "cancelled":
+            self.cancel_button.config(state=tk.DISABLED)
+            self.selected_save = self.current_save
+            self.save_selector.show_selected_save(self.current_save)
+            self.stats_label.config(
+                text=self._stats_text or f"Loading {request.save_name} cancelled"
+            )
+            return
 
-            parsed_save = self.parser.parse_save_file(save_path)
-            self.save_data = self.extractor.extract_science_data(parsed_save, save_name)
+        if request.quiet:
+            return
 
-            # Calculate available science
-            self.available_experiments = self.calculator.calculate_available_science(
-                self.save_data
+        if stage == "render":
+            # Rendering runs right after this on the Tk thread; paint first
+            self.root.update_idletasks()
+
+        step = SaveLoader.STAGES.index(stage) + 1
+        self.cancel_button.config(state=tk.NORMAL if stage != "render" else tk.DISABLED)
+        self.stats_label.config(
+            text=(
+                f"Loading {request.save_name}: {SaveLoader.STAGE_LABELS[stage]}... "
+                f"({step}/{len(SaveLoader.STAGES)})"
             )
+        )
 
-            # Update display
+    def _on_load_done(self, request: LoadRequest, result: tuple):
+        """Show a finished load. Runs on the Tk thread."""
+        self._apply_loaded_save(request.save_name, request.save_path, *result)
+        if not request.quiet:
+            self._start_watching(request.save_name, request.save_path)
+
+    def _on_load_error(self, request: LoadRequest, error: Exception):
+        """Report a failed load. Runs on the Tk thread."""
+        self.cancel_button.config(state=tk.DISABLED)
+        self.stats_label.config(text=self._stats_text or "Load a save game to view available science")
+
+        if request.quiet:
+            # Most likely caught mid-write; the next change will retry
+            print(f"Warning: Live reload of {request.save_name} failed: {error}")
+        elif isinstance(error, FileNotFoundError):
+            messagebox.showerror("Error", f"Save file not found:\n{error}")
+        elif isinstance(error, ValueError):
+            messagebox.showerror("Error", f"Failed to parse save file:\n{error}")
+        else:
+            messagebox.showerror("Error", f"Unexpected error:\n{error}")
+
+    def _on_cancel_load(self):
+        """Handle the Cancel button."""
+        self.loader.cancel()
+
+    def _apply_loaded_save(self, save_name: str, save_path: str,
+                           save_data: SaveGameData,
+                           available: List[AvailableExperiment],
+                           available_index: ExperimentIndex,
+                           stats: dict,
+                           changes: Optional[AvailabilityChanges] = None,
+                           base: Optional[SaveGameData] = None):
+        """Show a loaded save's results. Must run on the Tk thread."""
+        # Changes only apply to the tree if it still shows their base
+        incremental = (
+            changes is not None and not changes.recalculated and
+            base is self.save_data and (save_name, save_path) == self.current_save
+        )
+
+        self.current_save = (save_name, save_path)
+        self.save_data = save_data
+        self.available_experiments = available
+        self.available_index = available_index
+        self.stats = stats
+        self._shown = (self.current_save, save_data, available, stats)
+        self.view_cache.invalidate()
+
+        # Update display
+        if not (incremental and self._apply_changes_to_tree(changes)):
             self._update_display()
 
-            # Update stats
-            stats = self.calculator.calculate_statistics(
-                self.available_experiments,
-                self.save_data
-            )
+        self._stats_text = (
+            f"Save: {save_name} | "
+            f"Science Earned: {stats['total_earned_science']:.1f} | "
+            f"Available Science: {stats['total_available_science']:.1f} | "
+            f"Completed: {stats['total_completed_experiments']}/{stats['total_possible_experiments']} "
+            f"({stats['completion_percentage']:.1f}%)"
+        )
+        self.stats_label.config(text=self._stats_text)
+        self.cancel_button.config(state=tk.DISABLED)
+        if self.science_db is not None:
+            # Only loads count, not the last session's results shown before
+            self._mark("save")
+
+    def _start_watching(self, save_name: str, save_path: str):
+        """Watch the selected save for changes, replacing any previous watcher."""
+        self._stop_watching()
+        if not self.watch_var.get():
+            return
 
-            self.stats_label.config(
-                text=(
-                    f"Save: {save_name} | "
-                    f"Science Earned: {stats['total_earned_science']:.1f} | "
-                    f"Available Science: {stats['total_available_science']:.1f} | "
-                    f"Completed: {stats['total_completed_experiments']}/{stats['total_possible_experiments']} "
-                    f"({stats['completion_percentage']:.1f}%)"
-                )
-            )
+        self.watcher = FileWatcher(
+            save_path,
+            lambda path: self._on_save_file_changed(save_name, path)
+        )
+        self.watcher.start()
+
+    def _stop_watching(self):
+        """Stop the current save watcher, if any."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def _on_watch_toggled(self):
+        """Handle the live reload menu toggle."""
+        if self.watch_var.get() and self.current_save:
+            self._start_watching(*self.current_save)
+        else:
+            self._stop_watching()
+
+    def _on_save_file_changed(self, save_name: str, save_path: str) -> bool:
+        """
+        Reload a save after it changed on disk.
 
-        except FileNotFoundError as e:
-            messagebox.showerror("Error", f"Save file not found:\n{e}")
-        except ValueError as e:
-            messagebox.showerror("Error", f"Failed to parse save file:\n{e}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Unexpected error:\n{e}")
+        Runs on the watcher thread. The reload goes through the save loader,
+        superseding a load in progress, since that may have read the file
+        before this change. Returns False if the user has since picked
+        another save, so the watcher keeps the change.
+        """
+        if self.selected_save != (save_name, save_path):
+            return False
+        self.loader.start(save_name, save_path, quiet=True)
+        return True
+
+    def _on_close(self):
+        """Stop background work, save the session and close the window."""
+        self._save_session()
+        self._stop_watching()
+        self.loader.cancel()
+        if self.parser is not None and self.parser.cache is not None:
+            self.parser.cache.flush()
+        self.root.destroy()
 
     def _on_filter_changed(self):
         """Handle filter/grouping changes."""
@@ -175,37 +637,76 @@ class MainWindow:
             self.stats_label.config(text="No available experiments found!")
             return
 
-        # Apply filters
-        filtered_experiments = self._apply_filters(self.available_experiments)
-
         # Get grouping preference
         group_by = self.filter_panel.get_group_by()
 
+        # Flipping back to a recent combination reuses its view
+        search = self.filter_panel.get_search_text()
+        filters = (
+            self.filter_panel.get_selected_body(),
+            self.filter_panel.get_selected_experiment(),
+            self.filter_panel.get_show_mode(),
+            group_by,
+            search,
+        )
+        view = self.view_cache.get(filters, lambda: self._build_view(group_by))
+
         # Update tree
-        self.experiment_tree.populate(filtered_experiments, group_by)
+        self.experiment_tree.populate(view.experiments, group_by, rollup=view.rollup)
+        if search and len(view.experiments) <= SEARCH_EXPAND_LIMIT:
+            # Show the matches themselves, not just their groups
+            self.experiment_tree.expand_all()
 
-    def _apply_filters(self, experiments: List[AvailableExperiment]) -> List[AvailableExperiment]:
-        """
-        Apply current filters to experiment list.
+    def _build_view(self, group_by: str) -> FilteredView:
+        """Filter and group the available experiments for the current filters."""
+        experiments = self._apply_filters()
+        return FilteredView(experiments, ScienceRollup(experiments, modes=(group_by,)))
 
-        Args:
-            experiments: List of all available experiments
+    def _apply_changes_to_tree(self, changes: AvailabilityChanges) -> bool:
+        """
+        Update only the tree rows a reload changed.
 
         Returns:
-            Filtered list of experiments
+            False if the tree must be rebuilt instead
         """
-        filtered = experiments
+        if not self.available_experiments:
+            return False
 
-        # Filter by body
         body_filter = self.filter_panel.get_selected_body()
-        if body_filter:
-            filtered = [exp for exp in filtered if exp.body_name == body_filter]
+        exp_filter = self.filter_panel.get_selected_experiment()
+        search = self.filter_panel.get_search_text()
+        search_index = self._get_search_index()
+
+        def shown(exp: AvailableExperiment) -> bool:
+            return ((body_filter is None or exp.body_name == body_filter) and
+                    (exp_filter is None or exp.experiment_id.experiment_type == exp_filter) and
+                    (not search or search_index.matches(search, exp)))
+
+        return self.experiment_tree.update_experiments(
+            [(old, new) for old, new in changes.updated if shown(new)],
+            [exp for exp in changes.removed if shown(exp)]
+        )
+
+    def _apply_filters(self) -> List[AvailableExperiment]:
+        """
+        Apply current filters to the available experiments.
+
+        Uses the index built when the save was loaded, so the cost follows
+        the number of matching experiments rather than all of them.
 
-        # Filter by experiment type
+        Returns:
+            Filtered list of experiments
+        """
+        body_filter = self.filter_panel.get_selected_body()
         exp_filter = self.filter_panel.get_selected_experiment()
-        if exp_filter:
-            filtered = [exp for exp in filtered
-                       if exp.experiment_id.experiment_type == exp_filter]
+        search = self.filter_panel.get_search_text()
+
+        if search:
+            filtered = self._get_search_index().search(
+                search, self.available_index, body=body_filter, experiment_type=exp_filter
+            )
+        else:
+            filtered = self.available_index.query(body=body_filter, experiment_type=exp_filter)
 
         # Filter by show mode
         show_mode = self.filter_panel.get_show_mode()
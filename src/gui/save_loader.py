@@ -0,0 +1,169 @@
+"""Background save loading with stage progress and cancellation."""
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+
+class LoadCancelled(Exception):
+    """Raised inside a load that has been cancelled or superseded."""
+
+
+class LoadRequest:
+    """A single save load, identified by object identity."""
+
+    def __init__(self, save_name: str, save_path: str, quiet: bool = False):
+        """
+        Initialize load request.
+
+        Args:
+            save_name: Name of the save
+            save_path: Path to persistent.sfs file
+            quiet: Background reload - no progress text or error dialogs
+        """
+        self.save_name = save_name
+        self.save_path = save_path
+        self.quiet = quiet
+        self.cancelled = threading.Event()
+
+    def check_cancelled(self):
+        """Raise LoadCancelled if this request has been cancelled."""
+        if self.cancelled.is_set():
+            raise LoadCancelled()
+
+
+class SaveLoader:
+    """
+    Runs save loads on a worker thread and reports back on the Tk thread.
+
+    load_func(request, report) runs on the worker thread and calls
+    report(stage) as it enters each stage; report raises LoadCancelled once
+    the request is cancelled, which is how a running load is stopped. Only
+    one load is current at a time: starting a new one cancels the previous
+    one, and anything a superseded load still produces is dropped.
+
+    start() and cancel() never touch Tk, so they may be called from any
+    thread (e.g. a file watcher). Callbacks always run on the Tk thread.
+    """
+
+    # Worker stages in order; 'render' runs on the Tk thread in on_done
+    STAGES = ("parse", "extract", "calculate", "render")
+    STAGE_LABELS = {
+        "parse": "Parsing save file",
+        "extract": "Extracting science",
+        "calculate": "Calculating available science",
+        "render": "Updating display",
+    }
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, root,
+                 load_func: Callable[[LoadRequest, Callable[[str], None]], Any],
+                 on_progress: Callable[[LoadRequest, str], None],
+                 on_done: Callable[[LoadRequest, Any], None],
+                 on_error: Callable[[LoadRequest, Exception], None]):
+        """
+        Initialize save loader.
+
+        Args:
+            root: Tk root used to schedule polling
+            load_func: Callback(request, report) doing the work, returns result
+            on_progress: Callback(request, stage) when a stage starts
+            on_done: Callback(request, result) when a load finishes
+            on_error: Callback(request, exception) when a load fails
+        """
+        self.root = root
+        self.load_func = load_func
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+
+        self._lock = threading.Lock()
+        self._current: Optional[LoadRequest] = None
+        self._events: queue.Queue = queue.Queue()
+
+        self._poll()
+
+    def start(self, save_name: str, save_path: str, quiet: bool = False) -> LoadRequest:
+        """Start loading a save, superseding any load in progress."""
+        request = LoadRequest(save_name, save_path, quiet)
+        with self._lock:
+            if self._current is not None:
+                self._current.cancelled.set()
+            self._current = request
+
+        threading.Thread(
+            target=self._run, args=(request,), name="SaveLoader", daemon=True
+        ).start()
+        return request
+
+    def cancel(self):
+        """Cancel the load in progress, if any."""
+        with self._lock:
+            if self._current is not None:
+                self._current.cancelled.set()
+
+    def is_loading(self) -> bool:
+        """Check whether a load is in progress."""
+        with self._lock:
+            return self._current is not None and not self._current.cancelled.is_set()
+
+    def _is_current(self, request: LoadRequest) -> bool:
+        with self._lock:
+            return request is self._current and not request.cancelled.is_set()
+
+    def _run(self, request: LoadRequest):
+        """Worker thread body."""
+        def report(stage: str):
+            request.check_cancelled()
+            self._events.put(("progress", request, stage))
+
+        try:
+            result = self.load_func(request, report)
+            request.check_cancelled()
+        except LoadCancelled:
+            self._events.put(("cancelled", request, None))
+            return
+        except Exception as e:
+            self._events.put(("error", request, e))
+            return
+        self._events.put(("done", request, result))
+
+    def _poll(self):
+        """Deliver worker events on the Tk thread."""
+        try:
+            while True:
+                kind, request, payload = self._events.get_nowait()
+                self._dispatch(kind, request, payload)
+        except queue.Empty:
+            pass
+
+        self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _dispatch(self, kind: str, request: LoadRequest, payload):
+        """Handle one worker event."""
+        if kind == "cancelled":
+            with self._lock:
+                was_current = request is self._current
+                if was_current:
+                    self._current = None
+            if was_current:
+                self.on_progress(request, "cancelled")
+            return
+
+        # Drop anything from a superseded or cancelled load
+        if not self._is_current(request):
+            return
+
+        if kind == "progress":
+            self.on_progress(request, payload)
+            return
+
+        with self._lock:
+            self._current = None
+
+        if kind == "done":
+            self.on_progress(request, "render")
+            self.on_done(request, payload)
+        else:
+            self.on_error(request, payload)
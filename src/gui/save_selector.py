@@ -12,20 +12,31 @@ from utils.config import DEFAULT_KSP_PATHS
 class SaveSelector(ttk.Frame):
     """Widget for selecting KSP directory and save game."""
 
-    def __init__(self, parent, on_save_selected: Callable[[str, str], None]):
+    def __init__(self, parent, on_save_selected: Callable[[str, str], None], scan: bool = True,
+                 on_directory_changed: Optional[Callable[[str], None]] = None):
         """
         Initialize save selector.
 
         Args:
             parent: Parent widget
             on_save_selected: Callback(save_name, save_path) when save is selected
+            scan: Look for saves now. If False, the owner scans (e.g. in the
+                  background with scan_saves) and calls show_save_games.
+            on_directory_changed: Optional callback(ksp_dir) when another KSP
+                                  directory is browsed to, before its saves
+                                  are scanned
         """
         super().__init__(parent)
         self.on_save_selected = on_save_selected
+        self.on_directory_changed = on_directory_changed
         self.parser = SFSParser()
+        self.save_games: List[tuple] = []
 
         self._build_ui()
-        self._refresh_saves()
+        if scan:
+            self._refresh_saves()
+        else:
+            self.status_label.config(text="Looking for save games...", foreground="gray")
 
     def _build_ui(self):
         """Build the save selector UI."""
@@ -79,6 +90,8 @@ class SaveSelector(ttk.Frame):
             if SFSParser.validate_ksp_directory(directory):
                 self.ksp_dir_var.set(directory)
                 self.parser.set_ksp_directory(directory)
+                if self.on_directory_changed is not None:
+                    self.on_directory_changed(directory)
                 self._refresh_saves()
             else:
                 messagebox.showerror(
@@ -87,22 +100,51 @@ class SaveSelector(ttk.Frame):
                     "Please select the main KSP directory (should contain 'saves' and 'GameData' folders)."
                 )
 
+    def get_ksp_directory(self) -> str:
+        """Get the KSP directory entered ('' if none)."""
+        return self.ksp_dir_var.get()
+
+    @staticmethod
+    def scan_saves(ksp_dir: str) -> Optional[List[tuple]]:
+        """
+        Find the save games of a KSP directory. Doesn't touch Tk.
+
+        Returns:
+            List of (save_name, save_path), or None if ksp_dir is not a
+            KSP installation
+        """
+        if not ksp_dir or not SFSParser.validate_ksp_directory(ksp_dir):
+            return None
+        return SFSParser(ksp_dir).find_save_games()
+
     def _refresh_saves(self):
         """Refresh the list of available save games."""
         ksp_dir = self.ksp_dir_var.get()
+        self.show_save_games(ksp_dir, self.scan_saves(ksp_dir))
+
+    def show_save_games(self, ksp_dir: str, save_games: Optional[List[tuple]],
+                        select: Optional[str] = None, notify: bool = True):
+        """
+        Show the saves found in a KSP directory and select one.
 
+        Args:
+            ksp_dir: KSP directory that was scanned
+            save_games: scan_saves result for ksp_dir
+            select: Name of the save to select. Defaults to the first one;
+                    if it isn't found, the selection is left alone.
+            notify: Call on_save_selected for the selection
+        """
         if not ksp_dir:
             self.status_label.config(text="No KSP directory selected", foreground="red")
             self.save_combo['values'] = []
             return
 
-        if not SFSParser.validate_ksp_directory(ksp_dir):
+        if save_games is None:
             self.status_label.config(text="Invalid KSP directory", foreground="red")
             self.save_combo['values'] = []
             return
 
         self.parser.set_ksp_directory(ksp_dir)
-        save_games = self.parser.find_save_games()
 
         if not save_games:
             self.status_label.config(text="No save games found", foreground="orange")
@@ -121,8 +163,25 @@ class SaveSelector(ttk.Frame):
 
         # Auto-select first save if available
         if save_names:
-            self.save_combo.current(0)
-            self._on_save_selected(None)
+            if select is None:
+                self.save_combo.current(0)
+            elif select in save_names:
+                self.save_combo.current(save_names.index(select))
+            if notify:
+                self._on_save_selected(None)
+
+    def show_selected_name(self, save_name: str):
+        """Show a save as selected before the saves have been scanned."""
+        self.save_combo.set(save_name)
+
+    def show_selected_save(self, save: Optional[tuple]):
+        """Show a (save_name, save_path) as selected, without notifying."""
+        if save is None:
+            self.save_combo.set('')
+        elif save in self.save_games:
+            self.save_combo.current(self.save_games.index(save))
+        else:
+            self.save_combo.set(save[0])
 
     def _on_save_selected(self, event):
         """Handle save game selection."""
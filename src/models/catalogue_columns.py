@@ -0,0 +1,172 @@
+"""Columnar (NumPy) view of the experiment catalogue.
+
+NumPy is optional. Check HAVE_NUMPY before building CatalogueColumns;
+without it, callers keep using the per-experiment code paths. NumPy itself
+is only imported once columns are built, so importing this module (and the
+CLI) doesn't pay for it.
+"""
+
+import importlib.util
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .experiment import AvailableExperiment, ExperimentID, PossibleExperiment
+from .save_data import SaveGameData
+
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+class CatalogueColumns:
+    """
+    Integer-coded columns over a catalogue of possible experiments.
+
+    Each dimension (body, experiment_type, situation, biome) is stored as an
+    int32 array of codes into a label list, aligned with the catalogue, next
+    to a float64 array of base science values. Availability for a save is
+    then computed with array operations instead of a lookup and an object
+    per experiment (see availability).
+    """
+
+    DIMENSIONS = ('body', 'experiment_type', 'situation', 'biome')
+
+    def __init__(self, experiments: Sequence[PossibleExperiment],
+                 base_value: Callable[[ExperimentID], float]):
+        """
+        Build columns.
+
+        Args:
+            experiments: Catalogue of possible experiments
+            base_value: Science value of an experiment nobody has started
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if not HAVE_NUMPY:
+            raise ImportError("CatalogueColumns requires numpy")
+        import numpy as np
+
+        self.experiments = experiments
+        self.labels: Dict[str, List[Optional[str]]] = {dim: [] for dim in self.DIMENSIONS}
+        # Rows per id - usually one, but catalogue data may repeat a biome
+        self.rows_of: Dict[ExperimentID, List[int]] = {}
+
+        label_codes = {dim: {} for dim in self.DIMENSIONS}
+        codes = {dim: [] for dim in self.DIMENSIONS}
+        base = []
+        for row, exp in enumerate(experiments):
+            exp_id = exp.experiment_id
+            self.rows_of.setdefault(exp_id, []).append(row)
+            base.append(base_value(exp_id))
+            for dim, value in (('body', exp.body_name),
+                               ('experiment_type', exp_id.experiment_type),
+                               ('situation', exp_id.situation),
+                               ('biome', exp_id.biome)):
+                code = label_codes[dim].get(value)
+                if code is None:
+                    code = label_codes[dim][value] = len(self.labels[dim])
+                    self.labels[dim].append(value)
+                codes[dim].append(code)
+
+        self.codes = {dim: np.array(values, dtype=np.int32) for dim, values in codes.items()}
+        self.base = np.array(base, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.base)
+
+    def availability(self, save_data: SaveGameData) -> 'ColumnarAvailability':
+        """
+        Compute remaining science for every catalogue row.
+
+        Completed experiments are scattered into arrays aligned with the
+        catalogue; ones the catalogue doesn't know are ignored, as in
+        ScienceCalculator.calculate_available_science.
+        """
+        import numpy as np
+
+        rows_of = self.rows_of
+        rows, earned, cap = [], [], []
+        for exp_id, completed in save_data.completed_experiments.items():
+            for row in rows_of.get(exp_id, ()):
+                rows.append(row)
+                earned.append(completed.science_earned)
+                cap.append(completed.science_cap)
+
+        rows = np.array(rows, dtype=np.intp)
+        earned = np.array(earned, dtype=np.float64)
+        cap = np.array(cap, dtype=np.float64)
+
+        started = np.zeros(len(self), dtype=bool)
+        started[rows] = True
+        available = np.ones(len(self), dtype=bool)
+        available[rows] = earned < cap
+
+        remaining = self.base.copy()
+        remaining[rows] = np.maximum(0.0, cap - earned)
+        remaining[~available] = 0.0
+
+        return ColumnarAvailability(self, remaining, available, started & available)
+
+
+class ColumnarAvailability:
+    """Remaining science of one save, aligned with CatalogueColumns rows."""
+
+    def __init__(self, columns: CatalogueColumns, remaining, available, partial):
+        """
+        Args:
+            columns: Catalogue columns the arrays are aligned with
+            remaining: float64 remaining science (0 where not available)
+            available: bool mask of experiments not fully completed
+            partial: bool mask of started but not fully completed experiments
+        """
+        self.columns = columns
+        self.remaining = remaining
+        self.available = available
+        self.partial = partial
+
+    def count(self) -> int:
+        """Number of available experiments."""
+        import numpy as np
+        return int(np.count_nonzero(self.available))
+
+    def total_science(self) -> float:
+        """Total remaining science."""
+        return float(self.remaining.sum())
+
+    def sum_by(self, dimension: str) -> Dict[Optional[str], float]:
+        """Remaining science per value of one dimension (available values only)."""
+        import numpy as np
+
+        labels = self.columns.labels[dimension]
+        codes = self.columns.codes[dimension][self.available]
+        sums = np.bincount(codes, weights=self.remaining[self.available],
+                           minlength=len(labels))
+        counts = np.bincount(codes, minlength=len(labels))
+        return {labels[code]: float(sums[code]) for code in np.flatnonzero(counts)}
+
+    def count_by(self, dimension: str) -> Dict[Optional[str], int]:
+        """Number of available experiments per value of one dimension."""
+        import numpy as np
+
+        labels = self.columns.labels[dimension]
+        counts = np.bincount(self.columns.codes[dimension][self.available],
+                             minlength=len(labels))
+        return {labels[code]: int(counts[code]) for code in np.flatnonzero(counts)}
+
+    def to_experiments(self) -> List[AvailableExperiment]:
+        """Materialize available rows as AvailableExperiment, in catalogue order."""
+        import numpy as np
+
+        experiments = self.columns.experiments
+        rows = np.flatnonzero(self.available)
+        remaining = self.remaining[rows].tolist()
+        partial = self.partial[rows].tolist()
+        result = []
+        for row, science, is_partial in zip(rows.tolist(), remaining, partial):
+            possible = experiments[row]
+            result.append(AvailableExperiment(
+                experiment_id=possible.experiment_id,
+                experiment_name=possible.experiment_name,
+                body_name=possible.body_name,
+                available_science=science,
+                is_partial=is_partial
+            ))
+        return result
@@ -0,0 +1,306 @@
+"""Compiled binary snapshot of the generated experiment catalogue."""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .experiment import ExperimentID, PossibleExperiment
+from .experiment_index import ExperimentIndex
+
+
+# Row layout: one uint32 string-table reference per field
+_ROW_FIELDS = 5
+_TYPE, _BODY, _SITUATION, _BIOME, _NAME = range(_ROW_FIELDS)
+_NONE = 0xFFFFFFFF
+
+
+class LazyExperimentList(Sequence):
+    """
+    Read-only experiment sequence backed by snapshot rows.
+
+    A PossibleExperiment is built the first time its position is read and
+    kept afterwards, so opening a snapshot costs nothing per row and code
+    that only touches a filtered subset never builds the rest.
+    """
+
+    def __init__(self, snapshot: 'CatalogueSnapshot'):
+        self._snapshot = snapshot
+        self._built: List[Optional[PossibleExperiment]] = [None] * snapshot.row_count
+
+    def __len__(self) -> int:
+        return len(self._built)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        # Negative and out-of-range positions behave as they do for a list
+        position = range(len(self))[position]
+        item = self._built[position]
+        if item is None:
+            item = self._snapshot.row(position)
+            self._built[position] = item
+        return item
+
+    def __iter__(self):
+        for position in range(len(self._built)):
+            yield self[position]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyExperimentList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+
+class _StoredPostings(Mapping):
+    """
+    Postings of one dimension set, decoded from the snapshot on first use.
+
+    Queries only touch the dimension sets they can use, so the rest of the
+    directory is never decoded.
+    """
+
+    def __init__(self, entries: List[int], width: int, strings: List[str], data):
+        self._entries = entries
+        self._width = width
+        self._strings = strings
+        self._data = data
+        self._decoded: Optional[Dict[tuple, Sequence[int]]] = None
+
+    def _postings(self) -> Dict[tuple, Sequence[int]]:
+        if self._decoded is None:
+            strings = self._strings
+            data = self._data
+            entries = self._entries
+            step = self._width + 2
+            decoded = {}
+            for i in range(0, len(entries), step):
+                value = tuple(None if ref == _NONE else strings[ref]
+                              for ref in entries[i:i + self._width])
+                start, length = entries[i + self._width], entries[i + self._width + 1]
+                decoded[value] = data[start:start + length]
+            self._decoded = decoded
+        return self._decoded
+
+    def __getitem__(self, value):
+        return self._postings()[value]
+
+    def __iter__(self):
+        return iter(self._postings())
+
+    def __len__(self) -> int:
+        return len(self._postings())
+
+
+class CatalogueSnapshot:
+    """
+    Generated catalogue stored as a compact binary file.
+
+    Layout: an 8-byte magic, a uint32 header length, a JSON header (source
+    hash, experiment and body definitions, string table, and a directory of
+    posting lists per dimension set),
+    then two native-endian uint32 arrays - catalogue rows as string-table
+    references, and the ExperimentIndex postings back to back. Both arrays
+    are read as memoryviews over the file bytes, so loading is one read and
+    one JSON decode of the header, whatever the number of rows.
+
+    The snapshot records the hash of the source JSON files it was built
+    from; load returns None when it doesn't match, and the caller rebuilds.
+    """
+
+    MAGIC = b"KSPCAT\x00\x01"
+    VERSION = 1
+
+    def __init__(self, header: dict, rows, postings):
+        """
+        Wrap decoded snapshot parts (use build or load rather than this).
+
+        Args:
+            header: Decoded JSON header
+            rows: uint32 sequence, _ROW_FIELDS entries per row
+            postings: uint32 sequence holding every posting list
+        """
+        self.source_hash: str = header['source_hash']
+        self.experiments: Dict[str, dict] = header['experiments']
+        self.bodies: Dict[str, dict] = header['bodies']
+        self.row_count: int = header['row_count']
+        self._strings: List[str] = header['strings']
+        self._directory: Dict[str, List[int]] = header['postings']
+        self._rows = rows
+        self._posting_data = postings
+        self._header = header
+
+    @staticmethod
+    def source_hash_of(paths: Iterable[Path], extra: str = "") -> str:
+        """
+        Hash the source files a catalogue is generated from.
+
+        Args:
+            paths: Source files
+            extra: Fingerprint of any other input (e.g. mod definitions)
+
+        Raises:
+            OSError: If a source file can't be read
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(CatalogueSnapshot.VERSION).encode('ascii'))
+        digest.update(extra.encode('utf-8'))
+        for path in paths:
+            data = Path(path).read_bytes()
+            digest.update(struct.pack('<Q', len(data)))
+            digest.update(data)
+        return digest.hexdigest()
+
+    @classmethod
+    def build(cls, source_hash: str, experiments: Dict[str, dict],
+              bodies: Dict[str, dict], possible: List[PossibleExperiment],
+              index: ExperimentIndex) -> 'CatalogueSnapshot':
+        """
+        Compile a generated catalogue and its index.
+
+        Args:
+            source_hash: Hash of the source files (see source_hash_of)
+            experiments: Experiment definitions by id
+            bodies: Body definitions by name
+            possible: Generated experiments, in catalogue order
+            index: ExperimentIndex built over possible
+        """
+        strings: List[str] = []
+        string_ids: Dict[str, int] = {}
+
+        def ref(value: Optional[str]) -> int:
+            if value is None:
+                return _NONE
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+            return string_ids[value]
+
+        rows = array('I')
+        for exp in possible:
+            exp_id = exp.experiment_id
+            rows.extend((
+                ref(exp_id.experiment_type), ref(exp.body_name),
+                ref(exp_id.situation), ref(exp_id.biome), ref(exp.experiment_name)
+            ))
+
+        # Directory: "dim,dim" -> flat [value refs..., start, length] per posting
+        posting_data = array('I')
+        directory = {}
+        for dims, postings in index.get_postings().items():
+            entries = directory.setdefault(','.join(dims), [])
+            for value, positions in postings.items():
+                entries.extend(ref(v) for v in value)
+                entries.extend((len(posting_data), len(positions)))
+                posting_data.extend(positions)
+
+        header = {
+            'version': cls.VERSION,
+            'byteorder': sys.byteorder,
+            'source_hash': source_hash,
+            'experiments': experiments,
+            'bodies': bodies,
+            'row_count': len(possible),
+            'strings': strings,
+            'postings': directory,
+        }
+        return cls(header, rows, posting_data)
+
+    def save(self, path: Path):
+        """
+        Write the snapshot atomically.
+
+        Raises:
+            OSError: If the file can't be written
+        """
+        header = json.dumps(self._header).encode('utf-8')
+        # Pad so the arrays start 4-byte aligned
+        header += b' ' * (-(len(self.MAGIC) + 4 + len(header)) % 4)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            f.write(array('I', self._rows).tobytes())
+            f.write(array('I', self._posting_data).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, source_hash: str) -> Optional['CatalogueSnapshot']:
+        """
+        Load a snapshot if it exists and was built from the given sources.
+
+        Returns:
+            CatalogueSnapshot, or None if missing, stale or unreadable
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            if data[:len(cls.MAGIC)] != cls.MAGIC:
+                return None
+            offset = len(cls.MAGIC)
+            (header_len,) = struct.unpack_from('<I', data, offset)
+            offset += 4
+            header = json.loads(data[offset:offset + header_len])
+            offset += header_len
+
+            if (header.get('version') != cls.VERSION or
+                    header.get('byteorder') != sys.byteorder or
+                    header.get('source_hash') != source_hash):
+                return None
+
+            words = memoryview(data)[offset:].cast('I')
+            row_words = header['row_count'] * _ROW_FIELDS
+            if len(words) < row_words:
+                return None
+            return cls(header, words[:row_words], words[row_words:])
+        except (ValueError, KeyError, TypeError, struct.error):
+            return None
+
+    def row(self, position: int) -> PossibleExperiment:
+        """Build the experiment at one catalogue position."""
+        start = position * _ROW_FIELDS
+        fields = self._rows[start:start + _ROW_FIELDS]
+        strings = self._strings
+        biome = fields[_BIOME]
+        return PossibleExperiment(
+            experiment_id=ExperimentID(
+                strings[fields[_TYPE]], strings[fields[_BODY]],
+                strings[fields[_SITUATION]],
+                None if biome == _NONE else strings[biome]
+            ),
+            experiment_name=strings[fields[_NAME]],
+            body_name=strings[fields[_BODY]]
+        )
+
+    def experiments_list(self) -> LazyExperimentList:
+        """Get the catalogue as a lazily built sequence."""
+        return LazyExperimentList(self)
+
+    def index(self, items: Sequence) -> ExperimentIndex:
+        """
+        Get an ExperimentIndex over items from the stored postings.
+
+        Args:
+            items: The catalogue sequence (normally experiments_list())
+        """
+        postings = {
+            tuple(dims.split(',')): _StoredPostings(
+                entries, dims.count(',') + 1, self._strings, self._posting_data
+            )
+            for dims, entries in self._directory.items()
+        }
+        return ExperimentIndex.from_postings(items, postings)
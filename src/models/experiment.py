@@ -2,22 +2,73 @@
 
 import re
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+# Known situations (order matters for ID parsing - first match wins)
+SITUATIONS = (
+    'SrfSplashed', 'SrfLanded',  # Surface situations
+    'FlyingLow', 'FlyingHigh',    # Flying situations
+    'InSpaceLow', 'InSpaceHigh'   # Space situations
+)
+
+# Display names of situations
+SITUATION_LABELS = {
+    'SrfLanded': 'Surface (Landed)',
+    'SrfSplashed': 'Surface (Splashed)',
+    'FlyingLow': 'Flying (Low)',
+    'FlyingHigh': 'Flying (High)',
+    'InSpaceLow': 'Space (Low)',
+    'InSpaceHigh': 'Space (High)',
+}
 
 
-@dataclass
 class ExperimentID:
-    """Represents a unique science experiment identifier."""
+    """
+    Represents a unique science experiment identifier.
+
+    Instances are interned: constructing an ExperimentID with fields that
+    already exist returns the existing object from a process-wide registry.
+    ScienceDatabase and ScienceExtractor therefore share instances, so most
+    dictionary lookups succeed on the identity check, and the KSP id string
+    and its hash are computed once per subject rather than on every lookup.
+    Instances are immutable.
+    """
+
+    __slots__ = ('experiment_type', 'body', 'situation', 'biome', '_key', '_hash')
+
+    # (experiment_type, body, situation, biome) -> shared instance
+    _registry: Dict[Tuple[str, str, str, Optional[str]], 'ExperimentID'] = {}
+
+    def __new__(cls, experiment_type: str, body: str, situation: str,
+                biome: Optional[str] = None) -> 'ExperimentID':
+        biome = biome or None
+        fields = (experiment_type, body, situation, biome)
+        instance = cls._registry.get(fields)
+        if instance is not None:
+            return instance
+
+        instance = object.__new__(cls)
+        set_field = object.__setattr__
+        set_field(instance, 'experiment_type', experiment_type)
+        set_field(instance, 'body', body)
+        set_field(instance, 'situation', situation)
+        set_field(instance, 'biome', biome)
+        key = f"{experiment_type}@{body}{situation}{biome or ''}"
+        set_field(instance, '_key', key)
+        set_field(instance, '_hash', hash(key))
+
+        # setdefault keeps a single instance if two threads race here
+        return cls._registry.setdefault(fields, instance)
 
-    experiment_type: str
-    body: str
-    situation: str
-    biome: Optional[str] = None
+    @classmethod
+    def registry_size(cls) -> int:
+        """Get number of interned experiment IDs."""
+        return len(cls._registry)
 
     def to_ksp_id(self) -> str:
         """Convert to KSP save file format: experimentType@bodySituationBiome"""
-        biome_part = self.biome if self.biome else ""
-        return f"{self.experiment_type}@{self.body}{self.situation}{biome_part}"
+        return self._key
 
     @classmethod
     def from_ksp_id(cls, ksp_id: str) -> 'ExperimentID':
@@ -36,20 +87,13 @@ class ExperimentID:
 
         experiment_type, location = ksp_id.split('@', 1)
 
-        # Known situations (order matters - match longer strings first)
-        situations = [
-            'SrfSplashed', 'SrfLanded',  # Surface situations
-            'FlyingLow', 'FlyingHigh',    # Flying situations
-            'InSpaceLow', 'InSpaceHigh'   # Space situations
-        ]
-
         # Find which situation is in the location string
         situation_found = None
         situation_start = -1
 
-        for situation in situations:
-            if situation in location:
-                situation_start = location.index(situation)
+        for situation in SITUATIONS:
+            situation_start = location.find(situation)
+            if situation_start >= 0:
                 situation_found = situation
                 break
 
@@ -80,13 +124,29 @@ class ExperimentID:
         biome_str = f" ({self.biome})" if self.biome else ""
         return f"{self.experiment_type} at {self.body} {self.situation}{biome_str}"
 
+    def __repr__(self) -> str:
+        return (f"ExperimentID(experiment_type={self.experiment_type!r}, body={self.body!r}, "
+                f"situation={self.situation!r}, biome={self.biome!r})")
+
     def __hash__(self) -> int:
-        return hash(self.to_ksp_id())
+        return self._hash
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ExperimentID):
             return False
-        return self.to_ksp_id() == other.to_ksp_id()
+        return self._key == other._key
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ExperimentID is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ExperimentID is immutable")
+
+    def __reduce__(self):
+        # Re-intern on unpickle/copy instead of copying slots
+        return (ExperimentID, (self.experiment_type, self.body, self.situation, self.biome))
 
 
 @dataclass
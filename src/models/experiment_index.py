@@ -0,0 +1,130 @@
+"""Secondary indexes over experiment lists."""
+
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class ExperimentIndex:
+    """
+    Multi-key index over experiments by body, type, situation and biome.
+
+    Works on any sequence of items with experiment_id and body_name
+    attributes (PossibleExperiment, AvailableExperiment). Postings are lists
+    of positions into the sequence, in sequence order, kept for every single
+    dimension and every pair of dimensions. A query starts from the shortest
+    applicable posting and checks the remaining criteria on those items only,
+    so its cost follows the size of the result rather than the whole list.
+    """
+
+    DIMENSIONS = ('body', 'experiment_type', 'situation', 'biome')
+
+    def __init__(self, items: Sequence):
+        """
+        Build indexes over items.
+
+        Args:
+            items: Sequence of experiments; must not be modified afterwards
+        """
+        self.items = items
+        self._postings: Dict[Tuple[str, ...], Dict[tuple, List[int]]] = {}
+
+        dimension_sets = [(dim,) for dim in self.DIMENSIONS]
+        dimension_sets += list(combinations(self.DIMENSIONS, 2))
+        for dims in dimension_sets:
+            self._postings[dims] = {}
+
+        for position, item in enumerate(items):
+            keys = self._item_keys(item)
+            for dims, postings in self._postings.items():
+                value = tuple(keys[dim] for dim in dims)
+                postings.setdefault(value, []).append(position)
+
+    @classmethod
+    def from_postings(cls, items: Sequence,
+                      postings: Dict[Tuple[str, ...], Dict[tuple, Sequence[int]]]
+                      ) -> 'ExperimentIndex':
+        """
+        Wrap previously built postings without scanning items.
+
+        Args:
+            items: Sequence the postings refer to
+            postings: Postings as returned by get_postings (any integer
+                     sequences will do, e.g. memoryviews)
+        """
+        index = cls.__new__(cls)
+        index.items = items
+        index._postings = postings
+        return index
+
+    def get_postings(self) -> Dict[Tuple[str, ...], Dict[tuple, List[int]]]:
+        """Get the postings: dimensions -> value tuple -> positions."""
+        return self._postings
+
+    @staticmethod
+    def _item_keys(item) -> Dict[str, Optional[str]]:
+        """Get the indexed values of one item."""
+        exp_id = item.experiment_id
+        return {
+            'body': item.body_name,
+            'experiment_type': exp_id.experiment_type,
+            'situation': exp_id.situation,
+            'biome': exp_id.biome,
+        }
+
+    def positions(self, body: Optional[str] = None,
+                  experiment_type: Optional[str] = None,
+                  situation: Optional[str] = None,
+                  biome: Optional[str] = None) -> List[int]:
+        """
+        Get positions of items matching every given criterion.
+
+        None means "any". Positions are in item order.
+        """
+        criteria = {
+            dim: value for dim, value in (
+                ('body', body), ('experiment_type', experiment_type),
+                ('situation', situation), ('biome', biome)
+            ) if value is not None
+        }
+        if not criteria:
+            return list(range(len(self.items)))
+
+        # Shortest posting among single and pair indexes the query can use
+        candidates = None
+        for dims, postings in self._postings.items():
+            if all(dim in criteria for dim in dims):
+                posting = postings.get(tuple(criteria[dim] for dim in dims), [])
+                if candidates is None or len(posting) < len(candidates[1]):
+                    candidates = (dims, posting)
+
+        dims, posting = candidates
+        remaining = [(dim, value) for dim, value in criteria.items() if dim not in dims]
+        if not remaining:
+            return list(posting)
+
+        items = self.items
+        item_keys = self._item_keys
+        return [
+            position for position in posting
+            if all(item_keys(items[position])[dim] == value for dim, value in remaining)
+        ]
+
+    def query(self, body: Optional[str] = None,
+              experiment_type: Optional[str] = None,
+              situation: Optional[str] = None,
+              biome: Optional[str] = None) -> list:
+        """Get items matching every given criterion (None means "any")."""
+        items = self.items
+        return [items[position] for position in
+                self.positions(body, experiment_type, situation, biome)]
+
+    def count(self, body: Optional[str] = None,
+              experiment_type: Optional[str] = None,
+              situation: Optional[str] = None,
+              biome: Optional[str] = None) -> int:
+        """Count items matching every given criterion."""
+        return len(self.positions(body, experiment_type, situation, biome))
+
+    def values(self, dimension: str) -> List[str]:
+        """Get the distinct values of one dimension, sorted (None excluded)."""
+        return sorted(value for (value,) in self._postings[(dimension,)] if value is not None)
@@ -0,0 +1,81 @@
+"""Decoder for KSP science ids backed by known bodies and biomes."""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from .experiment import ExperimentID, SITUATIONS
+
+
+class KspIdDecoder:
+    """
+    Decodes KSP science ids using the catalogue's bodies, situations and biomes.
+
+    ExperimentID.from_ksp_id has to guess where the body ends, because ids
+    have no delimiters. This decoder compiles one regex from the known body
+    names (longest first) and situations, so the body is always one the
+    catalogue knows, and checks what follows the situation against that
+    body's biomes. Ids whose body, situation or biome is unknown fall back
+    to from_ksp_id. Results are memoized in an LRU cache.
+    """
+
+    DEFAULT_CACHE_SIZE = 8192
+
+    def __init__(self, bodies: Dict[str, dict], cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize decoder.
+
+        Args:
+            bodies: Body name -> body data (with a 'biomes' list), as in
+                   ScienceDatabase.bodies
+            cache_size: Maximum number of memoized ids
+        """
+        self.biomes = {name: frozenset(data.get('biomes', ())) for name, data in bodies.items()}
+
+        body_names = sorted(bodies, key=len, reverse=True)
+        situations = sorted(SITUATIONS, key=len, reverse=True)
+        self._pattern = re.compile(
+            r'(?P<type>[^@]+)@'
+            r'(?P<body>' + '|'.join(map(re.escape, body_names)) + r')'
+            r'(?P<situation>' + '|'.join(situations) + r')'
+            r'(?P<biome>.*)',
+            re.DOTALL
+        ) if body_names else None
+
+        self.decode = lru_cache(maxsize=cache_size)(self._decode)
+
+    def _decode(self, ksp_id: str) -> ExperimentID:
+        """
+        Decode one id (memoized via decode).
+
+        Raises:
+            ValueError: If the id cannot be parsed at all
+        """
+        match = self._pattern.fullmatch(ksp_id) if self._pattern else None
+        if match is None:
+            return ExperimentID.from_ksp_id(ksp_id)
+
+        body, biome = match.group('body'), match.group('biome')
+        if biome and biome not in self.biomes[body]:
+            # A biome the catalogue doesn't list (KSC sub-biomes, mods)
+            return ExperimentID.from_ksp_id(ksp_id)
+
+        return ExperimentID(match.group('type'), body, match.group('situation'), biome or None)
+
+    def decode_many(self, ksp_ids: Iterable[str]) -> List[ExperimentID]:
+        """
+        Decode a batch of ids (used for a save's R&D science and cached saves).
+
+        Raises:
+            ValueError: If any id cannot be parsed
+        """
+        decode = self.decode
+        return [decode(ksp_id) for ksp_id in ksp_ids]
+
+    def is_known_biome(self, exp_id: ExperimentID) -> bool:
+        """Check whether an id's biome is one the catalogue lists for its body."""
+        return exp_id.biome is None or exp_id.biome in self.biomes.get(exp_id.body, ())
+
+    def cache_info(self):
+        """Get memo statistics (functools cache_info)."""
+        return self.decode.cache_info()
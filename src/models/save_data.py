@@ -1,6 +1,6 @@
 """Save game data model."""
 
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
 from .experiment import ExperimentID, CompletedExperiment
 
 
@@ -16,6 +16,8 @@ class SaveGameData:
         """
         self.save_name = save_name
         self.completed_experiments: Dict[ExperimentID, CompletedExperiment] = {}
+        # Modification time of the save file, taken before it was read
+        self.written_at: Optional[float] = None
 
     def add_completed_experiment(self, experiment: CompletedExperiment):
         """Add a completed experiment to the save data."""
@@ -45,3 +47,42 @@ class SaveGameData:
     def get_all_completed_experiments(self) -> List[CompletedExperiment]:
         """Get list of all completed experiments."""
         return list(self.completed_experiments.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            'save_name': self.save_name,
+            'experiments': [
+                [exp.experiment_id.to_ksp_id(), exp.science_earned, exp.science_cap]
+                for exp in self.completed_experiments.values()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], decoder=None) -> 'SaveGameData':
+        """
+        Rebuild save data from a dictionary produced by to_dict.
+
+        Args:
+            data: Dictionary from to_dict
+            decoder: Optional KspIdDecoder; defaults to ExperimentID.from_ksp_id
+
+        Raises:
+            ValueError: If an experiment ID cannot be parsed
+            KeyError: If a required field is missing
+        """
+        experiments = data['experiments']
+        ksp_ids = [entry[0] for entry in experiments]
+        if decoder is not None:
+            exp_ids = decoder.decode_many(ksp_ids)
+        else:
+            exp_ids = [ExperimentID.from_ksp_id(ksp_id) for ksp_id in ksp_ids]
+
+        save_data = cls(save_name=data.get('save_name', ""))
+        for exp_id, (_, science_earned, science_cap) in zip(exp_ids, experiments):
+            save_data.add_completed_experiment(CompletedExperiment(
+                experiment_id=exp_id,
+                science_earned=float(science_earned),
+                science_cap=float(science_cap)
+            ))
+        return save_data
@@ -0,0 +1,64 @@
+"""Differences between two loads of the same save."""
+
+from dataclasses import dataclass, field
+from typing import List, Set, Tuple
+
+from .experiment import CompletedExperiment, ExperimentID
+from .save_data import SaveGameData
+
+
+@dataclass
+class SaveDelta:
+    """Science subjects that differ between two SaveGameData snapshots."""
+
+    added: List[CompletedExperiment] = field(default_factory=list)
+    changed: List[Tuple[CompletedExperiment, CompletedExperiment]] = field(default_factory=list)
+    removed: List[CompletedExperiment] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Check whether the snapshots have the same science."""
+        return not (self.added or self.changed or self.removed)
+
+    def affected_ids(self) -> Set[ExperimentID]:
+        """Ids of every added, changed or removed subject."""
+        ids = {exp.experiment_id for exp in self.added}
+        ids.update(new.experiment_id for _, new in self.changed)
+        ids.update(exp.experiment_id for exp in self.removed)
+        return ids
+
+    def earned_science_change(self) -> float:
+        """Change in total science earned."""
+        return (sum(exp.science_earned for exp in self.added) +
+                sum(new.science_earned - old.science_earned for old, new in self.changed) -
+                sum(exp.science_earned for exp in self.removed))
+
+
+def diff_saves(previous: SaveGameData, current: SaveGameData) -> SaveDelta:
+    """
+    Compare two snapshots of a save's completed science.
+
+    Args:
+        previous: Earlier snapshot
+        current: Later snapshot
+
+    Returns:
+        SaveDelta; changed holds (previous, current) pairs whose earned
+        science or cap differ
+    """
+    before = previous.completed_experiments
+    after = current.completed_experiments
+    delta = SaveDelta()
+
+    for exp_id, new in after.items():
+        old = before.get(exp_id)
+        if old is None:
+            delta.added.append(new)
+        elif (old.science_earned != new.science_earned or
+              old.science_cap != new.science_cap):
+            delta.changed.append((old, new))
+
+    for exp_id, old in before.items():
+        if exp_id not in after:
+            delta.removed.append(old)
+
+    return delta
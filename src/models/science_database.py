@@ -1,23 +1,42 @@
 """Science database that generates all possible experiments."""
 
+import hashlib
 import json
 import os
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Sequence, Set
 from pathlib import Path
 
 from .experiment import ExperimentID, PossibleExperiment
+from .ksp_id_decoder import KspIdDecoder
+from .search_index import SearchIndex
+from .experiment_index import ExperimentIndex
+from .catalogue_snapshot import CatalogueSnapshot
+from utils.config import CACHE_DIR
 
 
 class ScienceDatabase:
     """Manages all possible science experiments in KSP."""
 
-    def __init__(self, data_dir: str = None):
+    SOURCE_FILES = ("experiments.json", "celestial_bodies.json")
+
+    def __init__(self, data_dir: str = None, snapshot_dir: str = None,
+                 use_snapshot: bool = True, mod_data: Optional[dict] = None):
         """
         Initialize science database from JSON files.
 
+        The generated catalogue is kept as a compiled snapshot keyed on a
+        hash of the JSON files. When the snapshot is current, startup reads
+        it instead of regenerating, and experiments are built lazily; when
+        the JSON changes the snapshot is rebuilt.
+
         Args:
             data_dir: Path to data directory containing JSON files.
                      Defaults to project data/ directory.
+            snapshot_dir: Directory for catalogue snapshots.
+                         Defaults to CACHE_DIR/catalogue.
+            use_snapshot: Whether to use (and maintain) the snapshot
+            mod_data: Extra definitions merged over the JSON data, as
+                     returned by GameDataLoader.load
         """
         if data_dir is None:
             # Default to data/ directory relative to this file
@@ -25,12 +44,61 @@ class ScienceDatabase:
             data_dir = project_root / "data"
 
         self.data_dir = Path(data_dir)
+        self.mod_data = mod_data
         self.experiments: Dict[str, dict] = {}
         self.bodies: Dict[str, dict] = {}
-        self._possible_experiments: List[PossibleExperiment] = []
+        self._possible_experiments: Sequence[PossibleExperiment] = []
+        self._id_decoder: Optional[KspIdDecoder] = None
+        self._search_index: Optional[SearchIndex] = None
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir else CACHE_DIR / "catalogue"
+        self.use_snapshot = use_snapshot
+        self.loaded_from_snapshot = False
+        # Hash of the definitions the catalogue is generated from
+        self.source_hash = CatalogueSnapshot.source_hash_of(
+            (self.data_dir / name for name in self.SOURCE_FILES),
+            extra=self.mod_data['fingerprint'] if self.mod_data else ""
+        )
+
+        if use_snapshot:
+            self._load_catalogue()
+        else:
+            self._load_data()
+            self._generate_experiments()
+            self.index = ExperimentIndex(self._possible_experiments)
+
+    def _snapshot_path(self) -> Path:
+        """Snapshot file for this data directory and mod source."""
+        source = str(self.data_dir.resolve())
+        if self.mod_data:
+            source += "|" + self.mod_data.get('source', '')
+        key = hashlib.sha1(os.path.normcase(source).encode('utf-8'))
+        return self.snapshot_dir / f"{key.hexdigest()[:16]}.bin"
+
+    def _load_catalogue(self):
+        """Load the catalogue from a current snapshot, or generate and save one."""
+        source_hash = self.source_hash
+        snapshot_path = self._snapshot_path()
+
+        snapshot = CatalogueSnapshot.load(snapshot_path, source_hash)
+        if snapshot is not None:
+            self.experiments = snapshot.experiments
+            self.bodies = snapshot.bodies
+            self._possible_experiments = snapshot.experiments_list()
+            self.index = snapshot.index(self._possible_experiments)
+            self.loaded_from_snapshot = True
+            return
 
         self._load_data()
         self._generate_experiments()
+        self.index = ExperimentIndex(self._possible_experiments)
+        try:
+            CatalogueSnapshot.build(
+                source_hash, self.experiments, self.bodies,
+                self._possible_experiments, self.index
+            ).save(snapshot_path)
+        except OSError as e:
+            # The snapshot only speeds up the next start
+            print(f"Warning: Could not save catalogue snapshot: {e}")
 
     def _load_data(self):
         """Load experiment and celestial body data from JSON files."""
@@ -48,6 +116,50 @@ class ScienceDatabase:
             for body in data['bodies']:
                 self.bodies[body['name']] = body
 
+        if self.mod_data:
+            self._merge_mod_data(self.mod_data)
+
+    @staticmethod
+    def _body_situations(body: dict) -> List[str]:
+        """Situations possible at a body with the given atmosphere/ocean."""
+        situations = ["SrfLanded"]
+        if body.get('has_ocean'):
+            situations.append("SrfSplashed")
+        if body.get('has_atmosphere'):
+            situations += ["FlyingLow", "FlyingHigh"]
+        return situations + ["InSpaceLow", "InSpaceHigh"]
+
+    def _merge_mod_data(self, mod_data: dict):
+        """
+        Merge mod experiment and body definitions over the JSON data.
+
+        Definitions update existing entries field by field. A new body
+        starts from its Kopernicus template body, if known; its situations
+        follow from whether it has an atmosphere and ocean.
+        """
+        for exp in mod_data.get('experiments', []):
+            merged = {'name': exp['id'], 'requires_biome': False, 'situations': []}
+            merged.update(self.experiments.get(exp['id'], {}))
+            merged.update(exp)
+            self.experiments[exp['id']] = merged
+
+        for body in mod_data.get('bodies', []):
+            existing = self.bodies.get(body['name'])
+            if existing is None:
+                template = self.bodies.get(body.get('template'), {})
+                merged = {
+                    'has_atmosphere': template.get('has_atmosphere', False),
+                    'has_ocean': template.get('has_ocean', False),
+                    'biomes': list(template.get('biomes', [])),
+                }
+            else:
+                merged = dict(existing)
+            merged.update(body)
+            merged.pop('template', None)
+            if existing is None or 'has_atmosphere' in body or 'has_ocean' in body:
+                merged['situations'] = self._body_situations(merged)
+            self.bodies[body['name']] = merged
+
     def _generate_experiments(self):
         """Generate all valid experiment combinations."""
         self._possible_experiments = []
@@ -58,6 +170,10 @@ class ScienceDatabase:
                 if exp_id == "asteroidSample" and body_name != "Sun":
                     continue
 
+                # Skip atmosphere-only experiments on airless bodies
+                if exp_data.get('requires_atmosphere') and not body_data.get('has_atmosphere'):
+                    continue
+
                 # Get valid situations for this body
                 valid_situations = set(body_data['situations'])
                 exp_situations = set(exp_data['situations'])
@@ -65,8 +181,15 @@ class ScienceDatabase:
                 # Only use situations valid for both experiment and body
                 available_situations = valid_situations & exp_situations
 
+                # Situations where results are per biome (definitions loaded
+                # from GameData say so per situation)
+                biome_situations = set(exp_data.get(
+                    'biome_situations',
+                    exp_situations if exp_data['requires_biome'] else ()
+                ))
+
                 for situation in available_situations:
-                    if exp_data['requires_biome'] and body_data['biomes']:
+                    if situation in biome_situations and body_data['biomes']:
                         # Generate experiment for each biome
                         for biome in body_data['biomes']:
                             exp_id_obj = ExperimentID(
@@ -98,19 +221,28 @@ class ScienceDatabase:
                             )
                         )
 
-    def get_all_experiments(self) -> List[PossibleExperiment]:
-        """Get list of all possible experiments."""
+    def get_all_experiments(self) -> Sequence[PossibleExperiment]:
+        """Get all possible experiments, in catalogue order."""
         return self._possible_experiments
 
     def get_experiments_by_body(self, body_name: str) -> List[PossibleExperiment]:
         """Get all possible experiments for a specific celestial body."""
-        return [exp for exp in self._possible_experiments
-                if exp.body_name == body_name]
+        return self.index.query(body=body_name)
 
     def get_experiments_by_type(self, experiment_type: str) -> List[PossibleExperiment]:
         """Get all possible experiments of a specific type."""
-        return [exp for exp in self._possible_experiments
-                if exp.experiment_id.experiment_type == experiment_type]
+        return self.index.query(experiment_type=experiment_type)
+
+    def query_experiments(self, body: Optional[str] = None,
+                          experiment_type: Optional[str] = None,
+                          situation: Optional[str] = None,
+                          biome: Optional[str] = None) -> List[PossibleExperiment]:
+        """
+        Get possible experiments matching every given criterion.
+
+        None means "any"; results are in catalogue order.
+        """
+        return self.index.query(body, experiment_type, situation, biome)
 
     def get_body_names(self) -> List[str]:
         """Get list of all celestial body names."""
@@ -133,6 +265,18 @@ class ScienceDatabase:
             "InSpaceLow", "InSpaceHigh"
         ]
 
+    def get_id_decoder(self) -> KspIdDecoder:
+        """Get a KSP id decoder compiled from this database's bodies."""
+        if self._id_decoder is None:
+            self._id_decoder = KspIdDecoder(self.bodies)
+        return self._id_decoder
+
+    def get_search_index(self) -> SearchIndex:
+        """Get a free-text search index over this database's catalogue."""
+        if self._search_index is None:
+            self._search_index = SearchIndex.from_database(self)
+        return self._search_index
+
     def get_total_experiment_count(self) -> int:
         """Get total number of possible experiments."""
         return len(self._possible_experiments)
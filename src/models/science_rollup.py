@@ -0,0 +1,155 @@
+"""Hierarchical aggregates of available science."""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .experiment import AvailableExperiment
+
+
+# Group key for experiments without a biome in modes with a biome level
+NO_BIOME = "No Biome"
+
+# Remaining science at or below this counts as completed (floating point)
+COMPLETED_THRESHOLD = 0.1
+
+
+class Aggregate:
+    """Totals for one group of experiments."""
+
+    __slots__ = ('total', 'count', 'completed')
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+        self.completed = 0
+
+    def add(self, exp: AvailableExperiment, sign: int = 1):
+        """Add (sign=1) or subtract (sign=-1) one experiment."""
+        self.total += sign * exp.available_science
+        self.count += sign
+        if exp.available_science <= COMPLETED_THRESHOLD:
+            self.completed += sign
+
+
+class ScienceRollup:
+    """
+    Totals, counts and completion for every group prefix, in one pass.
+
+    A grouping mode is a hierarchy of levels (see MODES). Each experiment
+    is added to the aggregate of every prefix of its key path in each
+    mode, plus an overall aggregate, so building costs one pass over the
+    experiments and every group total is then a lookup. Experiments can be
+    added and removed afterwards to follow incremental changes.
+    """
+
+    MODES: Dict[str, Tuple[str, ...]] = {
+        'Body': ('body', 'situation', 'biome'),
+        'Experiment': ('experiment', 'body', 'situation'),
+        'Situation': ('situation', 'body', 'biome'),
+    }
+
+    def __init__(self, experiments: Iterable[AvailableExperiment] = (),
+                 modes: Optional[Sequence[str]] = None):
+        """
+        Build aggregates.
+
+        Args:
+            experiments: Available experiments
+            modes: Grouping modes to aggregate (keys of MODES). Defaults to
+                  all; an empty sequence keeps only the overall totals.
+        """
+        self.modes = tuple(self.MODES if modes is None else modes)
+        self.root = Aggregate()
+        self._aggregates: Dict[str, Dict[tuple, Aggregate]] = {m: {} for m in self.modes}
+        self._children: Dict[str, Dict[tuple, set]] = {m: {} for m in self.modes}
+        self._members: Dict[str, Dict[tuple, List[AvailableExperiment]]] = {m: {} for m in self.modes}
+
+        for exp in experiments:
+            self.add(exp)
+
+    @classmethod
+    def key_path(cls, mode: str, exp: AvailableExperiment) -> tuple:
+        """Group keys of an experiment in one mode, outermost first."""
+        exp_id = exp.experiment_id
+        if mode == 'Body':
+            return (exp.body_name, exp_id.situation, exp_id.biome or NO_BIOME)
+        if mode == 'Experiment':
+            return (exp.experiment_name, exp.body_name, exp_id.situation)
+        if mode == 'Situation':
+            return (exp_id.situation, exp.body_name, exp_id.biome or NO_BIOME)
+        raise KeyError(mode)
+
+    def add(self, exp: AvailableExperiment):
+        """Add an experiment to every aggregate it belongs to."""
+        science = exp.available_science
+        completed = science <= COMPLETED_THRESHOLD
+        root = self.root
+        root.total += science
+        root.count += 1
+        root.completed += completed
+        for mode in self.modes:
+            path = self.key_path(mode, exp)
+            aggregates = self._aggregates[mode]
+            for depth in (1, 2, 3):
+                prefix = path[:depth]
+                aggregate = aggregates.get(prefix)
+                if aggregate is None:
+                    aggregate = aggregates[prefix] = Aggregate()
+                    self._children[mode].setdefault(path[:depth - 1], set()).add(path[depth - 1])
+                # Inlined Aggregate.add - this loop runs for every experiment
+                aggregate.total += science
+                aggregate.count += 1
+                aggregate.completed += completed
+            self._members[mode].setdefault(path, []).append(exp)
+
+    def remove(self, exp: AvailableExperiment):
+        """
+        Remove an experiment previously added.
+
+        Groups left empty are dropped.
+
+        Raises:
+            ValueError: If the experiment was not added
+        """
+        for mode in self.modes:
+            path = self.key_path(mode, exp)
+            members = self._members[mode].get(path)
+            if not members or exp not in members:
+                raise ValueError(f"Not in rollup: {exp}")
+            members.remove(exp)
+            if not members:
+                del self._members[mode][path]
+
+            aggregates = self._aggregates[mode]
+            for depth in range(len(path), 0, -1):
+                prefix = path[:depth]
+                aggregate = aggregates[prefix]
+                aggregate.add(exp, -1)
+                if aggregate.count == 0:
+                    del aggregates[prefix]
+                    self._children[mode].pop(prefix, None)
+                    siblings = self._children[mode][path[:depth - 1]]
+                    siblings.discard(path[depth - 1])
+                    if not siblings and depth > 1:
+                        del self._children[mode][path[:depth - 1]]
+        self.root.add(exp, -1)
+
+    def get(self, mode: str, prefix: tuple = ()) -> Optional[Aggregate]:
+        """Get the aggregate of a group (the overall one for an empty prefix)."""
+        if not prefix:
+            return self.root
+        return self._aggregates[mode].get(prefix)
+
+    def children(self, mode: str, prefix: tuple = ()) -> List[str]:
+        """Get the sorted keys of a group's subgroups."""
+        return sorted(self._children[mode].get(prefix, ()))
+
+    def members(self, mode: str, path: tuple) -> List[AvailableExperiment]:
+        """Get the experiments in a full-depth group."""
+        return list(self._members[mode].get(path, ()))
+
+    def totals(self, mode: str, level: int = 0) -> Dict[tuple, Aggregate]:
+        """Get the aggregates of every group at one depth (0 = outermost)."""
+        return {
+            prefix: aggregate for prefix, aggregate in self._aggregates[mode].items()
+            if len(prefix) == level + 1
+        }
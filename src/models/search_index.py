@@ -0,0 +1,186 @@
+"""Free-text search over experiments."""
+
+import re
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set
+
+from .experiment import SITUATION_LABELS
+from .experiment_index import ExperimentIndex
+
+
+_WORD = re.compile(r'[A-Za-z0-9]+')
+# Words within CamelCase labels (NorthwestCrater, SrfLanded)
+_CAMEL_WORD = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+
+def label_tokens(label: str) -> Set[str]:
+    """
+    Lowercase tokens of a label.
+
+    Every word, every CamelCase part of a word and the whole label without
+    separators, so "Northwest Crater", "NorthwestCrater" and "northwestcr"
+    all find it by prefix.
+    """
+    tokens = set()
+    words = _WORD.findall(label)
+    for word in words:
+        tokens.add(word.lower())
+        tokens.update(part.lower() for part in _CAMEL_WORD.findall(word))
+    if words:
+        tokens.add("".join(words).lower())
+    return tokens
+
+
+def query_words(text: str) -> List[str]:
+    """Lowercase words of a search query."""
+    return [word.lower() for word in _WORD.findall(text)]
+
+
+class SearchIndex:
+    """
+    Prefix index over the values of each experiment dimension.
+
+    Experiments are searched through their body, experiment type (id and
+    name), situation (id and display name) and biome. Those dimensions have
+    only a few hundred distinct values even in a modded catalogue, so the
+    index maps every prefix of every value token to the values it matches,
+    and a query word costs one dictionary lookup. Rows are then taken from
+    the single-dimension postings of an ExperimentIndex, starting from the
+    most selective word, so one SearchIndex per catalogue serves the
+    catalogue and any save's available experiments alike.
+
+    Every query word must prefix-match a token of some dimension of a row.
+    """
+
+    # Check remaining terms per candidate when their postings are this many
+    # times larger than the candidate set
+    CHECK_RATIO = 8
+
+    def __init__(self, labels: Dict[str, Dict[str, Iterable[str]]]):
+        """
+        Build index.
+
+        Args:
+            labels: dimension -> value -> searchable labels of that value
+        """
+        # prefix -> dimension -> values with a token starting with it
+        self._prefixes: Dict[str, Dict[str, Set[str]]] = {}
+        for dim, values in labels.items():
+            for value, value_labels in values.items():
+                tokens = set()
+                for label in value_labels:
+                    tokens |= label_tokens(label)
+                for token in tokens:
+                    for end in range(1, len(token) + 1):
+                        self._prefixes.setdefault(token[:end], {}).setdefault(dim, set()).add(value)
+
+    @classmethod
+    def from_database(cls, science_db) -> 'SearchIndex':
+        """Build an index over a ScienceDatabase's catalogue."""
+        index = science_db.index
+        return cls({
+            'body': {body: [body] for body in index.values('body')},
+            'experiment_type': {
+                exp_type: [exp_type, science_db.get_experiment_name(exp_type)]
+                for exp_type in index.values('experiment_type')
+            },
+            'situation': {
+                situation: [situation, SITUATION_LABELS.get(situation, situation)]
+                for situation in index.values('situation')
+            },
+            'biome': {biome: [biome] for biome in index.values('biome')},
+        })
+
+    @classmethod
+    def from_experiments(cls, items: Iterable) -> 'SearchIndex':
+        """
+        Build an index over the values of some experiments.
+
+        For searching before the catalogue is loaded; experiment names come
+        from the items themselves.
+        """
+        labels: Dict[str, Dict[str, List[str]]] = {
+            'body': {}, 'experiment_type': {}, 'situation': {}, 'biome': {}
+        }
+        for item in items:
+            exp_id = item.experiment_id
+            labels['body'][item.body_name] = [item.body_name]
+            labels['experiment_type'][exp_id.experiment_type] = [
+                exp_id.experiment_type, item.experiment_name
+            ]
+            labels['situation'][exp_id.situation] = [
+                exp_id.situation, SITUATION_LABELS.get(exp_id.situation, exp_id.situation)
+            ]
+            if exp_id.biome:
+                labels['biome'][exp_id.biome] = [exp_id.biome]
+        return cls(labels)
+
+    def match(self, word: str) -> Dict[str, Set[str]]:
+        """Get dimension -> values matching one query word (empty if none)."""
+        return self._prefixes.get(word.lower(), {})
+
+    def positions(self, text: str, index: ExperimentIndex,
+                  body: Optional[str] = None,
+                  experiment_type: Optional[str] = None) -> List[int]:
+        """
+        Get positions of items in index matching a query and filters.
+
+        Args:
+            text: Search query; an empty query matches everything
+            index: Index over the items to search
+            body: Exact body filter (None means "any")
+            experiment_type: Exact experiment type filter (None means "any")
+
+        Returns:
+            Positions in item order
+        """
+        terms = [self.match(word) for word in query_words(text)]
+        for dim, value in (('body', body), ('experiment_type', experiment_type)):
+            if value is not None:
+                terms.append({dim: {value}})
+        if not terms:
+            return list(range(len(index.items)))
+        if not all(terms):
+            return []
+
+        postings = index.get_postings()
+
+        def term_postings(term):
+            return [
+                postings[(dim,)].get((value,), ())
+                for dim, values in term.items() for value in values
+            ]
+
+        # Start from the term with the fewest rows and narrow down
+        sized = sorted((sum(len(p) for p in term_postings(term)), i) for i, term in enumerate(terms))
+        candidates = set(chain.from_iterable(term_postings(terms[sized[0][1]])))
+        items = index.items
+        for size, i in sized[1:]:
+            if not candidates:
+                break
+            term = terms[i]
+            if size > self.CHECK_RATIO * len(candidates):
+                # Few candidates left: checking them beats reading the postings
+                candidates = {p for p in candidates if self._matches(items[p], term)}
+            else:
+                candidates.intersection_update(chain.from_iterable(term_postings(term)))
+        return sorted(candidates)
+
+    def matches(self, text: str, item) -> bool:
+        """Check whether one item matches a query."""
+        return all(self._matches(item, self.match(word)) for word in query_words(text))
+
+    @staticmethod
+    def _matches(item, term: Dict[str, Set[str]]) -> bool:
+        """Check whether an item has a value a term matches."""
+        exp_id = item.experiment_id
+        for dim, values in term.items():
+            value = item.body_name if dim == 'body' else getattr(exp_id, dim)
+            if value in values:
+                return True
+        return False
+
+    def search(self, text: str, index: ExperimentIndex, **filters) -> list:
+        """Get items in index matching a query and filters, in item order."""
+        items = index.items
+        return [items[position] for position in self.positions(text, index, **filters)]
@@ -0,0 +1,70 @@
+"""Cache of filtered, grouped experiment views."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, List
+
+from .experiment import AvailableExperiment
+from .science_rollup import ScienceRollup
+
+
+@dataclass
+class FilteredView:
+    """Experiments matching one filter state, and their grouping."""
+
+    experiments: List[AvailableExperiment]
+    rollup: ScienceRollup
+
+
+class ViewCache:
+    """
+    Bounded LRU of FilteredView keyed on the filter state.
+
+    Keys are the filter values (body, experiment type, show mode, group by)
+    plus the data version, which invalidate() bumps whenever the
+    experiments they were built from change. Views are handed out shared:
+    whoever edits one in place (e.g. ExperimentTree.update_experiments)
+    must do so only for a data change that invalidates the cache.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        """
+        Initialize view cache.
+
+        Args:
+            max_entries: Views kept before the least recently used is dropped
+        """
+        self.max_entries = max_entries
+        self.data_version = 0
+        self.hits = 0
+        self.misses = 0
+        self._views: 'OrderedDict[tuple, FilteredView]' = OrderedDict()
+
+    def get(self, filters: tuple, build: Callable[[], FilteredView]) -> FilteredView:
+        """
+        Get the view for a filter state, building it on a miss.
+
+        Args:
+            filters: Hashable filter values
+            build: Callback returning the view for the current data
+        """
+        key = filters + (self.data_version,)
+        view = self._views.get(key)
+        if view is not None:
+            self.hits += 1
+            self._views.move_to_end(key)
+            return view
+
+        self.misses += 1
+        view = self._views[key] = build()
+        if len(self._views) > self.max_entries:
+            self._views.popitem(last=False)
+        return view
+
+    def invalidate(self):
+        """Forget every view; call when the experiments change."""
+        self.data_version += 1
+        self._views.clear()
+
+    def __len__(self) -> int:
+        return len(self._views)
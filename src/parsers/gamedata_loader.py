@@ -0,0 +1,362 @@
+"""Loader for modded science definitions in a KSP GameData folder."""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from models.experiment import SITUATIONS
+from utils.config import CACHE_DIR
+
+
+# Bit per situation in EXPERIMENT_DEFINITION situationMask/biomeMask
+SITUATION_BITS = {
+    'SrfLanded': 1, 'SrfSplashed': 2, 'FlyingLow': 4,
+    'FlyingHigh': 8, 'InSpaceLow': 16, 'InSpaceHigh': 32,
+}
+
+# Only files mentioning one of these can define experiments or bodies
+_MARKERS = (b'EXPERIMENT_DEFINITION', b'Kopernicus')
+
+# ModuleManager decorations on node names: operator prefix, [filter],
+# :NEEDS[...] / :FOR[...] / :FINAL etc.
+_NODE_NAME = re.compile(r'^[@+$%]?(?P<name>[A-Za-z0-9_]+)(?:\[(?P<filter>[^\]]*)\])?')
+_KEY_NAME = re.compile(r'^[@%]?(?P<key>[A-Za-z0-9_]+)')
+_TOKEN = re.compile(r'[{}]|[^{}]+')
+# Value operators (key *= 2, key += 1, ...) patch an existing value
+_VALUE_OPERATORS = '*+-/^!'
+
+
+def _is_wildcard_patch(name: str) -> bool:
+    """Check whether a node name edits (@/%) every node its filter matches."""
+    match = _NODE_NAME.match(name)
+    node_filter = match.group('filter') if match else None
+    return name[0] in '@%' and bool(node_filter) and any(c in node_filter for c in '*?,')
+
+
+def parse_config_text(text: str) -> List[dict]:
+    """
+    Parse KSP ConfigNode text into nodes.
+
+    Tolerates ModuleManager syntax: operator prefixes and :NEEDS-style
+    suffixes are stripped from names, and a [filter] is kept as 'filter'.
+    Delete (!/-) nodes and values, edits to wildcard or multi-name filters
+    (@NODE[*], @NODE[a,b]) and operator values (key *= 2) are skipped,
+    since they patch other definitions rather than define anything.
+
+    Returns:
+        Top-level nodes as dicts with 'name', 'filter', 'values' (key ->
+        last value) and 'nodes' (child nodes)
+    """
+    root = {'name': '', 'filter': None, 'values': {}, 'nodes': []}
+    stack = [root]
+    skip_depth = 0
+    pending: Optional[str] = None
+
+    for line in text.splitlines():
+        line = line.split('//', 1)[0]
+        for token in _TOKEN.findall(line):
+            token = token.strip()
+            if not token:
+                continue
+            if token == '{':
+                if (skip_depth or pending is None or pending[0] in '!-'
+                        or _is_wildcard_patch(pending)):
+                    skip_depth += 1
+                else:
+                    match = _NODE_NAME.match(pending)
+                    node = {
+                        'name': match.group('name') if match else pending,
+                        'filter': match.group('filter') if match else None,
+                        'values': {},
+                        'nodes': [],
+                    }
+                    stack[-1]['nodes'].append(node)
+                    stack.append(node)
+                pending = None
+            elif token == '}':
+                if skip_depth:
+                    skip_depth -= 1
+                elif len(stack) > 1:
+                    stack.pop()
+                pending = None
+            elif '=' in token:
+                pending = None
+                if skip_depth:
+                    continue
+                key, _, value = token.partition('=')
+                key = key.strip()
+                match = _KEY_NAME.match(key)
+                if match and key[0] not in '!-' and key[-1] not in _VALUE_OPERATORS:
+                    stack[-1]['values'][match.group('key')] = value.strip()
+            else:
+                # Node name; its brace may follow on the next line
+                pending = token
+
+    return root['nodes']
+
+
+def _find_nodes(nodes: List[dict], name: str) -> List[dict]:
+    """Get child nodes with a given name."""
+    return [node for node in nodes if node['name'] == name]
+
+
+def _mask_situations(mask: str) -> List[str]:
+    """Situations set in a situationMask/biomeMask value."""
+    try:
+        bits = int(float(mask))
+    except (ValueError, OverflowError):
+        # Unparseable, or infinite (e.g. "1e400") - no situations
+        return []
+    return [situation for situation in SITUATIONS if bits & SITUATION_BITS[situation]]
+
+
+def _float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _experiment_from_node(node: dict) -> Optional[dict]:
+    """Convert an EXPERIMENT_DEFINITION node to catalogue form."""
+    values = node['values']
+    exp_id = values.get('id') or node['filter']
+    if not exp_id:
+        return None
+
+    experiment = {'id': exp_id}
+    if 'title' in values:
+        experiment['name'] = values['title']
+    if 'situationMask' in values:
+        experiment['situations'] = _mask_situations(values['situationMask'])
+    if 'biomeMask' in values:
+        experiment['biome_situations'] = _mask_situations(values['biomeMask'])
+        experiment['requires_biome'] = bool(experiment['biome_situations'])
+    if 'requireAtmosphere' in values:
+        experiment['requires_atmosphere'] = values['requireAtmosphere'].lower() == 'true'
+    for key, field in (('baseValue', 'base_value'), ('scienceCap', 'science_cap')):
+        number = _float(values.get(key))
+        if number is not None:
+            experiment[field] = number
+    return experiment
+
+
+def _body_from_node(node: dict) -> Optional[dict]:
+    """Convert a Kopernicus Body node to catalogue form."""
+    name = node['values'].get('name') or node['filter']
+    if not name:
+        return None
+
+    body = {'name': name}
+    templates = _find_nodes(node['nodes'], 'Template')
+    if templates:
+        template = templates[0]['values']
+        if 'name' in template:
+            body['template'] = template['name']
+        if template.get('removeAtmosphere', '').lower() == 'true':
+            body['has_atmosphere'] = False
+        if template.get('removeOcean', '').lower() == 'true':
+            body['has_ocean'] = False
+    if _find_nodes(node['nodes'], 'Atmosphere'):
+        body['has_atmosphere'] = True
+    if _find_nodes(node['nodes'], 'Ocean'):
+        body['has_ocean'] = True
+
+    for properties in _find_nodes(node['nodes'], 'Properties'):
+        for biomes in _find_nodes(properties['nodes'], 'Biomes'):
+            # Science ids use biome names with spaces removed
+            body['biomes'] = [
+                biome['values']['name'].replace(' ', '')
+                for biome in _find_nodes(biomes['nodes'], 'Biome')
+                if biome['values'].get('name')
+            ]
+    return body
+
+
+def parse_definitions_file(path: str) -> Tuple[List[dict], List[dict]]:
+    """
+    Extract experiment and body definitions from one .cfg file.
+
+    Returns:
+        (experiments, bodies) in catalogue form; both empty for files that
+        define neither, or can't be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return [], []
+    if not any(marker in data for marker in _MARKERS):
+        return [], []
+
+    nodes = parse_config_text(data.decode('utf-8', errors='replace'))
+    experiments = [
+        experiment for experiment in map(_experiment_from_node,
+                                         _find_nodes(nodes, 'EXPERIMENT_DEFINITION'))
+        if experiment
+    ]
+    bodies = [
+        body
+        for kopernicus in _find_nodes(nodes, 'Kopernicus')
+        for body in map(_body_from_node, _find_nodes(kopernicus['nodes'], 'Body'))
+        if body
+    ]
+    return experiments, bodies
+
+
+class GameDataLoader:
+    """
+    Collects experiment and body definitions from a GameData folder.
+
+    Every .cfg file is parsed once and its definitions are cached on disk
+    against its size and mtime, so a rescan only reads the file list and
+    parses files that changed. Changed files are parsed in a process pool
+    when there are enough of them to pay for one.
+    """
+
+    VERSION = 1
+    # Below this many changed files a process pool costs more than it saves
+    PARALLEL_THRESHOLD = 64
+
+    def __init__(self, gamedata_dir: str, cache_dir: str = None,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize loader.
+
+        Args:
+            gamedata_dir: KSP GameData directory
+            cache_dir: Directory for the definition cache.
+                      Defaults to CACHE_DIR/gamedata.
+            max_workers: Worker process count. Defaults to the CPU count.
+        """
+        self.gamedata_dir = Path(gamedata_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR / "gamedata"
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parsed_files = 0
+
+    def _cache_path(self) -> Path:
+        key = hashlib.sha1(os.path.normcase(str(self.gamedata_dir.resolve())).encode('utf-8'))
+        return self.cache_dir / f"{key.hexdigest()}.json"
+
+    def _scan_files(self) -> Dict[str, Tuple[int, int]]:
+        """Get relative path -> (size, mtime_ns) of every .cfg file."""
+        files = {}
+        stack = [self.gamedata_dir]
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith('.cfg'):
+                    stat = entry.stat()
+                    rel_path = os.path.relpath(entry.path, self.gamedata_dir)
+                    files[rel_path.replace(os.sep, '/')] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def _load_cache(self) -> Dict[str, dict]:
+        try:
+            with open(self._cache_path(), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('version') == self.VERSION:
+                return cached['files']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def _save_cache(self, files: Dict[str, dict]):
+        path = self._cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'files': files}, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Caching is best-effort
+            pass
+
+    def _parse_files(self, rel_paths: List[str]) -> List[Tuple[List[dict], List[dict]]]:
+        """Parse files, in a process pool when there are many."""
+        paths = [str(self.gamedata_dir / rel_path) for rel_path in rel_paths]
+        workers = min(self.max_workers, len(paths) // self.PARALLEL_THRESHOLD)
+        if workers <= 1:
+            return [parse_definitions_file(path) for path in paths]
+
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(parse_definitions_file, paths, chunksize=chunksize))
+
+    def load(self) -> dict:
+        """
+        Collect definitions from every .cfg file under GameData.
+
+        Files are merged in path order, later definitions of the same
+        experiment or body updating earlier ones.
+
+        Returns:
+            Dictionary with 'experiments' and 'bodies' lists (catalogue
+            form, see ScienceDatabase), 'source' (the GameData path) and
+            'fingerprint' (hash of the merged definitions)
+        """
+        files = self._scan_files()
+        cached = self._load_cache()
+
+        entries = {}
+        changed = []
+        for rel_path, (size, mtime_ns) in files.items():
+            entry = cached.get(rel_path)
+            if entry and entry['size'] == size and entry['mtime_ns'] == mtime_ns:
+                entries[rel_path] = entry
+            else:
+                changed.append(rel_path)
+
+        self.parsed_files = len(changed)
+        for rel_path, (experiments, bodies) in zip(changed, self._parse_files(changed)):
+            size, mtime_ns = files[rel_path]
+            entries[rel_path] = {
+                'size': size, 'mtime_ns': mtime_ns,
+                'experiments': experiments, 'bodies': bodies,
+            }
+
+        if changed or len(entries) != len(cached):
+            self._save_cache(entries)
+
+        experiments: Dict[str, dict] = {}
+        bodies: Dict[str, dict] = {}
+        for rel_path in sorted(entries):
+            for experiment in entries[rel_path]['experiments']:
+                experiments.setdefault(experiment['id'], {}).update(experiment)
+            for body in entries[rel_path]['bodies']:
+                bodies.setdefault(body['name'], {}).update(body)
+
+        merged = {
+            'experiments': list(experiments.values()),
+            'bodies': list(bodies.values()),
+        }
+        fingerprint = hashlib.blake2b(
+            json.dumps(merged, sort_keys=True).encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return {**merged, 'source': str(self.gamedata_dir), 'fingerprint': fingerprint}
+
+
+def load_gamedata(ksp_directory: Optional[str]) -> Optional[dict]:
+    """
+    Load mod definitions from a KSP installation's GameData folder.
+
+    Returns:
+        GameDataLoader.load result, or None if there is no GameData folder
+    """
+    if not ksp_directory:
+        return None
+    gamedata_dir = Path(ksp_directory) / "GameData"
+    if not gamedata_dir.is_dir():
+        return None
+    return GameDataLoader(str(gamedata_dir)).load()
@@ -0,0 +1,145 @@
+"""Memory-mapped byte-level scanner for R&D Science nodes."""
+
+import mmap
+import re
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .parse_cache import ContentDigest, ParseCache
+
+
+class MmapScienceScanner:
+    """
+    Finds Science records in a save file by scanning raw bytes.
+
+    The file is memory-mapped rather than read, so the OS pages it in on
+    demand and no Python string is ever built for the whole file. Only the
+    id/sci/cap/title fields of each Science node are decoded, which keeps
+    memory per save roughly constant regardless of file size.
+    """
+
+    # Fields decoded from each Science node; everything else is ignored
+    FIELDS = frozenset({b'id', b'sci', b'cap', b'title'})
+
+    # "name = ResearchAndDevelopment" on a line of its own
+    _RD_NAME = re.compile(
+        rb'^[ \t]*name[ \t]*=[ \t]*ResearchAndDevelopment[ \t]*\r?$',
+        re.MULTILINE
+    )
+
+    # "SCENARIO" header followed by its opening brace, with only
+    # whitespace up to the name line
+    _SCENARIO_OPEN = re.compile(rb'SCENARIO\s*\{\s*$')
+
+    @staticmethod
+    def iter_science_nodes(save_path: str,
+                           digest: Optional[ContentDigest] = None) -> Iterator[Dict[str, str]]:
+        """
+        Yield Science nodes from the ResearchAndDevelopment scenario.
+
+        Args:
+            save_path: Path to persistent.sfs file
+            digest: Optional digest given the bytes scanned, once the scan ends
+
+        Yields:
+            Dictionaries with the decoded id/sci/cap/title fields, in the same
+            shape sfsutils produces for Science nodes
+
+        Raises:
+            FileNotFoundError: If save file doesn't exist
+            ValueError: If save file cannot be read
+        """
+        save_path = Path(save_path)
+        if not save_path.exists():
+            raise FileNotFoundError(f"Save file not found: {save_path}")
+
+        try:
+            with open(save_path, 'rb') as f:
+                if save_path.stat().st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    start = MmapScienceScanner._find_rd_scenario(mm)
+                    if start is None:
+                        # No R&D scenario - likely new game with no science
+                        if digest is not None:
+                            MmapScienceScanner._digest_prefix(mm, len(mm), digest)
+                        return
+                    yield from MmapScienceScanner._scan_scenario(mm, start)
+                    if digest is not None:
+                        MmapScienceScanner._digest_prefix(mm, mm.tell(), digest)
+        except OSError as e:
+            raise ValueError(f"Failed to read save file: {e}")
+
+    @staticmethod
+    def _digest_prefix(mm: mmap.mmap, end: int, digest: ContentDigest):
+        """
+        Add the first end bytes of the map to a digest.
+
+        Hashed through memoryview slices, in bounded chunks, so no copy of
+        the file is made. Every view is released before the map is closed.
+        """
+        chunk_size = ParseCache.HASH_CHUNK_SIZE
+        with memoryview(mm) as view:
+            for offset in range(0, end, chunk_size):
+                with view[offset:min(offset + chunk_size, end)] as chunk:
+                    digest.update(chunk)
+
+    @staticmethod
+    def _find_rd_scenario(mm: mmap.mmap) -> Optional[int]:
+        """Return the offset just past the R&D scenario's name line."""
+        pos = 0
+        while True:
+            match = MmapScienceScanner._RD_NAME.search(mm, pos)
+            if match is None:
+                return None
+
+            # Make sure this is a SCENARIO's own name, not a nested value.
+            # Only look back a short window; the header sits right above.
+            window_start = max(0, match.start() - 64)
+            if MmapScienceScanner._SCENARIO_OPEN.search(mm[window_start:match.start()]):
+                return match.end()
+            pos = match.end()
+
+    @staticmethod
+    def _scan_scenario(mm: mmap.mmap, start: int) -> Iterator[Dict[str, str]]:
+        """Walk the R&D scenario line by line from start, yielding Science nodes."""
+        fields = MmapScienceScanner.FIELDS
+        mm.seek(start)
+
+        depth = 1               # Inside the SCENARIO block
+        pending_name = b''      # Last node header seen, waiting for '{'
+        science_depth = 0       # Depth of the open Science node, 0 if none
+        science_node: Dict[str, str] = {}
+
+        for raw_line in iter(mm.readline, b''):
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            if line == b'{':
+                depth += 1
+                if depth == 2 and pending_name == b'Science':
+                    science_depth = depth
+                    science_node = {}
+                pending_name = b''
+                continue
+
+            if line == b'}':
+                if science_depth and depth == science_depth:
+                    yield science_node
+                    science_depth = 0
+                depth -= 1
+                if depth == 0:
+                    # End of the R&D scenario
+                    return
+                continue
+
+            key, sep, value = line.partition(b'=')
+            if not sep:
+                pending_name = line
+                continue
+
+            if science_depth and depth == science_depth:
+                key = key.strip()
+                if key in fields:
+                    science_node[key.decode('ascii')] = value.strip().decode('utf-8', 'replace')
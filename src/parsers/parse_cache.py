@@ -0,0 +1,343 @@
+"""Persistent on-disk cache of extracted save data."""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from models.ksp_id_decoder import KspIdDecoder
+from models.save_data import SaveGameData
+from utils.config import CACHE_DIR, PARSE_CACHE_MAX_BYTES
+
+
+class ContentDigest:
+    """
+    Hash and length of the bytes read from the start of a save.
+
+    The R&D scan stops at the end of the ResearchAndDevelopment scenario, so
+    what it extracts depends only on the bytes it read. Hashing those as they
+    are read identifies the extraction without a second pass over the file.
+    """
+
+    def __init__(self):
+        """Initialize an empty digest."""
+        self._hash = hashlib.blake2b(digest_size=16)
+        self.length = 0
+
+    def update(self, data):
+        """Add bytes read from the file."""
+        self._hash.update(data)
+        self.length += len(data)
+
+    def hexdigest(self) -> str:
+        """Hash of everything added so far."""
+        return self._hash.hexdigest()
+
+    def reader(self, raw: io.RawIOBase) -> io.BufferedReader:
+        """Wrap a binary file so that everything read from it is added."""
+        return io.BufferedReader(_DigestReader(raw, self))
+
+
+class _DigestReader(io.RawIOBase):
+    """Raw reader passing every read through a ContentDigest."""
+
+    def __init__(self, raw: io.RawIOBase, digest: ContentDigest):
+        super().__init__()
+        self._raw = raw
+        self._digest = digest
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = self._raw.readinto(buffer)
+        if count:
+            self._digest.update(memoryview(buffer)[:count])
+        return count
+
+
+class ParseCache:
+    """
+    Caches extracted SaveGameData on disk, keyed on save file identity.
+
+    An entry is keyed on the save's resolved path and records its size,
+    mtime and a hash of the leading bytes the extraction read (see
+    ContentDigest). A lookup whose size and mtime match is a hit without
+    reading the save at all. If only the mtime moved (the file was touched
+    or copied) the same leading bytes are hashed again and decide, so an
+    unchanged save still hits. Entries are evicted least-recently-used once
+    the cache exceeds max_bytes.
+
+    Every data file repeats the identity it was built from and is checked on
+    load, so a stale or corrupt entry is dropped instead of being served.
+    Hits only update last-used times in memory; the index is written with
+    the next put, at most every INDEX_SAVE_INTERVAL seconds, or by flush.
+    """
+
+    VERSION = 2
+    INDEX_FILE = "index.json"
+    INDEX_SAVE_INTERVAL = 60.0
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = PARSE_CACHE_MAX_BYTES):
+        """
+        Initialize parse cache.
+
+        Args:
+            cache_dir: Directory for cache files. Defaults to CACHE_DIR/saves.
+            max_bytes: Size bound for all cached data files
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR / "saves"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._index: Dict[str, dict] = self._load_index()
+        # Unsaved last-used times or mtimes, and when the index was last saved
+        self._index_dirty = False
+        self._index_saved_at = time.monotonic()
+
+    @staticmethod
+    def file_identity(save_path: str) -> Dict[str, object]:
+        """
+        Compute the identity of a save file from its metadata, without reading it.
+
+        Take it before the save is read, and add 'hash' and 'extent' from the
+        ContentDigest the read went through before passing it to put.
+
+        Returns:
+            Dictionary with path, size and mtime_ns
+
+        Raises:
+            FileNotFoundError: If save file doesn't exist
+        """
+        path = Path(save_path).resolve()
+        stat = path.stat()
+        return {
+            'path': str(path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+
+    @staticmethod
+    def _hash_prefix(path: Path, length: int) -> str:
+        """Hash the first length bytes of a file, as a ContentDigest would."""
+        digest = ContentDigest()
+        with open(path, 'rb') as f:
+            while digest.length < length:
+                chunk = f.read(min(ParseCache.HASH_CHUNK_SIZE, length - digest.length))
+                if not chunk:
+                    break
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _key(save_path: str) -> str:
+        """Cache key for a save path."""
+        resolved = str(Path(save_path).resolve())
+        return hashlib.sha1(os.path.normcase(resolved).encode('utf-8')).hexdigest()
+
+    def get(self, save_path: str, save_name: str = "",
+            decoder: Optional[KspIdDecoder] = None) -> Optional[SaveGameData]:
+        """
+        Look up cached save data.
+
+        Ids are stored in KSP form and decoded on load, so the result is the
+        same as a fresh extraction with the same decoder.
+
+        Args:
+            save_path: Path to persistent.sfs file
+            save_name: Name to give the returned SaveGameData
+            decoder: Optional id decoder; defaults to ExperimentID.from_ksp_id
+
+        Returns:
+            Cached SaveGameData, or None on a miss
+        """
+        key = self._key(save_path)
+
+        with self._lock:
+            entry = self._index.get(key)
+            save_data = self._lookup(key, entry, save_path, decoder) if entry else None
+
+            if save_data is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            entry['last_used'] = time.time()
+            self._index_dirty = True
+            if time.monotonic() - self._index_saved_at >= self.INDEX_SAVE_INTERVAL:
+                self._save_index()
+
+        save_data.save_name = save_name
+        return save_data
+
+    def _lookup(self, key: str, entry: dict, save_path: str,
+                decoder: Optional[KspIdDecoder]) -> Optional[SaveGameData]:
+        """Validate an index entry against the file and load its data."""
+        try:
+            stat = Path(save_path).stat()
+        except OSError:
+            self._remove(key)
+            return None
+
+        if stat.st_size != entry['size']:
+            self._remove(key)
+            return None
+
+        if stat.st_mtime_ns != entry['mtime_ns']:
+            # Touched but maybe not modified - let the bytes the extraction read decide
+            try:
+                content_hash = self._hash_prefix(Path(save_path), entry['extent'])
+            except OSError:
+                return None
+            if content_hash != entry['hash']:
+                self._remove(key)
+                return None
+            entry['mtime_ns'] = stat.st_mtime_ns
+            self._index_dirty = True
+
+        try:
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if (cached.get('version') != self.VERSION or
+                    cached['identity']['hash'] != entry['hash']):
+                raise ValueError("stale cache entry")
+            save_data = SaveGameData.from_dict(cached['save_data'], decoder)
+        except (OSError, ValueError, KeyError, TypeError):
+            self._remove(key)
+            return None
+        save_data.written_at = stat.st_mtime_ns / 1e9
+        return save_data
+
+    def put(self, identity: Dict[str, object], save_data: SaveGameData):
+        """
+        Store extracted save data.
+
+        The identity should be taken with file_identity before the save is
+        read; if the file has changed since, nothing is stored.
+
+        Args:
+            identity: Identity of the save file the data was extracted from,
+                     with the 'hash' and 'extent' of its ContentDigest
+            save_data: Extracted save data
+        """
+        try:
+            stat = Path(identity['path']).stat()
+        except OSError:
+            return
+        if stat.st_size != identity['size'] or stat.st_mtime_ns != identity['mtime_ns']:
+            # Save was rewritten while we were reading it
+            return
+
+        key = self._key(identity['path'])
+        payload = json.dumps({
+            'version': self.VERSION,
+            'identity': identity,
+            'save_data': save_data.to_dict(),
+        })
+
+        with self._lock:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._atomic_write(self.cache_dir / f"{key}.json", payload)
+            except OSError:
+                # Caching is best-effort
+                return
+
+            self._index[key] = {
+                'path': identity['path'],
+                'size': identity['size'],
+                'mtime_ns': identity['mtime_ns'],
+                'hash': identity['hash'],
+                'extent': identity['extent'],
+                'bytes': len(payload),
+                'last_used': time.time(),
+            }
+            self._evict()
+            self._save_index()
+
+    def flush(self):
+        """Write unsaved last-used times to the index (e.g. at exit)."""
+        with self._lock:
+            if self._index_dirty:
+                self._save_index()
+
+    def invalidate(self, save_path: str):
+        """Drop the cache entry for a save, if any."""
+        with self._lock:
+            self._remove(self._key(save_path))
+            self._save_index()
+
+    def clear(self):
+        """Drop every cache entry and reset the counters."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._save_index()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._index),
+                'bytes': sum(entry['bytes'] for entry in self._index.values()),
+            }
+
+    def _evict(self):
+        """Evict least recently used entries until under max_bytes."""
+        total = sum(entry['bytes'] for entry in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]['bytes']
+            self._remove(key)
+
+    def _remove(self, key: str):
+        """Remove an entry and its data file (index is saved by the caller)."""
+        self._index.pop(key, None)
+        try:
+            (self.cache_dir / f"{key}.json").unlink()
+        except OSError:
+            pass
+
+    def _load_index(self) -> Dict[str, dict]:
+        """Load the index file, starting empty if missing or unreadable."""
+        try:
+            with open(self.cache_dir / self.INDEX_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.VERSION:
+                return data['entries']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def _save_index(self):
+        """Persist the index file."""
+        self._index_dirty = False
+        self._index_saved_at = time.monotonic()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._atomic_write(
+                self.cache_dir / self.INDEX_FILE,
+                json.dumps({'version': self.VERSION, 'entries': self._index})
+            )
+        except OSError:
+            pass
+
+    @staticmethod
+    def _atomic_write(path: Path, text: str):
+        """Write text to path via a temporary file and rename."""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
@@ -1,7 +1,8 @@
 """Extracts science data from parsed KSP save files."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from models.experiment import ExperimentID, CompletedExperiment
+from models.ksp_id_decoder import KspIdDecoder
 from models.save_data import SaveGameData
 
 
@@ -9,13 +10,15 @@ class ScienceExtractor:
     """Extracts science experiment data from parsed save files."""
 
     @staticmethod
-    def extract_science_data(parsed_save: dict, save_name: str = "") -> SaveGameData:
+    def extract_science_data(parsed_save: dict, save_name: str = "",
+                             decoder: Optional[KspIdDecoder] = None) -> SaveGameData:
         """
         Extract science experiments from parsed save file.
 
         Args:
             parsed_save: Parsed save data from sfsutils
             save_name: Name of the save game
+            decoder: Optional id decoder; defaults to ExperimentID.from_ksp_id
 
         Returns:
             SaveGameData object containing all completed experiments
@@ -49,16 +52,7 @@ class ScienceExtractor:
             if isinstance(science_nodes, dict):
                 science_nodes = [science_nodes]
 
-            # Parse each science entry
-            for science_node in science_nodes:
-                try:
-                    completed_exp = ScienceExtractor._parse_science_node(science_node)
-                    if completed_exp:
-                        save_data.add_completed_experiment(completed_exp)
-                except (ValueError, KeyError) as e:
-                    # Skip invalid science entries
-                    print(f"Warning: Skipping invalid science entry: {e}")
-                    continue
+            ScienceExtractor._add_science_nodes(save_data, science_nodes, decoder)
 
         except (KeyError, AttributeError) as e:
             print(f"Warning: Error navigating save structure: {e}")
@@ -66,15 +60,82 @@ class ScienceExtractor:
         return save_data
 
     @staticmethod
-    def _parse_science_node(science_node: dict) -> CompletedExperiment:
+    def extract_science_nodes(
+        science_nodes: Iterable[Dict[str, str]],
+        save_name: str = "",
+        decoder: Optional[KspIdDecoder] = None
+    ) -> SaveGameData:
         """
-        Parse a single Science node from save file.
+        Extract science experiments from a stream of Science nodes.
+
+        Used with SFSParser.iter_science_nodes, which yields the R&D Science
+        nodes without parsing the rest of the save file.
+
+        Args:
+            science_nodes: Iterable of Science node dictionaries
+            save_name: Name of the save game
+            decoder: Optional id decoder; defaults to ExperimentID.from_ksp_id
+
+        Returns:
+            SaveGameData object containing all completed experiments
+        """
+        save_data = SaveGameData(save_name=save_name)
+        ScienceExtractor._add_science_nodes(save_data, science_nodes, decoder)
+        return save_data
+
+    @staticmethod
+    def _add_science_nodes(save_data: SaveGameData, science_nodes: Iterable[dict],
+                           decoder: Optional[KspIdDecoder] = None):
+        """Parse Science nodes and add them to save data, skipping invalid ones."""
+        entries = []
+        for science_node in science_nodes:
+            try:
+                entry = ScienceExtractor._parse_science_node(science_node)
+            except (ValueError, KeyError) as e:
+                # Skip invalid science entries
+                print(f"Warning: Skipping invalid science entry: {e}")
+                continue
+            if entry:
+                entries.append(entry)
+
+        # Ids are decoded as one batch
+        decode = decoder.decode if decoder is not None else ExperimentID.from_ksp_id
+        ksp_ids = [ksp_id for ksp_id, _, _ in entries]
+        try:
+            if decoder is not None:
+                exp_ids = decoder.decode_many(ksp_ids)
+            else:
+                exp_ids = [decode(ksp_id) for ksp_id in ksp_ids]
+        except ValueError:
+            # Some id is unparseable - decode one at a time to skip just those
+            exp_ids = []
+            for ksp_id in ksp_ids:
+                try:
+                    exp_ids.append(decode(ksp_id))
+                except ValueError as e:
+                    print(f"Warning: Skipping invalid science entry: "
+                          f"Failed to parse experiment ID '{ksp_id}': {e}")
+                    exp_ids.append(None)
+
+        for exp_id, (_, science_earned, science_cap) in zip(exp_ids, entries):
+            if exp_id is not None:
+                save_data.add_completed_experiment(CompletedExperiment(
+                    experiment_id=exp_id,
+                    science_earned=science_earned,
+                    science_cap=science_cap
+                ))
+
+    @staticmethod
+    def _parse_science_node(science_node: dict) -> Optional[Tuple[str, float, float]]:
+        """
+        Parse a single Science node from save file, leaving its id encoded.
 
         Args:
             science_node: Dictionary containing science data
 
         Returns:
-            CompletedExperiment object, or None if entry should be skipped
+            Tuple of (ksp_id, science_earned, science_cap), or None if entry
+            should be skipped
 
         Raises:
             ValueError: If node is invalid or cannot be parsed
@@ -96,17 +157,7 @@ class ScienceExtractor:
         except (ValueError, TypeError):
             raise ValueError(f"Invalid science values for {ksp_id}")
 
-        # Parse experiment ID
-        try:
-            exp_id = ExperimentID.from_ksp_id(ksp_id)
-        except ValueError as e:
-            raise ValueError(f"Failed to parse experiment ID '{ksp_id}': {e}")
-
-        return CompletedExperiment(
-            experiment_id=exp_id,
-            science_earned=science_earned,
-            science_cap=science_cap
-        )
+        return ksp_id, science_earned, science_cap
 
     @staticmethod
     def get_save_name_from_file(parsed_save: dict) -> str:
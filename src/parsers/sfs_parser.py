@@ -1,10 +1,17 @@
 """Parser for KSP save files (.sfs format)."""
 
+import io
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 import sfsutils
 
+from models.ksp_id_decoder import KspIdDecoder
+from models.save_data import SaveGameData
+from .science_extractor import ScienceExtractor
+from .mmap_scanner import MmapScienceScanner
+from .parse_cache import ContentDigest, ParseCache
+
 
 class SFSParser:
     """Handles parsing of KSP save files."""
@@ -16,15 +23,21 @@ class SFSParser:
         os.path.expanduser(r"~\Documents\Kerbal Space Program"),  # Non-Steam
     ]
 
-    def __init__(self, ksp_directory: str = None):
+    def __init__(self, ksp_directory: str = None, cache: Optional[ParseCache] = None,
+                 id_decoder: Optional[KspIdDecoder] = None):
         """
         Initialize SFS parser.
 
         Args:
             ksp_directory: Path to KSP installation directory.
                           If None, will attempt to auto-detect.
+            cache: Optional parse cache used by load_science_data
+            id_decoder: Optional science id decoder used by load_science_data
+                       (e.g. ScienceDatabase.get_id_decoder())
         """
         self.ksp_directory = Path(ksp_directory) if ksp_directory else None
+        self.cache = cache
+        self.id_decoder = id_decoder
 
         if self.ksp_directory is None:
             self.ksp_directory = self._find_ksp_directory()
@@ -65,6 +78,29 @@ class SFSParser:
 
         return sorted(save_games)
 
+    def find_save_files(self) -> List[tuple]:
+        """
+        Find every save file of every save game.
+
+        Besides persistent.sfs these are quicksaves (any other .sfs file in
+        the save folder) and the timestamped copies KSP keeps in the save's
+        Backup folder.
+
+        Returns:
+            List of tuples (save_name, save_path, file_path), where save_path
+            is the save's persistent.sfs file
+        """
+        save_files = []
+        for save_name, save_path in self.find_save_games():
+            save_folder = Path(save_path).parent
+            for folder in (save_folder, save_folder / "Backup"):
+                if folder.is_dir():
+                    save_files.extend(
+                        (save_name, save_path, str(file_path))
+                        for file_path in folder.glob("*.sfs")
+                    )
+        return sorted(save_files)
+
     def parse_save_file(self, save_path: str) -> dict:
         """
         Parse a KSP save file.
@@ -89,6 +125,188 @@ class SFSParser:
         except Exception as e:
             raise ValueError(f"Failed to parse save file: {e}")
 
+    def iter_science_nodes(self, save_path: str, use_mmap: bool = True,
+                           digest: Optional[ContentDigest] = None) -> Iterator[Dict[str, str]]:
+        """
+        Stream Science nodes from the ResearchAndDevelopment scenario.
+
+        Unlike parse_save_file, this never builds the nested dictionary for
+        the whole save. Top-level GAME blocks other than SCENARIO (FLIGHTSTATE
+        with all of its VESSEL/PART/MODULE children, ROSTER, ...) are skipped
+        by counting braces, other scenarios are skipped as soon as their name
+        is read, and scanning stops once the R&D scenario has been closed.
+
+        By default the file is memory-mapped and scanned as bytes (see
+        MmapScienceScanner); pass use_mmap=False to read it as text lines.
+
+        Args:
+            save_path: Path to persistent.sfs file
+            use_mmap: Scan a memory-mapped view of the file
+            digest: Optional digest given every byte read (see ParseCache)
+
+        Yields:
+            Dictionaries shaped like sfsutils Science nodes
+            (e.g. {'id': ..., 'title': ..., 'sci': ..., 'cap': ...})
+
+        Raises:
+            FileNotFoundError: If save file doesn't exist
+            ValueError: If save file cannot be read
+        """
+        if use_mmap:
+            yield from MmapScienceScanner.iter_science_nodes(save_path, digest)
+            return
+
+        save_path = Path(save_path)
+        if not save_path.exists():
+            raise FileNotFoundError(f"Save file not found: {save_path}")
+
+        try:
+            if digest is None:
+                with open(save_path, 'r', encoding='utf-8', errors='replace') as f:
+                    yield from self._scan_rd_science(f)
+            else:
+                with open(save_path, 'rb') as raw, io.TextIOWrapper(
+                        digest.reader(raw), encoding='utf-8', errors='replace') as f:
+                    yield from self._scan_rd_science(f)
+        except OSError as e:
+            raise ValueError(f"Failed to read save file: {e}")
+
+    @staticmethod
+    def _scan_rd_science(lines) -> Iterator[Dict[str, str]]:
+        """Scan ConfigNode lines, yielding R&D Science nodes only."""
+        stack: List[str] = []       # Names of the nodes we are inside
+        pending_name = None         # Last node header seen, waiting for '{'
+        skip_depth = 0              # Brace depth of the block being skipped
+        in_rd = False               # Inside the ResearchAndDevelopment scenario
+        science_node: Optional[Dict[str, str]] = None
+
+        for raw_line in lines:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            # Skipping a block: only braces matter
+            if skip_depth:
+                if line == '{':
+                    skip_depth += 1
+                elif line == '}':
+                    skip_depth -= 1
+                continue
+
+            if line == '{':
+                name, pending_name = pending_name, None
+                depth = len(stack)
+
+                if depth == 0:
+                    wanted = name == 'GAME'
+                elif depth == 1:
+                    wanted = name == 'SCENARIO'
+                elif depth == 2:
+                    # Children of a scenario; only R&D Science nodes matter
+                    wanted = in_rd and name == 'Science'
+                else:
+                    wanted = False
+
+                if wanted:
+                    stack.append(name)
+                    if name == 'Science':
+                        science_node = {}
+                else:
+                    skip_depth = 1
+                continue
+
+            if line == '}':
+                if not stack:
+                    continue
+                closed = stack.pop()
+                if closed == 'Science' and science_node is not None:
+                    yield science_node
+                    science_node = None
+                elif closed == 'SCENARIO' and in_rd:
+                    # Only one R&D scenario per save - nothing left to read
+                    return
+                continue
+
+            if '=' not in line:
+                pending_name = line
+                continue
+
+            key, _, value = line.partition('=')
+            key = key.strip()
+            value = value.strip()
+
+            if science_node is not None:
+                science_node[key] = value
+            elif len(stack) == 2 and key == 'name':
+                if value == 'ResearchAndDevelopment':
+                    in_rd = True
+                else:
+                    # Some other scenario: skip the rest of its block
+                    stack.pop()
+                    skip_depth = 1
+
+    def load_science_data(self, save_path: str, save_name: str = "",
+                          use_mmap: bool = True,
+                          progress: Optional[Callable[[str], None]] = None) -> SaveGameData:
+        """
+        Load completed science from a save using the R&D-only scan.
+
+        If the parser has a cache, an unchanged save is served from it and
+        a freshly extracted one is stored in it.
+
+        Args:
+            save_path: Path to persistent.sfs file
+            save_name: Name of the save game
+            use_mmap: Scan a memory-mapped view of the file
+            progress: Optional callback(stage) called with 'parse' and
+                     'extract' as those stages start (skipped on a cache hit).
+                     It may raise to abort the load between stages.
+
+        Returns:
+            SaveGameData object containing all completed experiments, with
+            written_at set to the file's mtime before it was read
+
+        Raises:
+            FileNotFoundError: If save file doesn't exist
+            ValueError: If save file cannot be read
+        """
+        if progress is None:
+            progress = lambda stage: None
+
+        identity = None
+        if self.cache is not None:
+            cached = self.cache.get(save_path, save_name, self.id_decoder)
+            if cached is not None:
+                return cached
+
+        if not Path(save_path).exists():
+            raise FileNotFoundError(f"Save file not found: {save_path}")
+
+        # Take the identity and mtime before reading, so a concurrent rewrite
+        # is neither cached nor stamped with the new file's time
+        digest = None
+        if self.cache is not None:
+            identity = ParseCache.file_identity(save_path)
+            mtime_ns = identity['mtime_ns']
+            digest = ContentDigest()
+        else:
+            mtime_ns = os.stat(save_path).st_mtime_ns
+
+        progress('parse')
+        science_nodes = list(self.iter_science_nodes(save_path, use_mmap, digest))
+
+        progress('extract')
+        save_data = ScienceExtractor.extract_science_nodes(
+            science_nodes, save_name, self.id_decoder
+        )
+        save_data.written_at = mtime_ns / 1e9
+
+        if identity is not None:
+            # Keyed on just the bytes the scan read, hashed as it read them
+            identity.update(hash=digest.hexdigest(), extent=digest.length)
+            self.cache.put(identity, save_data)
+        return save_data
+
     def get_ksp_directory(self) -> Optional[str]:
         """Get current KSP directory path."""
         return str(self.ksp_directory) if self.ksp_directory else None
@@ -0,0 +1,101 @@
+"""Parallel science analysis across many save games."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from models.science_database import ScienceDatabase
+from parsers.sfs_parser import SFSParser
+from utils.science_calculator import ScienceCalculator
+
+
+# Per-process state for pool workers, set up once by _init_worker
+_worker_parser: Optional[SFSParser] = None
+_worker_calculator: Optional[ScienceCalculator] = None
+
+
+def analyze_save(save_name: str, save_path: str,
+                 parser: SFSParser, calculator: ScienceCalculator) -> Dict[str, object]:
+    """
+    Load one save and summarize it.
+
+    Args:
+        save_name: Name of the save
+        save_path: Path to persistent.sfs file
+        parser: Parser used to load the save
+        calculator: Calculator used for availability and statistics
+
+    Returns:
+        Dictionary with save_name, save_path, the calculate_statistics
+        values and 'error' (None on success)
+    """
+    summary: Dict[str, object] = {'save_name': save_name, 'save_path': save_path, 'error': None}
+    try:
+        save_data = parser.load_science_data(save_path, save_name)
+        available = calculator.calculate_available_science(save_data)
+        summary.update(calculator.calculate_statistics(available, save_data))
+    except (FileNotFoundError, ValueError) as e:
+        summary['error'] = str(e)
+    return summary
+
+
+def _init_worker(data_dir: Optional[str], mod_data: Optional[dict] = None):
+    """Build the database once per worker process."""
+    global _worker_parser, _worker_calculator
+    science_db = ScienceDatabase(data_dir, mod_data=mod_data)
+    _worker_parser = SFSParser(id_decoder=science_db.get_id_decoder())
+    _worker_calculator = ScienceCalculator(science_db)
+
+
+def _analyze_in_worker(save: Tuple[str, str]) -> Dict[str, object]:
+    """Pool entry point."""
+    save_name, save_path = save
+    return analyze_save(save_name, save_path, _worker_parser, _worker_calculator)
+
+
+class BatchAnalyzer:
+    """Summarizes many saves, in parallel across processes."""
+
+    def __init__(self, science_db: ScienceDatabase, max_workers: Optional[int] = None):
+        """
+        Initialize batch analyzer.
+
+        Args:
+            science_db: Science database (its data_dir and mod_data are reused
+                       by workers)
+            max_workers: Worker process count. Defaults to the CPU count.
+        """
+        self.science_db = science_db
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def analyze(self, save_games: List[Tuple[str, str]],
+                parallel: bool = True) -> List[Dict[str, object]]:
+        """
+        Summarize every save.
+
+        Args:
+            save_games: List of (save_name, save_path) tuples,
+                       e.g. from SFSParser.find_save_games
+            parallel: Use a process pool; False runs serially in-process
+
+        Returns:
+            One summary per save (see analyze_save), in input order
+        """
+        workers = min(self.max_workers, len(save_games))
+        if not parallel or workers <= 1:
+            return self._analyze_serial(save_games)
+
+        # Each worker rebuilds the database once; chunking amortizes IPC
+        chunksize = max(1, len(save_games) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(self.science_db.data_dir), self.science_db.mod_data)
+        ) as pool:
+            return list(pool.map(_analyze_in_worker, save_games, chunksize=chunksize))
+
+    def _analyze_serial(self, save_games: List[Tuple[str, str]]) -> List[Dict[str, object]]:
+        """Summarize saves one by one in this process."""
+        parser = SFSParser(id_decoder=self.science_db.get_id_decoder())
+        calculator = ScienceCalculator(self.science_db)
+        return [analyze_save(name, path, parser, calculator) for name, path in save_games]
@@ -24,10 +24,38 @@ WINDOW_MIN_HEIGHT = 600
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 
+# Per-user cache directory (parse cache etc.)
+CACHE_DIR = Path(os.environ.get("LOCALAPPDATA") or Path.home() / ".cache") / "KSPScienceTracker"
+
+# Maximum size of the on-disk parse cache
+PARSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# SQLite database of the science recorded at each load (utils/science_history.py)
+HISTORY_DB = CACHE_DIR / "history.sqlite3"
+
+# Live reload: seconds between save file checks, and how long the file must
+# stay unchanged before it is reloaded (KSP writes saves in several steps)
+WATCH_POLL_INTERVAL = 1.0
+WATCH_SETTLE_TIME = 1.5
+
 # UI Configuration
 TREE_COLUMN_WIDTH_NAME = 500
 TREE_COLUMN_WIDTH_SCIENCE = 150
 
+# Insert tree rows only when their group is expanded
+TREE_LAZY_POPULATE = True
+
+# Search box: milliseconds of typing pause before searching, and the
+# largest result the tree opens up automatically
+SEARCH_DEBOUNCE_MS = 200
+SEARCH_EXPAND_LIMIT = 200
+
+# Filtered views kept for flipping back between filter combinations
+VIEW_CACHE_SIZE = 16
+
+# Milliseconds of tree insertion per event loop slice for "Expand All"
+TREE_FRAME_BUDGET_MS = 15
+
 # Filter options
 SHOW_OPTIONS = ["Available Only", "All Experiments"]
 GROUP_BY_OPTIONS = ["Body", "Experiment", "Situation"]
@@ -0,0 +1,113 @@
+"""Background watcher that reports when a file has changed."""
+
+import os
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from utils.config import WATCH_POLL_INTERVAL, WATCH_SETTLE_TIME
+
+
+class FileWatcher:
+    """
+    Polls a file on a background thread and calls back after it changes.
+
+    KSP writes persistent.sfs in several steps, so a change is only reported
+    once the file's size and mtime have stayed the same for settle_time
+    seconds. A missing file (mid-rename) counts as still changing.
+
+    The callback runs on the watcher thread, so it may do slow work but must
+    not touch Tk widgets directly. If it raises or returns False the change
+    counts as unhandled and is reported again once the file has settled.
+    A change the callback has raised on MAX_FAILURES times is given up on
+    until the file changes again.
+    """
+
+    MAX_FAILURES = 3
+
+    def __init__(self, path: str, on_change: Callable[[str], Optional[bool]],
+                 poll_interval: float = WATCH_POLL_INTERVAL,
+                 settle_time: float = WATCH_SETTLE_TIME):
+        """
+        Initialize file watcher.
+
+        Args:
+            path: File to watch
+            on_change: Callback(path) run on the watcher thread after a change;
+                      returns False if it did not handle the change
+            poll_interval: Seconds between checks
+            settle_time: Seconds the file must stay unchanged before reporting
+        """
+        self.path = path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start watching from the file's current state."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"FileWatcher({os.path.basename(self.path)})", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching. Safe to call from the callback or more than once."""
+        self._stop_event.set()
+
+    def is_running(self) -> bool:
+        """Check whether the watcher thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        """Return (size, mtime_ns) of the file, or None if it is missing."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _run(self):
+        """Watcher thread main loop."""
+        reported = self._signature()
+        pending = None          # Signature of an unreported change
+        pending_since = 0.0
+        failures = 0            # Times the callback raised on pending
+
+        while not self._stop_event.wait(self.poll_interval):
+            current = self._signature()
+
+            if current is None or current == reported:
+                pending = None
+                continue
+
+            now = time.monotonic()
+            if current != pending:
+                # New or still-growing change - restart the settle timer
+                pending = current
+                pending_since = now
+                failures = 0
+                continue
+
+            if now - pending_since >= self.settle_time:
+                try:
+                    handled = self.on_change(self.path)
+                except Exception as e:
+                    print(f"Warning: File change handler failed: {e}")
+                    failures += 1
+                    if failures >= self.MAX_FAILURES:
+                        print(f"Warning: Giving up on this change to {self.path}")
+                        pending = None
+                        reported = current
+                    else:
+                        # Settles again from now
+                        pending_since = now
+                    continue
+                pending = None
+                # Only a handled change is done with; otherwise it settles again
+                if handled is not False:
+                    reported = current
@@ -0,0 +1,132 @@
+"""Persisted results of the last viewed save, for a warm start."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from models.experiment import AvailableExperiment, CompletedExperiment, ExperimentID
+from models.save_data import SaveGameData
+from utils.config import CACHE_DIR
+
+
+class LastSession:
+    """
+    Remembers what the window last showed so a relaunch can show it at once.
+
+    The file holds the save's name and path, its extracted science, the
+    computed available experiments and statistics, the filter state and
+    filter choices, and the hash of the catalogue the results came from.
+    Experiment ids are stored as fields rather than KSP id strings, so
+    nothing needs the catalogue's id decoder to read them back. The caller
+    is expected to revalidate against the save file after showing it.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str = None):
+        """
+        Initialize session store.
+
+        Args:
+            path: Session file. Defaults to CACHE_DIR/last_session.json.
+        """
+        self.path = Path(path) if path else CACHE_DIR / "last_session.json"
+
+    def save(self, save_name: str, save_path: str, save_data: SaveGameData,
+             available: List[AvailableExperiment], stats: dict,
+             filters: dict, choices: dict, catalogue_hash: str):
+        """
+        Write the session, replacing the previous one.
+
+        Args:
+            save_name: Name of the save shown
+            save_path: Path to its persistent.sfs file
+            save_data: Its extracted science
+            available: Its available experiments
+            stats: Its statistics (calculate_statistics result)
+            filters: Filter state (FilterPanel.get_state)
+            choices: Filter choices (FilterPanel.get_choices)
+            catalogue_hash: ScienceDatabase.source_hash of the catalogue used
+        """
+        def id_fields(exp_id: ExperimentID) -> list:
+            return [exp_id.experiment_type, exp_id.body, exp_id.situation, exp_id.biome]
+
+        payload = json.dumps({
+            'version': self.VERSION,
+            'save_name': save_name,
+            'save_path': save_path,
+            'catalogue_hash': catalogue_hash,
+            'filters': filters,
+            'choices': choices,
+            'stats': stats,
+            'completed': [
+                id_fields(exp.experiment_id) + [exp.science_earned, exp.science_cap]
+                for exp in save_data.completed_experiments.values()
+            ],
+            'available': [
+                id_fields(exp.experiment_id) +
+                [exp.experiment_name, exp.body_name, exp.available_science, exp.is_partial]
+                for exp in available
+            ],
+        })
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # The session only speeds up the next start
+            pass
+
+    def load(self) -> Optional[Dict[str, object]]:
+        """
+        Read the session.
+
+        Returns:
+            Dictionary with save_name, save_path, catalogue_hash, filters,
+            choices, stats, save_data (SaveGameData) and available (list of
+            AvailableExperiment); None if there is no usable session or its
+            save file is gone
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION or not os.path.exists(data['save_path']):
+                return None
+
+            save_data = SaveGameData(data['save_name'])
+            for exp_type, body, situation, biome, earned, cap in data['completed']:
+                save_data.add_completed_experiment(CompletedExperiment(
+                    experiment_id=ExperimentID(exp_type, body, situation, biome),
+                    science_earned=earned,
+                    science_cap=cap
+                ))
+
+            available = [
+                AvailableExperiment(
+                    experiment_id=ExperimentID(exp_type, body, situation, biome),
+                    experiment_name=name,
+                    body_name=body_name,
+                    available_science=science,
+                    is_partial=partial
+                )
+                for exp_type, body, situation, biome, name, body_name, science, partial
+                in data['available']
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return {
+            'save_name': data['save_name'],
+            'save_path': data['save_path'],
+            'catalogue_hash': data['catalogue_hash'],
+            'filters': data['filters'],
+            'choices': data['choices'],
+            'stats': data['stats'],
+            'save_data': save_data,
+            'available': available,
+        }
@@ -0,0 +1,167 @@
+"""Ingest of save backups and quicksaves into the science history."""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from models.save_data import SaveGameData
+from models.science_database import ScienceDatabase
+from parsers.sfs_parser import SFSParser
+from utils.science_history import ScienceHistory
+
+
+# Date and time in a backup's file name, e.g. "persistent (20240131T235959).sfs"
+_FILE_TIMESTAMP = re.compile(r'(\d{4})\D?(\d{2})\D?(\d{2})\D?(\d{2})\D?(\d{2})\D?(\d{2})')
+
+# Per-process parser for pool workers, set up once by _init_worker
+_worker_parser: Optional[SFSParser] = None
+
+
+def save_file_timestamp(file_path: str) -> float:
+    """
+    When a save file was written, in seconds since the epoch.
+
+    Taken from the date and time in the file name if it has one (KSP names
+    its backups after when they were made; copying them changes their
+    modification time but not their name), else the modification time
+    (in the same form as SaveGameData.written_at).
+    """
+    match = _FILE_TIMESTAMP.search(os.path.basename(file_path))
+    if match:
+        try:
+            return datetime(*map(int, match.groups())).timestamp()
+        except ValueError:
+            pass
+    return os.stat(file_path).st_mtime_ns / 1e9
+
+
+def load_save_file(save_name: str, file_path: str,
+                   parser: SFSParser) -> Tuple[Optional[SaveGameData], Optional[str]]:
+    """
+    Extract the R&D science of one save file.
+
+    Returns:
+        Tuple of (save_data, None), or (None, error message)
+    """
+    try:
+        return parser.load_science_data(file_path, save_name), None
+    except (FileNotFoundError, ValueError) as e:
+        return None, str(e)
+
+
+def _init_worker(data_dir: Optional[str], mod_data: Optional[dict] = None,
+                 use_snapshot: bool = True):
+    """Build the id decoder once per worker process."""
+    global _worker_parser
+    science_db = ScienceDatabase(data_dir, mod_data=mod_data, use_snapshot=use_snapshot)
+    _worker_parser = SFSParser(id_decoder=science_db.get_id_decoder())
+
+
+def _load_in_worker(job: Tuple[str, str]) -> Tuple[Optional[SaveGameData], Optional[str]]:
+    """Pool entry point."""
+    save_name, file_path = job
+    return load_save_file(save_name, file_path, _worker_parser)
+
+
+class SaveIngester:
+    """
+    Records every save file of some saves into a ScienceHistory.
+
+    Backups, quicksaves and persistent.sfs (see SFSParser.find_save_files)
+    are parsed in parallel across processes, reading only the R&D science.
+    They are then recorded oldest first in this process, as snapshots of
+    their save at the time each file was written. Files the history already
+    has with the same size and modification time are skipped, so running it
+    again only reads new backups.
+    """
+
+    def __init__(self, science_db: ScienceDatabase, history: ScienceHistory,
+                 max_workers: Optional[int] = None):
+        """
+        Initialize ingester.
+
+        Args:
+            science_db: Science database (its data_dir, mod_data and
+                       use_snapshot are reused by workers)
+            history: History to record into
+            max_workers: Worker process count. Defaults to the CPU count.
+        """
+        self.science_db = science_db
+        self.history = history
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def ingest(self, save_files: List[Tuple[str, str, str]],
+               parallel: bool = True) -> List[Dict[str, object]]:
+        """
+        Record save files that are new or changed since they were last ingested.
+
+        Args:
+            save_files: List of (save_name, save_path, file_path) tuples,
+                       e.g. from SFSParser.find_save_files
+            parallel: Use a process pool; False runs serially in-process
+
+        Returns:
+            One summary per save, in input order: save, files, recorded (new
+            snapshots), unchanged (same science as the snapshot before),
+            skipped (ingested before) and failed (list of error messages)
+        """
+        summaries: Dict[str, Dict[str, object]] = {}
+        for save_name, save_path, _ in save_files:
+            summaries.setdefault(save_path, {
+                'save': save_name, 'files': 0, 'recorded': 0,
+                'unchanged': 0, 'skipped': 0, 'failed': []
+            })['files'] += 1
+
+        ingested = self.history.ingested_files()
+        jobs = []
+        for save_name, save_path, file_path in save_files:
+            summary = summaries[save_path]
+            try:
+                stat = os.stat(file_path)
+                recorded_at = save_file_timestamp(file_path)
+            except OSError as e:
+                summary['failed'].append(f"{file_path}: {e}")
+                continue
+            fingerprint = (stat.st_size, stat.st_mtime_ns)
+            if ingested.get(os.path.abspath(file_path)) == fingerprint:
+                summary['skipped'] += 1
+                continue
+            jobs.append((recorded_at, save_name, save_path, file_path, fingerprint))
+
+        # Oldest first, so snapshots are mostly appended in time order
+        jobs.sort()
+        loads = [(save_name, file_path) for _, save_name, _, file_path, _ in jobs]
+        for (recorded_at, save_name, save_path, file_path, fingerprint), (save_data, error) in zip(
+                jobs, self._load_all(loads, parallel)):
+            summary = summaries[save_path]
+            if save_data is None:
+                summary['failed'].append(f"{file_path}: {error}")
+                continue
+            snapshot_id = self.history.record(
+                save_name, save_path, save_data,
+                recorded_at=recorded_at, source=(file_path,) + fingerprint
+            )
+            summary['recorded' if snapshot_id is not None else 'unchanged'] += 1
+
+        return list(summaries.values())
+
+    def _load_all(self, loads: List[Tuple[str, str]], parallel: bool):
+        """Yield load_save_file results for (save_name, file_path) pairs, in order."""
+        workers = min(self.max_workers, len(loads))
+        if not parallel or workers <= 1:
+            parser = SFSParser(id_decoder=self.science_db.get_id_decoder())
+            for save_name, file_path in loads:
+                yield load_save_file(save_name, file_path, parser)
+            return
+
+        # Each worker builds the id decoder once; chunking amortizes IPC
+        chunksize = max(1, len(loads) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(self.science_db.data_dir), self.science_db.mod_data,
+                      self.science_db.use_snapshot)
+        ) as pool:
+            yield from pool.map(_load_in_worker, loads, chunksize=chunksize)
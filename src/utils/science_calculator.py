@@ -1,9 +1,27 @@
 """Calculate available science by comparing possible vs completed experiments."""
 
-from typing import List, Dict
-from models.experiment import AvailableExperiment, PossibleExperiment, ExperimentID
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Iterator, Optional, Tuple
+from models.experiment import (
+    AvailableExperiment, CompletedExperiment, PossibleExperiment, ExperimentID
+)
 from models.save_data import SaveGameData
+from models.save_diff import SaveDelta
+from models.science_rollup import ScienceRollup
 from models.science_database import ScienceDatabase
+from models.catalogue_columns import (
+    CatalogueColumns, ColumnarAvailability, HAVE_NUMPY
+)
+
+
+@dataclass
+class AvailabilityChanges:
+    """Result of ScienceCalculator.apply_delta."""
+
+    available: List[AvailableExperiment]
+    updated: List[Tuple[AvailableExperiment, AvailableExperiment]] = field(default_factory=list)
+    removed: List[AvailableExperiment] = field(default_factory=list)
+    recalculated: bool = False  # True if apply_delta fell back to a full calculation
 
 
 class ScienceCalculator:
@@ -25,14 +43,51 @@ class ScienceCalculator:
         'mobileMaterialsLab': 25.0,
     }
 
-    def __init__(self, science_db: ScienceDatabase):
+    def __init__(self, science_db: ScienceDatabase, vectorized: Optional[bool] = None):
         """
         Initialize science calculator.
 
         Args:
             science_db: Science database containing all possible experiments
+            vectorized: Use NumPy columns for availability. Defaults to
+                       whether NumPy is installed.
+
+        Raises:
+            ImportError: If vectorized is True but NumPy is not installed
         """
+        if vectorized and not HAVE_NUMPY:
+            raise ImportError("vectorized science calculation requires numpy")
+
         self.science_db = science_db
+        self.vectorized = HAVE_NUMPY if vectorized is None else vectorized
+        self._columns: Optional[CatalogueColumns] = None
+        self._by_id: Optional[Dict[ExperimentID, PossibleExperiment]] = None
+
+    def get_columns(self) -> CatalogueColumns:
+        """
+        Get the columnar catalogue, building it on first use.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if self._columns is None:
+            self._columns = CatalogueColumns(
+                self.science_db.get_all_experiments(), self._estimate_science_value
+            )
+        return self._columns
+
+    def calculate_available_columns(self, save_data: SaveGameData) -> ColumnarAvailability:
+        """
+        Calculate remaining science for every experiment as aligned arrays.
+
+        Cheaper than calculate_available_science when only totals or
+        per-body/type/situation sums are needed, since no per-experiment
+        objects are created.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        return self.get_columns().availability(save_data)
 
     def calculate_available_science(
         self,
@@ -47,40 +102,180 @@ class ScienceCalculator:
         Returns:
             List of available experiments with remaining science
         """
-        available = []
+        if self.vectorized:
+            return self.calculate_available_columns(save_data).to_experiments()
 
-        for possible_exp in self.science_db.get_all_experiments():
-            exp_id = possible_exp.experiment_id
-            completed = save_data.get_completed_experiment(exp_id)
+        return list(self.iter_available_science(save_data))
 
-            if completed is None:
-                # Experiment not started - fully available
-                estimated_science = self._estimate_science_value(
-                    possible_exp.experiment_id
-                )
-                available.append(
-                    AvailableExperiment(
-                        experiment_id=exp_id,
-                        experiment_name=possible_exp.experiment_name,
-                        body_name=possible_exp.body_name,
-                        available_science=estimated_science,
-                        is_partial=False
-                    )
-                )
-            elif not completed.is_fully_completed:
-                # Experiment partially completed
-                available.append(
-                    AvailableExperiment(
-                        experiment_id=exp_id,
-                        experiment_name=possible_exp.experiment_name,
-                        body_name=possible_exp.body_name,
-                        available_science=completed.remaining_science,
-                        is_partial=True
-                    )
+    def iter_available_science(
+        self,
+        save_data: SaveGameData,
+        body: Optional[str] = None,
+        experiment_type: Optional[str] = None,
+        situation: Optional[str] = None,
+        biome: Optional[str] = None,
+        min_science: Optional[float] = None,
+        predicate: Optional[Callable[[AvailableExperiment], bool]] = None
+    ) -> Iterator[AvailableExperiment]:
+        """
+        Yield available experiments one at a time, in catalogue order.
+
+        Body, type, situation and biome filters are looked up in the
+        catalogue's index, so only matching experiments are visited; nothing
+        is kept between items, so a consumer that stops early (e.g.
+        itertools.islice) or keeps a bounded subset (heapq.nlargest) runs in
+        memory independent of the catalogue size. When the whole list is
+        wanted, calculate_available_science is faster with NumPy.
+
+        Args:
+            save_data: Save game data with completed experiments
+            body: Only this body (None means any; same for the others)
+            experiment_type: Only this experiment type id
+            situation: Only this situation
+            biome: Only this biome
+            min_science: Only experiments with at least this much science left
+            predicate: Only experiments it returns True for
+
+        Yields:
+            Available experiments matching every filter
+        """
+        experiments = self.science_db.get_all_experiments()
+        if body is None and experiment_type is None and situation is None and biome is None:
+            candidates = iter(experiments)
+        else:
+            candidates = (
+                experiments[position] for position in
+                self.science_db.index.positions(body, experiment_type, situation, biome)
+            )
+
+        get_completed = save_data.get_completed_experiment
+        for possible_exp in candidates:
+            available_exp = self._available_for(
+                possible_exp, get_completed(possible_exp.experiment_id)
+            )
+            # If fully completed, it isn't available
+            if available_exp is None:
+                continue
+            if min_science is not None and available_exp.available_science < min_science:
+                continue
+            if predicate is not None and not predicate(available_exp):
+                continue
+            yield available_exp
+
+    def _available_for(self, possible_exp: PossibleExperiment,
+                       completed: Optional[CompletedExperiment]
+                       ) -> Optional[AvailableExperiment]:
+        """Get an experiment's availability, or None if fully completed."""
+        if completed is None:
+            # Experiment not started - fully available
+            return AvailableExperiment(
+                experiment_id=possible_exp.experiment_id,
+                experiment_name=possible_exp.experiment_name,
+                body_name=possible_exp.body_name,
+                available_science=self._estimate_science_value(possible_exp.experiment_id),
+                is_partial=False
+            )
+        if not completed.is_fully_completed:
+            # Experiment partially completed
+            return AvailableExperiment(
+                experiment_id=possible_exp.experiment_id,
+                experiment_name=possible_exp.experiment_name,
+                body_name=possible_exp.body_name,
+                available_science=completed.remaining_science,
+                is_partial=True
+            )
+        return None
+
+    def _catalogue_by_id(self) -> Dict[ExperimentID, PossibleExperiment]:
+        """Get possible experiments by id, building the map on first use."""
+        if self._by_id is None:
+            self._by_id = {
+                exp.experiment_id: exp for exp in self.science_db.get_all_experiments()
+            }
+        return self._by_id
+
+    def apply_delta(self, available: List[AvailableExperiment], delta: SaveDelta,
+                    save_data: SaveGameData) -> 'AvailabilityChanges':
+        """
+        Update a previous calculate_available_science result for a save delta.
+
+        Only the subjects in the delta are recalculated. If one of them
+        became available again (its science was removed from the save), its
+        place in catalogue order isn't known and everything is recalculated.
+
+        Args:
+            available: Previous result, for the save before the delta
+            delta: Changes from diff_saves(previous, save_data)
+            save_data: Save the delta leads to
+
+        Returns:
+            AvailabilityChanges with the new list and what changed in it
+        """
+        catalogue = self._catalogue_by_id()
+        updates: Dict[ExperimentID, Optional[AvailableExperiment]] = {}
+        for exp_id in delta.affected_ids():
+            possible_exp = catalogue.get(exp_id)
+            if possible_exp is not None:
+                updates[exp_id] = self._available_for(
+                    possible_exp, save_data.get_completed_experiment(exp_id)
                 )
-            # If fully completed, don't include in available list
 
-        return available
+        changes = AvailabilityChanges(available=[])
+        seen = set()
+        for exp in available:
+            exp_id = exp.experiment_id
+            if exp_id not in updates:
+                changes.available.append(exp)
+                continue
+            seen.add(exp_id)
+            new_exp = updates[exp_id]
+            if new_exp is None:
+                changes.removed.append(exp)
+            else:
+                changes.available.append(new_exp)
+                if new_exp != exp:
+                    changes.updated.append((exp, new_exp))
+
+        if any(new_exp is not None and exp_id not in seen
+               for exp_id, new_exp in updates.items()):
+            return AvailabilityChanges(
+                available=self.calculate_available_science(save_data),
+                recalculated=True
+            )
+        return changes
+
+    def update_statistics(self, stats: Dict[str, float], changes: 'AvailabilityChanges',
+                          delta: SaveDelta, save_data: SaveGameData) -> Dict[str, float]:
+        """
+        Update calculate_statistics output for an apply_delta result.
+
+        Args:
+            stats: Statistics for the save before the delta
+            changes: Result of apply_delta
+            delta: The delta that was applied
+            save_data: Save the delta leads to
+
+        Returns:
+            New statistics dictionary
+        """
+        if changes.recalculated:
+            return self.calculate_statistics(changes.available, save_data)
+
+        total_possible = stats['total_possible_experiments']
+        total_completed = save_data.get_completed_count()
+        science_change = (
+            sum(new.available_science - old.available_science for old, new in changes.updated) -
+            sum(exp.available_science for exp in changes.removed)
+        )
+        return {
+            **stats,
+            'total_completed_experiments': total_completed,
+            'total_available_experiments': len(changes.available),
+            'total_available_science': stats['total_available_science'] + science_change,
+            'total_earned_science': stats['total_earned_science'] + delta.earned_science_change(),
+            'completion_percentage': (total_completed / total_possible * 100)
+                                    if total_possible > 0 else 0
+        }
 
     def _estimate_science_value(self, exp_id: ExperimentID) -> float:
         """
@@ -92,8 +287,12 @@ class ScienceCalculator:
         - Transmission penalties
         - Whether it's the first time or a repeat
 
-        For now, we use conservative base values.
+        Uses the experiment's baseValue when its definition was loaded from
+        GameData, otherwise conservative defaults.
         """
+        exp_data = self.science_db.experiments.get(exp_id.experiment_type, {})
+        if 'base_value' in exp_data:
+            return exp_data['base_value']
         return self.DEFAULT_SCIENCE_VALUES.get(
             exp_id.experiment_type,
             10.0  # Default fallback value
@@ -102,7 +301,8 @@ class ScienceCalculator:
     def calculate_statistics(
         self,
         available_experiments: List[AvailableExperiment],
-        save_data: SaveGameData
+        save_data: SaveGameData,
+        rollup: Optional[ScienceRollup] = None
     ) -> Dict[str, float]:
         """
         Calculate statistics about science progress.
@@ -110,18 +310,20 @@ class ScienceCalculator:
         Args:
             available_experiments: List of available experiments
             save_data: Save game data
+            rollup: Aggregates of available_experiments, if already built
 
         Returns:
             Dictionary with statistics
         """
+        if rollup is None:
+            rollup = ScienceRollup(available_experiments, modes=())
+
         total_possible = self.science_db.get_total_experiment_count()
         total_completed = save_data.get_completed_count()
-        total_available = len(available_experiments)
+        total_available = rollup.root.count
 
         # Sum estimated available science
-        total_available_science = sum(
-            exp.available_science for exp in available_experiments
-        )
+        total_available_science = rollup.root.total
 
         # Science already earned
         total_earned_science = save_data.get_total_science()
@@ -0,0 +1,430 @@
+"""Local SQLite history of the science in each loaded save."""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models.experiment import ExperimentID
+from models.save_data import SaveGameData
+from utils.config import HISTORY_DB
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE INDEX IF NOT EXISTS saves_name ON saves (name);
+
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    save_id INTEGER NOT NULL REFERENCES saves (id),
+    recorded_at REAL NOT NULL,
+    earned REAL NOT NULL,
+    subjects INTEGER NOT NULL,
+    UNIQUE (save_id, recorded_at)
+);
+
+CREATE TABLE IF NOT EXISTS subjects (
+    id INTEGER PRIMARY KEY,
+    experiment_type TEXT NOT NULL,
+    body TEXT NOT NULL,
+    situation TEXT NOT NULL,
+    biome TEXT NOT NULL,
+    UNIQUE (experiment_type, body, situation, biome)
+);
+CREATE INDEX IF NOT EXISTS subjects_body ON subjects (body);
+
+-- A subject's values from recorded_at on; earned and cap are NULL once removed
+CREATE TABLE IF NOT EXISTS changes (
+    save_id INTEGER NOT NULL,
+    subject_id INTEGER NOT NULL,
+    recorded_at REAL NOT NULL,
+    snapshot_id INTEGER NOT NULL,
+    earned REAL,
+    cap REAL,
+    PRIMARY KEY (save_id, subject_id, recorded_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS changes_snapshot ON changes (snapshot_id);
+
+-- Values at each save's latest snapshot
+CREATE TABLE IF NOT EXISTS latest (
+    save_id INTEGER NOT NULL,
+    subject_id INTEGER NOT NULL,
+    earned REAL NOT NULL,
+    cap REAL NOT NULL,
+    PRIMARY KEY (save_id, subject_id)
+) WITHOUT ROWID;
+
+-- Science earned per body and experiment type at each snapshot
+CREATE TABLE IF NOT EXISTS totals (
+    snapshot_id INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    experiment_type TEXT NOT NULL,
+    earned REAL NOT NULL,
+    subjects INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, body, experiment_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS totals_body ON totals (body);
+CREATE INDEX IF NOT EXISTS totals_type ON totals (experiment_type);
+
+-- Fingerprints of the files recorded, so ingest can skip them
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+# trend(by=...) -> totals column
+TREND_GROUPS = {'body': 'body', 'experiment': 'experiment_type'}
+
+
+class ScienceHistory:
+    """
+    Science recorded from every load of every save, in a SQLite database.
+
+    Each recorded load is a snapshot keyed on the save and its timestamp.
+    Subjects are stored once and snapshots only log the subjects whose
+    values changed since the snapshot before, so a long-running career
+    costs rows per change rather than per load. Every snapshot also keeps
+    its science earned per body and experiment type, so trend queries over
+    the last N snapshots read a few rows per snapshot and never rebuild
+    subject values.
+
+    Snapshots may be recorded out of time order (e.g. old backups found
+    later); the next snapshot's changes are rewritten against it. Each
+    call opens its own connection, so any thread or process may record or
+    read.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str = None):
+        """
+        Initialize history store.
+
+        Args:
+            path: Database file. Defaults to HISTORY_DB in the user cache.
+        """
+        self.path = str(path or HISTORY_DB)
+        # ExperimentID -> subjects.id, only for committed subjects: a rolled
+        # back insert's rowid may be given to another subject later
+        self._subject_ids: Dict[ExperimentID, int] = {}
+        self._subject_ids_lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in a transaction, committed on success."""
+        if not self._initialized:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            if not self._initialized:
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version > self.VERSION:
+                    raise ValueError(f"History database is from a newer version: {self.path}")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {self.VERSION}")
+                self._initialized = True
+            with conn:
+                yield conn
+
+    def record(self, save_name: str, save_path: str, save_data: SaveGameData,
+               recorded_at: Optional[float] = None,
+               source: Optional[Tuple[str, int, int]] = None) -> Optional[int]:
+        """
+        Record the science of one load of a save.
+
+        Nothing is recorded if the save already has a snapshot at this time,
+        or if its science is the same as at the snapshot before.
+
+        Args:
+            save_name: Name of the save
+            save_path: Path to the save's .sfs file; identifies the save
+            save_data: Science extracted from it, or from source
+            recorded_at: When the save was written, in seconds since the
+                        epoch. Defaults to save_data.written_at, the file's
+                        modification time from before it was read.
+            source: (path, size, mtime_ns) of the file save_data was read
+                   from, if not save_path itself (e.g. a backup). Remembered
+                   for ingested_files whether or not a snapshot is added.
+
+        Returns:
+            Id of the new snapshot, or None if nothing was recorded
+
+        Raises:
+            ValueError: If no recorded_at is given and save_data has no written_at
+        """
+        if recorded_at is None:
+            # Not the file's mtime now: it may have been rewritten since it was read
+            recorded_at = save_data.written_at
+            if recorded_at is None:
+                raise ValueError("No time to record the save at")
+
+        new_subject_ids: Dict[ExperimentID, int] = {}
+        with self._connect() as conn:
+            snapshot_id = self._record(conn, save_name, save_path, save_data,
+                                       recorded_at, source, new_subject_ids)
+        # Committed, so these ids are now safe to cache
+        with self._subject_ids_lock:
+            self._subject_ids.update(new_subject_ids)
+        return snapshot_id
+
+    def _record(self, conn: sqlite3.Connection, save_name: str, save_path: str,
+                save_data: SaveGameData, recorded_at: float,
+                source: Optional[Tuple[str, int, int]],
+                new_subject_ids: Dict[ExperimentID, int]) -> Optional[int]:
+        """Record a snapshot in an open transaction (see record)."""
+        completed = save_data.completed_experiments
+        save_id = self._save_id(conn, save_name, save_path)
+        if source is not None:
+            conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns) VALUES (?, ?, ?)",
+                (os.path.abspath(source[0]),) + tuple(source[1:])
+            )
+        if conn.execute(
+            "SELECT 1 FROM snapshots WHERE save_id = ? AND recorded_at = ?",
+            (save_id, recorded_at)
+        ).fetchone():
+            return None
+
+        subject_ids = self._get_subject_ids(conn, completed, new_subject_ids)
+        state = {
+            subject_ids[exp_id]: (exp.science_earned, exp.science_cap)
+            for exp_id, exp in completed.items()
+        }
+
+        following = conn.execute(
+            "SELECT id, recorded_at FROM snapshots WHERE save_id = ? AND recorded_at > ? "
+            "ORDER BY recorded_at LIMIT 1",
+            (save_id, recorded_at)
+        ).fetchone()
+        if following is None:
+            previous = {
+                subject_id: (earned, cap) for subject_id, earned, cap in conn.execute(
+                    "SELECT subject_id, earned, cap FROM latest WHERE save_id = ?", (save_id,)
+                )
+            }
+        else:
+            previous = self._state_at(conn, save_id, recorded_at)
+            following_state = self._state_at(conn, save_id, following[1])
+
+        changes = self._diff(previous, state)
+        if not changes and conn.execute(
+            "SELECT 1 FROM snapshots WHERE save_id = ? AND recorded_at < ?",
+            (save_id, recorded_at)
+        ).fetchone():
+            return None
+
+        snapshot_id = conn.execute(
+            "INSERT INTO snapshots (save_id, recorded_at, earned, subjects) VALUES (?, ?, ?, ?)",
+            (save_id, recorded_at, save_data.get_total_science(), len(completed))
+        ).lastrowid
+        self._insert_changes(conn, save_id, snapshot_id, recorded_at, changes)
+
+        totals: Dict[Tuple[str, str], List[float]] = {}
+        for exp_id, exp in completed.items():
+            total = totals.setdefault((exp_id.body, exp_id.experiment_type), [0.0, 0])
+            total[0] += exp.science_earned
+            total[1] += 1
+        conn.executemany(
+            "INSERT INTO totals (snapshot_id, body, experiment_type, earned, subjects) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(snapshot_id, body, exp_type, earned, count)
+             for (body, exp_type), (earned, count) in totals.items()]
+        )
+
+        if following is None:
+            conn.executemany(
+                "DELETE FROM latest WHERE save_id = ? AND subject_id = ?",
+                [(save_id, subject_id) for subject_id, earned, _ in changes if earned is None]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO latest (save_id, subject_id, earned, cap) VALUES (?, ?, ?, ?)",
+                [(save_id, subject_id, earned, cap)
+                 for subject_id, earned, cap in changes if earned is not None]
+            )
+        else:
+            # The following snapshot's changes were relative to the one before this
+            conn.execute("DELETE FROM changes WHERE snapshot_id = ?", (following[0],))
+            self._insert_changes(conn, save_id, following[0], following[1],
+                                 self._diff(state, following_state))
+        return snapshot_id
+
+    @staticmethod
+    def _save_id(conn: sqlite3.Connection, save_name: str, save_path: str) -> int:
+        """Get the id of a save, adding it if new."""
+        save_path = os.path.abspath(save_path)
+        row = conn.execute("SELECT id, name FROM saves WHERE path = ?", (save_path,)).fetchone()
+        if row is None:
+            return conn.execute(
+                "INSERT INTO saves (name, path) VALUES (?, ?)", (save_name, save_path)
+            ).lastrowid
+        if row[1] != save_name:
+            conn.execute("UPDATE saves SET name = ? WHERE id = ?", (save_name, row[0]))
+        return row[0]
+
+    def _get_subject_ids(self, conn: sqlite3.Connection, exp_ids,
+                         new_subject_ids: Dict[ExperimentID, int]) -> Dict[ExperimentID, int]:
+        """
+        Get subject ids for experiment ids, adding unknown subjects.
+
+        Ids read from the database go into new_subject_ids rather than the
+        cache, since this transaction may still be rolled back.
+        """
+        with self._subject_ids_lock:
+            subject_ids = {
+                exp_id: self._subject_ids[exp_id] for exp_id in exp_ids
+                if exp_id in self._subject_ids
+            }
+        missing = [exp_id for exp_id in exp_ids if exp_id not in subject_ids]
+        if missing:
+            conn.executemany(
+                "INSERT OR IGNORE INTO subjects (experiment_type, body, situation, biome) "
+                "VALUES (?, ?, ?, ?)",
+                [(e.experiment_type, e.body, e.situation, e.biome or "") for e in missing]
+            )
+            for subject_id, exp_type, body, situation, biome in conn.execute(
+                "SELECT id, experiment_type, body, situation, biome FROM subjects"
+            ):
+                new_subject_ids[ExperimentID(exp_type, body, situation, biome or None)] = subject_id
+            subject_ids.update((exp_id, new_subject_ids[exp_id]) for exp_id in missing)
+        return subject_ids
+
+    @staticmethod
+    def _state_at(conn: sqlite3.Connection, save_id: int,
+                  recorded_at: float) -> Dict[int, Tuple[float, float]]:
+        """Get subject values as of a time, from the change log."""
+        # SQLite takes the bare columns from the row with the MAX
+        return {
+            subject_id: (earned, cap) for subject_id, earned, cap, _ in conn.execute(
+                "SELECT subject_id, earned, cap, MAX(recorded_at) FROM changes "
+                "WHERE save_id = ? AND recorded_at <= ? GROUP BY subject_id",
+                (save_id, recorded_at)
+            ) if earned is not None
+        }
+
+    @staticmethod
+    def _diff(before: Dict[int, Tuple[float, float]],
+              after: Dict[int, Tuple[float, float]]) -> List[tuple]:
+        """Get (subject_id, earned, cap) changes; None values for removed subjects."""
+        changes = [
+            (subject_id, earned, cap) for subject_id, (earned, cap) in after.items()
+            if before.get(subject_id) != (earned, cap)
+        ]
+        changes.extend((subject_id, None, None) for subject_id in before if subject_id not in after)
+        return changes
+
+    @staticmethod
+    def _insert_changes(conn: sqlite3.Connection, save_id: int, snapshot_id: int,
+                        recorded_at: float, changes: List[tuple]):
+        """Log changes at a snapshot."""
+        conn.executemany(
+            "INSERT INTO changes (save_id, subject_id, recorded_at, snapshot_id, earned, cap) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(save_id, subject_id, recorded_at, snapshot_id, earned, cap)
+             for subject_id, earned, cap in changes]
+        )
+
+    def ingested_files(self) -> Dict[str, Tuple[int, int]]:
+        """Get the absolute path -> (size, mtime_ns) of every file recorded with a source."""
+        with self._connect() as conn:
+            return {
+                path: (size, mtime_ns)
+                for path, size, mtime_ns in conn.execute("SELECT path, size, mtime_ns FROM files")
+            }
+
+    def saves(self) -> List[Dict[str, object]]:
+        """Get the recorded saves with their snapshot count and time span."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name, path, COUNT(snapshots.id), MIN(recorded_at), MAX(recorded_at) "
+                "FROM saves LEFT JOIN snapshots ON snapshots.save_id = saves.id "
+                "GROUP BY saves.id ORDER BY name, path"
+            ).fetchall()
+        return [
+            {'save': name, 'path': path, 'snapshots': count, 'first': first, 'last': last}
+            for name, path, count, first, last in rows
+        ]
+
+    def trend(self, save: str, by: Optional[str] = None,
+              limit: Optional[int] = 50) -> List[Dict[str, object]]:
+        """
+        Get science earned over a save's most recent snapshots.
+
+        Args:
+            save: Save name, or path to its .sfs file
+            by: None for totals per snapshot, or a TREND_GROUPS key for
+                totals per body or experiment type
+            limit: Number of most recent snapshots (None for all)
+
+        Returns:
+            Rows in time order: recorded_at, earned and subjects, plus group
+            when broken down
+        """
+        with self._connect() as conn:
+            save_ids = [row[0] for row in conn.execute(
+                "SELECT id FROM saves WHERE path = ? OR name = ?", (os.path.abspath(save), save)
+            )]
+            if not save_ids:
+                return []
+            placeholders = ",".join("?" * len(save_ids))
+            recent = (
+                f"SELECT id, recorded_at, earned, subjects FROM snapshots "
+                f"WHERE save_id IN ({placeholders}) ORDER BY recorded_at DESC LIMIT ?"
+            )
+            params = save_ids + [-1 if limit is None else limit]
+
+            if by is None:
+                rows = conn.execute(
+                    f"SELECT recorded_at, earned, subjects FROM ({recent}) ORDER BY recorded_at",
+                    params
+                ).fetchall()
+                return [
+                    {'recorded_at': recorded_at, 'earned': earned, 'subjects': subjects}
+                    for recorded_at, earned, subjects in rows
+                ]
+
+            column = TREND_GROUPS[by]
+            rows = conn.execute(
+                f"SELECT s.recorded_at, t.{column}, SUM(t.earned), SUM(t.subjects) "
+                f"FROM ({recent}) s JOIN totals t ON t.snapshot_id = s.id "
+                f"GROUP BY s.id, t.{column} ORDER BY s.recorded_at, t.{column}",
+                params
+            ).fetchall()
+        return [
+            {'recorded_at': recorded_at, 'group': group, 'earned': earned, 'subjects': subjects}
+            for recorded_at, group, earned, subjects in rows
+        ]
+
+    def subjects_at(self, save: str, recorded_at: Optional[float] = None
+                    ) -> Dict[ExperimentID, Tuple[float, float]]:
+        """
+        Get a save's subject values as of a time.
+
+        Args:
+            save: Save path, as recorded
+            recorded_at: Time; defaults to now
+
+        Returns:
+            ExperimentID -> (science_earned, science_cap)
+        """
+        if recorded_at is None:
+            recorded_at = time.time()
+        with self._connect() as conn:
+            row = conn.execute("SELECT id FROM saves WHERE path = ?", (os.path.abspath(save),)).fetchone()
+            if row is None:
+                return {}
+            state = self._state_at(conn, row[0], recorded_at)
+            subjects = {
+                subject_id: ExperimentID(exp_type, body, situation, biome or None)
+                for subject_id, exp_type, body, situation, biome in conn.execute(
+                    "SELECT id, experiment_type, body, situation, biome FROM subjects"
+                )
+            }
+        return {subjects[subject_id]: values for subject_id, values in state.items()}
@@ -0,0 +1,166 @@
+"""Test the headless command-line entry point."""
+
+import sys
+import os
+import io
+import json
+import subprocess
+import tempfile
+
+# Add src to path
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+import cli
+from test_save_scanning import SAMPLE_SAVE
+
+
+def _make_install(directory: str) -> str:
+    """Create a minimal KSP install with one save and return its path."""
+    save_dir = os.path.join(directory, 'saves', 'Test Career')
+    os.makedirs(save_dir)
+    with open(os.path.join(save_dir, 'persistent.sfs'), 'w', encoding='utf-8') as f:
+        f.write(SAMPLE_SAVE)
+    return directory
+
+
+def test_cli_does_not_import_tkinter():
+    """Importing the CLI must not pull in the GUI toolkit."""
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import cli; "
+        "sys.exit(1 if 'tkinter' in sys.modules else 0)"
+    )
+    assert subprocess.run([sys.executable, '-c', code, SRC_DIR]).returncode == 0
+
+
+def test_streamed_json_closed_on_failure():
+    """A save failing mid-stream still leaves a complete JSON array."""
+    def rows(fail_after):
+        for number in range(fail_after):
+            yield {'save': f"Save {number}"}
+        raise ValueError("Failed to parse save file")
+
+    for fail_after in (0, 2):
+        out = io.StringIO()
+        try:
+            cli.write_rows(rows(fail_after), ['save'], 'json', out)
+        except ValueError:
+            pass
+        else:
+            assert False, "expected ValueError"
+        assert json.loads(out.getvalue()) == [{'save': f"Save {n}"} for n in range(fail_after)]
+
+
+def test_cli_experiments_filters_and_stats():
+    """Experiments are filtered by body/type/situation; stats are reported."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ksp_dir = _make_install(tmp)
+
+        out = io.StringIO()
+        args = cli.build_arg_parser().parse_args([
+            '--ksp-dir', ksp_dir, '--no-cache', '--no-history', 'experiments', 'Test Career',
+            '--body', 'Mun', '--type', 'surfaceSample', '--situation', 'SrfLanded'
+        ])
+        assert cli.run(args, out) == 0
+        rows = json.loads(out.getvalue())
+
+        assert rows and all(row['body'] == 'Mun' for row in rows)
+        canyons = [row for row in rows if row['biome'] == 'Canyons']
+        assert canyons[0]['is_partial'] is True
+        assert canyons[0]['available_science'] == 27.75
+
+        out = io.StringIO()
+        args = cli.build_arg_parser().parse_args([
+            '--ksp-dir', ksp_dir, '--no-cache', '--no-history', 'experiments', 'Test Career',
+            '--body', 'Mun', '--top', '3', '--format', 'csv'
+        ])
+        assert cli.run(args, out) == 0
+        top = [line.split(',') for line in out.getvalue().splitlines()[1:]]
+        science = [float(row[cli.EXPERIMENT_FIELDS.index('available_science')]) for row in top]
+        assert len(top) == 3 and science == sorted(science, reverse=True)
+
+        out = io.StringIO()
+        args = cli.build_arg_parser().parse_args([
+            '--ksp-dir', ksp_dir, '--no-cache', '--no-history', 'experiments', 'Test Career',
+            '--limit', '2'
+        ])
+        assert cli.run(args, out) == 0
+        assert len(json.loads(out.getvalue())) == 2
+
+        out = io.StringIO()
+        args = cli.build_arg_parser().parse_args([
+            '--ksp-dir', ksp_dir, '--no-cache', '--no-history', 'stats', '--all', '--format', 'csv'
+        ])
+        assert cli.run(args, out) == 0
+        header, row = out.getvalue().splitlines()
+        assert header.split(',') == cli.STATISTICS_FIELDS
+        assert row.startswith('Test Career,')
+
+        out = io.StringIO()
+        args = cli.build_arg_parser().parse_args([
+            '--ksp-dir', ksp_dir, '--no-cache', '--no-history', 'stats', 'Test Career', '--by', 'body'
+        ])
+        assert cli.run(args, out) == 0
+        by_body = {row['group']: row for row in json.loads(out.getvalue())}
+        assert by_body['Mun']['available_science'] > 0
+        assert sum(row['available_experiments'] for row in by_body.values()) == \
+            int(row.split(',')[3])
+
+
+def test_cli_records_and_reports_history():
+    """Loads are recorded once per save version and reported as a trend."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ksp_dir = _make_install(os.path.join(tmp, 'ksp'))
+        history_db = os.path.join(tmp, 'history.sqlite3')
+
+        def run(*argv):
+            out = io.StringIO()
+            args = cli.build_arg_parser().parse_args([
+                '--ksp-dir', ksp_dir, '--no-cache', '--history-db', history_db, *argv
+            ])
+            assert cli.run(args, out) == 0
+            return json.loads(out.getvalue())
+
+        run('stats', 'Test Career')
+        run('stats', 'Test Career')  # unchanged save: no second snapshot
+        saves = run('history')
+        assert [(row['save'], row['snapshots']) for row in saves] == [('Test Career', 1)]
+
+        trend = run('history', 'Test Career')
+        assert len(trend) == 1 and trend[0]['earned'] > 0
+
+        by_body = run('history', 'Test Career', '--by', 'body')
+        assert abs(sum(row['earned'] for row in by_body) - trend[0]['earned']) < 0.1
+        assert 'Mun' in {row['group'] for row in by_body}
+
+
+def test_cli_ingests_backups_once():
+    """Backups and quicksaves become snapshots; a second run skips them."""
+    with tempfile.TemporaryDirectory() as tmp:
+        ksp_dir = _make_install(os.path.join(tmp, 'ksp'))
+        save_dir = os.path.join(ksp_dir, 'saves', 'Test Career')
+        os.makedirs(os.path.join(save_dir, 'Backup'))
+        with open(os.path.join(save_dir, 'Backup', 'persistent (20200101T120000).sfs'), 'w',
+                  encoding='utf-8') as f:
+            f.write(SAMPLE_SAVE.replace("sci = 12.25", "sci = 10.25"))
+        with open(os.path.join(save_dir, 'quicksave.sfs'), 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_SAVE)
+        history_db = os.path.join(tmp, 'history.sqlite3')
+
+        def run(*argv):
+            out = io.StringIO()
+            args = cli.build_arg_parser().parse_args([
+                '--ksp-dir', ksp_dir, '--no-cache', '--history-db', history_db, *argv
+            ])
+            assert cli.run(args, out) == 0
+            return json.loads(out.getvalue())
+
+        [summary] = run('ingest', '--all')
+        assert (summary['files'], summary['recorded'], summary['unchanged'], summary['failed']) == \
+            (3, 2, 1, [])
+        [summary] = run('ingest', 'Test Career', '--serial')
+        assert (summary['skipped'], summary['recorded']) == (3, 0)
+
+        trend = run('history', 'Test Career')
+        assert trend[0]['recorded_at'].startswith('2020-01-01 12:00')
+        assert trend[1]['earned'] - trend[0]['earned'] == 2.0
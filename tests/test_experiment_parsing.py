@@ -65,7 +65,7 @@ def test_science_database():
     print("\nTesting science database...")
 
     try:
-        db = ScienceDatabase()
+        db = ScienceDatabase(use_snapshot=False)
         total_experiments = db.get_total_experiment_count()
 
         print(f"✓ Database loaded successfully")
@@ -89,6 +89,356 @@ def test_science_database():
         return False
 
 
+def test_experiment_id_interning():
+    """Test that experiment IDs are shared, immutable flyweights."""
+    import copy
+    import pickle
+
+    print("\nTesting experiment ID interning...")
+
+    a = ExperimentID("crewReport", "Kerbin", "SrfLanded", "Grasslands")
+    b = ExperimentID.from_ksp_id("crewReport@KerbinSrfLandedGrasslands")
+    assert a is b
+    assert hash(a) == hash("crewReport@KerbinSrfLandedGrasslands")
+    assert ExperimentID("crewReport", "Mun", "InSpaceLow", "") is ExperimentID("crewReport", "Mun", "InSpaceLow")
+    assert pickle.loads(pickle.dumps(a)) is a
+    assert copy.deepcopy(a) is a
+
+    try:
+        a.body = "Mun"
+    except AttributeError:
+        pass
+    else:
+        assert False, "ExperimentID should be immutable"
+
+    print("✓ Interning OK")
+    return True
+
+
+def test_ksp_id_decoder():
+    """Test the catalogue-backed id decoder."""
+    from models.science_database import ScienceDatabase
+
+    print("\nTesting KSP id decoder...")
+
+    decoder = ScienceDatabase(use_snapshot=False).get_id_decoder()
+
+    exp_id = decoder.decode("crewReport@MunSrfLandedHighlandCraters")
+    assert (exp_id.body, exp_id.situation, exp_id.biome) == ("Mun", "SrfLanded", "HighlandCraters")
+    assert decoder.is_known_biome(exp_id)
+
+    # Biomes the catalogue doesn't list for the body fall back to the heuristic
+    exp_id = decoder.decode("crewReport@KerbinSrfLandedLaunchPad")
+    assert (exp_id.body, exp_id.situation, exp_id.biome) == ("Kerbin", "SrfLanded", "LaunchPad")
+    assert exp_id is ExperimentID.from_ksp_id("crewReport@KerbinSrfLandedLaunchPad")
+    assert not decoder.is_known_biome(exp_id)
+
+    # Unknown bodies fall back to the heuristic parser
+    modded = decoder.decode("crewReport@RaldSrfLandedHills")
+    assert (modded.body, modded.situation, modded.biome) == ("Rald", "SrfLanded", "Hills")
+
+    ids = ["temperatureScan@EveInSpaceHigh", "mysteryGoo@LaytheFlyingLow"] * 100
+    decoded = decoder.decode_many(ids)
+    assert [d.to_ksp_id() for d in decoded] == ids
+    assert decoder.cache_info().hits >= 198
+
+    try:
+        decoder.decode("not-an-id")
+    except ValueError:
+        pass
+    else:
+        assert False, "expected ValueError"
+
+    print("✓ Decoder OK")
+    return True
+
+
+def test_experiment_index_queries():
+    """Test that indexed queries match linear scans."""
+    from models.science_database import ScienceDatabase
+
+    print("\nTesting experiment index...")
+
+    db = ScienceDatabase(use_snapshot=False)
+    all_exps = db.get_all_experiments()
+    criteria_cases = [
+        {'body': 'Mun'},
+        {'experiment_type': 'evaReport'},
+        {'body': 'Kerbin', 'experiment_type': 'crewReport'},
+        {'body': 'Mun', 'situation': 'SrfLanded', 'biome': 'Canyons'},
+        {'experiment_type': 'surfaceSample', 'body': 'Duna', 'situation': 'SrfLanded'},
+        {'body': 'Nowhere'},
+        {},
+    ]
+
+    for criteria in criteria_cases:
+        expected = [
+            exp for exp in all_exps
+            if all(getattr(exp.experiment_id, dim) == value for dim, value in criteria.items())
+        ]
+        assert db.query_experiments(**criteria) == expected, criteria
+
+    assert db.index.values('body') == db.get_body_names()
+    print("✓ Index OK")
+    return True
+
+
+def test_catalogue_snapshot():
+    """Test that the compiled catalogue snapshot matches generation."""
+    import json
+    import shutil
+    import tempfile
+    from models.science_database import ScienceDatabase
+
+    print("\nTesting catalogue snapshot...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "data")
+        shutil.copytree(os.path.join(os.path.dirname(__file__), '..', 'data'), data_dir)
+        snapshot_dir = os.path.join(tmp, "catalogue")
+
+        generated = ScienceDatabase(use_snapshot=False)
+        first = ScienceDatabase(data_dir, snapshot_dir)
+        second = ScienceDatabase(data_dir, snapshot_dir)
+        assert not first.loaded_from_snapshot
+        assert second.loaded_from_snapshot
+
+        assert second.get_total_experiment_count() == generated.get_total_experiment_count()
+        assert second.get_body_names() == generated.get_body_names()
+        assert second.query_experiments(body='Mun', situation='SrfLanded') == \
+            generated.query_experiments(body='Mun', situation='SrfLanded')
+        assert list(second.get_all_experiments()) == list(generated.get_all_experiments())
+        lazy, built = second.get_all_experiments(), generated.get_all_experiments()
+        assert lazy[-1] == built[-1] and lazy[-len(built)] == built[0]
+        assert lazy[-3:] == built[-3:]
+        try:
+            lazy[-len(built) - 1]
+        except IndexError:
+            pass
+        else:
+            assert False, "expected IndexError"
+        assert second.index.values('biome') == generated.index.values('biome')
+
+        # Editing the source JSON rebuilds the snapshot
+        bodies_file = os.path.join(data_dir, "celestial_bodies.json")
+        with open(bodies_file) as f:
+            bodies = json.load(f)
+        bodies['bodies'] = [b for b in bodies['bodies'] if b['name'] != 'Mun']
+        with open(bodies_file, 'w') as f:
+            json.dump(bodies, f)
+
+        edited = ScienceDatabase(data_dir, snapshot_dir)
+        assert not edited.loaded_from_snapshot
+        assert edited.get_experiments_by_body('Mun') == []
+        assert ScienceDatabase(data_dir, snapshot_dir).loaded_from_snapshot
+
+    print("✓ Snapshot OK")
+    return True
+
+
+def test_vectorized_availability():
+    """Test that NumPy availability matches the per-experiment calculation."""
+    from models.catalogue_columns import HAVE_NUMPY
+    from models.experiment import CompletedExperiment
+    from models.save_data import SaveGameData
+    from models.science_database import ScienceDatabase
+    from utils.science_calculator import ScienceCalculator
+
+    print("\nTesting vectorized availability...")
+
+    if not HAVE_NUMPY:
+        print("- numpy not installed, skipped")
+        return True
+
+    db = ScienceDatabase(use_snapshot=False)
+    save_data = SaveGameData("test")
+    for ksp_id, earned, cap in (
+        ("crewReport@KerbinSrfLandedLaunchPad", 1.5, 1.5),
+        ("evaReport@MunSrfLandedNorthwestCrater", 3.0, 8.0),
+        ("surfaceSample@MunSrfLandedCanyons", 30.0, 30.0),
+        ("crewReport@RaldSrfLandedHills", 1.0, 5.0),  # not in the catalogue
+    ):
+        save_data.add_completed_experiment(
+            CompletedExperiment(ExperimentID.from_ksp_id(ksp_id), earned, cap)
+        )
+
+    python_result = ScienceCalculator(db, vectorized=False).calculate_available_science(save_data)
+    calculator = ScienceCalculator(db, vectorized=True)
+    assert calculator.calculate_available_science(save_data) == python_result
+
+    columns = calculator.calculate_available_columns(save_data)
+    assert columns.count() == len(python_result)
+    assert abs(columns.total_science() - sum(e.available_science for e in python_result)) < 1e-6
+    mun = sum(e.available_science for e in python_result if e.body_name == 'Mun')
+    assert abs(columns.sum_by('body')['Mun'] - mun) < 1e-6
+    assert columns.count_by('experiment_type')['crewReport'] == \
+        sum(1 for e in python_result if e.experiment_id.experiment_type == 'crewReport')
+
+    print("✓ Vectorized availability OK")
+    return True
+
+
+def test_science_rollup():
+    """Test that rollup aggregates match direct sums and follow removals."""
+    from models.science_database import ScienceDatabase
+    from models.save_data import SaveGameData
+    from models.science_rollup import ScienceRollup, NO_BIOME
+    from utils.science_calculator import ScienceCalculator
+
+    print("\nTesting science rollup...")
+
+    available = ScienceCalculator(ScienceDatabase(use_snapshot=False)).calculate_available_science(SaveGameData())
+    rollup = ScienceRollup(available)
+
+    assert rollup.root.count == len(available)
+    mun = [e for e in available if e.body_name == 'Mun']
+    assert rollup.get('Body', ('Mun',)).count == len(mun)
+    assert abs(rollup.get('Body', ('Mun',)).total - sum(e.available_science for e in mun)) < 1e-9
+    landed = [e for e in mun if e.experiment_id.situation == 'SrfLanded' and not e.experiment_id.biome]
+    assert rollup.members('Body', ('Mun', 'SrfLanded', NO_BIOME)) == landed
+    assert rollup.children('Experiment') == sorted({e.experiment_name for e in available})
+    assert set(rollup.totals('Situation')) == {(e.experiment_id.situation,) for e in available}
+
+    # Removing everything of one body drops its groups
+    for exp in mun:
+        rollup.remove(exp)
+    assert rollup.get('Body', ('Mun',)) is None
+    assert 'Mun' not in rollup.children('Body')
+    assert rollup.root.count == len(available) - len(mun)
+
+    print("✓ Rollup OK")
+    return True
+
+
+def test_view_cache():
+    """Test that filtered views are reused until the data changes."""
+    from models.science_rollup import ScienceRollup
+    from models.view_cache import FilteredView, ViewCache
+
+    print("\nTesting view cache...")
+
+    builds = []
+
+    def build():
+        builds.append(1)
+        return FilteredView([], ScienceRollup())
+
+    cache = ViewCache(max_entries=2)
+    mun = cache.get(('Mun', None, 'Available Only', 'Body'), build)
+    cache.get((None, None, 'Available Only', 'Body'), build)
+    assert cache.get(('Mun', None, 'Available Only', 'Body'), build) is mun
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Least recently used view is evicted
+    cache.get((None, 'crewReport', 'Available Only', 'Body'), build)
+    assert len(cache) == 2
+    assert cache.get(('Mun', None, 'Available Only', 'Body'), build) is mun
+    cache.get((None, None, 'Available Only', 'Body'), build)
+    assert len(builds) == 4
+
+    # A new save invalidates everything
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.get(('Mun', None, 'Available Only', 'Body'), build) is not mun
+
+    print("✓ View cache OK")
+    return True
+
+
+def test_search_index():
+    """Test free-text search against a scan of the experiments."""
+    from models.science_database import ScienceDatabase
+    from models.save_data import SaveGameData
+    from models.experiment_index import ExperimentIndex
+    from models.search_index import label_tokens
+    from utils.science_calculator import ScienceCalculator
+
+    print("\nTesting search index...")
+
+    assert label_tokens("NorthwestCrater") == {"northwest", "crater", "northwestcrater"}
+
+    db = ScienceDatabase(use_snapshot=False)
+    search_index = db.get_search_index()
+
+    (sample,) = search_index.search("Mun Canyons surface sample", db.index)
+    assert str(sample.experiment_id) == "surfaceSample at Mun SrfLanded (Canyons)"
+
+    # Prefixes of any dimension; every word must match
+    def scan(experiments, words):
+        def labels(e):
+            exp_id = e.experiment_id
+            return (e.body_name, exp_id.experiment_type, e.experiment_name,
+                    exp_id.situation, exp_id.biome or "")
+        return [e for e in experiments if all(
+            any(token.startswith(word) for label in labels(e) for token in label_tokens(label))
+            for word in words
+        )]
+
+    available = ScienceCalculator(db).calculate_available_science(SaveGameData())
+    available_index = ExperimentIndex(available)
+    for query in ("crew", "mun can", "space high kerbin", "Flying (Low)", "northwestcr"):
+        words = query.lower().replace("(", " ").replace(")", " ").split()
+        assert search_index.search(query, available_index) == scan(available, words), query
+        assert search_index.search(query, db.index) == scan(db.get_all_experiments(), words), query
+
+    assert search_index.search("zzz", db.index) == []
+    assert len(search_index.search("", available_index)) == len(available)
+    filtered = search_index.search("crater", available_index, body="Mun")
+    assert filtered and all(e.body_name == "Mun" for e in filtered)
+    assert all(search_index.matches("crater", e) for e in filtered)
+
+    print("✓ Search index OK")
+    return True
+
+
+def test_streaming_availability():
+    """Test that streamed availability matches filtering the full list."""
+    import heapq
+    from itertools import islice
+    from models.experiment import CompletedExperiment
+    from models.save_data import SaveGameData
+    from models.science_database import ScienceDatabase
+    from utils.science_calculator import ScienceCalculator
+
+    print("\nTesting streaming availability...")
+
+    db = ScienceDatabase(use_snapshot=False)
+    calculator = ScienceCalculator(db, vectorized=False)
+    save_data = SaveGameData("test")
+    for ksp_id, earned, cap in (
+        ("evaReport@MunSrfLandedCanyons", 3.0, 8.0),
+        ("surfaceSample@MunSrfLandedCanyons", 30.0, 30.0),
+    ):
+        save_data.add_completed_experiment(
+            CompletedExperiment(ExperimentID.from_ksp_id(ksp_id), earned, cap)
+        )
+    full = calculator.calculate_available_science(save_data)
+    assert list(calculator.iter_available_science(save_data)) == full
+
+    mun_landed = list(calculator.iter_available_science(save_data, body='Mun', situation='SrfLanded'))
+    assert mun_landed == [
+        e for e in full if e.body_name == 'Mun' and e.experiment_id.situation == 'SrfLanded'
+    ]
+    assert not any(e.experiment_id.biome == 'Canyons' and
+                   e.experiment_id.experiment_type == 'surfaceSample' for e in mun_landed)
+
+    partial = list(calculator.iter_available_science(
+        save_data, experiment_type='evaReport', predicate=lambda e: e.is_partial
+    ))
+    assert [e.experiment_id.to_ksp_id() for e in partial] == ["evaReport@MunSrfLandedCanyons"]
+    assert all(e.available_science >= 20 for e in
+               calculator.iter_available_science(save_data, min_science=20))
+
+    # Consumers can stop early or keep a bounded top N
+    assert list(islice(calculator.iter_available_science(save_data), 5)) == full[:5]
+    top = heapq.nlargest(3, calculator.iter_available_science(save_data),
+                         key=lambda e: e.available_science)
+    assert top == sorted(full, key=lambda e: e.available_science, reverse=True)[:3]
+
+    print("✓ Streaming availability OK")
+    return True
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -97,9 +447,18 @@ def main():
 
     test1 = test_ksp_id_parsing()
     test2 = test_science_database()
+    test3 = test_experiment_id_interning()
+    test4 = test_ksp_id_decoder()
+    test5 = test_experiment_index_queries()
+    test6 = test_catalogue_snapshot()
+    test7 = test_vectorized_availability()
+    test8 = test_science_rollup()
+    test9 = test_view_cache()
+    test10 = test_search_index()
+    test11 = test_streaming_availability()
 
     print("\n" + "=" * 60)
-    if test1 and test2:
+    if test1 and test2 and test3 and test4 and test5 and test6 and test7 and test8 and test9 and test10 and test11:
         print("ALL TESTS PASSED ✓")
     else:
         print("SOME TESTS FAILED ✗")
@@ -0,0 +1,126 @@
+"""Test that the file watcher reports a change once it has settled."""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.file_watcher import FileWatcher
+
+
+POLL = 0.02
+SETTLE = 0.15
+
+
+def _append(path, text="x"):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _wait_for(condition, timeout=3.0):
+    """Wait until condition() is true; return whether it became true."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(POLL)
+    return condition()
+
+
+def _raise_first(count):
+    if count == 1:
+        raise RuntimeError("handler failed")
+    return None
+
+
+def _watch(path, handler):
+    """Start a fast-polling watcher on path; returns (watcher, calls)."""
+    calls = []
+    lock = threading.Lock()
+
+    def on_change(changed_path):
+        with lock:
+            calls.append(changed_path)
+            count = len(calls)
+        return handler(count)
+
+    watcher = FileWatcher(path, on_change, poll_interval=POLL, settle_time=SETTLE)
+    watcher.start()
+    # Let the watcher take the file's starting state
+    time.sleep(POLL)
+    return watcher, calls
+
+
+def test_growing_file_reported_once_settled():
+    """A file still being written is not reported; once it stops, exactly once."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'persistent.sfs')
+        _append(path)
+        watcher, calls = _watch(path, lambda count: None)
+        try:
+            # Keep growing the file faster than it can settle
+            deadline = time.monotonic() + 4 * SETTLE
+            while time.monotonic() < deadline:
+                _append(path)
+                time.sleep(POLL)
+            assert calls == []
+
+            assert _wait_for(lambda: len(calls) >= 1)
+            time.sleep(4 * SETTLE)
+            assert calls == [path]
+        finally:
+            watcher.stop()
+
+
+def test_unchanged_file_not_reported():
+    """Starting to watch reports nothing until the file changes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'persistent.sfs')
+        _append(path)
+        watcher, calls = _watch(path, lambda count: None)
+        try:
+            time.sleep(4 * SETTLE)
+            assert calls == []
+        finally:
+            watcher.stop()
+
+
+def test_unhandled_change_reported_again():
+    """A change the handler declines or fails on is reported again, then not after."""
+    for handler in (lambda count: count > 1, _raise_first):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'persistent.sfs')
+            _append(path)
+            watcher, calls = _watch(path, handler)
+            try:
+                _append(path)
+                assert _wait_for(lambda: len(calls) >= 2)
+                time.sleep(4 * SETTLE)
+                assert len(calls) == 2
+            finally:
+                watcher.stop()
+
+
+def test_failing_change_given_up_on():
+    """A change the handler keeps failing on is dropped; the next change is reported."""
+    def handler(count):
+        raise RuntimeError("handler failed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'persistent.sfs')
+        _append(path)
+        watcher, calls = _watch(path, handler)
+        try:
+            _append(path)
+            assert _wait_for(lambda: len(calls) >= FileWatcher.MAX_FAILURES)
+            time.sleep(4 * SETTLE)
+            assert len(calls) == FileWatcher.MAX_FAILURES
+
+            _append(path)
+            assert _wait_for(lambda: len(calls) > FileWatcher.MAX_FAILURES)
+        finally:
+            watcher.stop()
@@ -0,0 +1,194 @@
+"""Test loading modded science definitions from GameData."""
+
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.experiment import ExperimentID
+from models.science_database import ScienceDatabase
+from parsers.gamedata_loader import GameDataLoader, parse_config_text, parse_definitions_file
+from utils.science_calculator import ScienceCalculator
+
+
+SCIENCE_DEFS = """\
+// Science definitions from a science mod
+EXPERIMENT_DEFINITION
+{
+    id = magnetometer
+    title = Magnetometer Report
+    baseValue = 12
+    scienceCap = 24
+    requireAtmosphere = False
+    situationMask = 48   // InSpaceLow | InSpaceHigh
+    biomeMask = 16
+    RESULTS
+    {
+        default = Nothing much.
+    }
+}
+@EXPERIMENT_DEFINITION[crewReport]:NEEDS[SomeMod]
+{
+    @baseValue = 6
+}
+!EXPERIMENT_DEFINITION[mysteryGoo] {}
+"""
+
+PLANET_PACK = """\
+@Kopernicus:FOR[PlanetPack]
+{
+    Body
+    {
+        name = Rald
+        Template
+        {
+            name = Duna
+            removeAtmosphere = true
+        }
+        Properties
+        {
+            Biomes
+            {
+                Biome { name = Highlands }
+                Biome
+                {
+                    name = Northern Ice Shelf
+                }
+            }
+        }
+        Ocean
+        {
+            density = 1
+        }
+    }
+}
+"""
+
+PART = """\
+PART
+{
+    name = someTank
+    MODULE { name = ModuleFuelTank }
+}
+"""
+
+
+def _make_gamedata(directory: str) -> str:
+    """Create a GameData folder with a science mod, planet pack and part."""
+    gamedata = os.path.join(directory, 'GameData')
+    for rel_path, text in (('ScienceMod/Resources/ScienceDefs.cfg', SCIENCE_DEFS),
+                           ('PlanetPack/Rald.cfg', PLANET_PACK),
+                           ('Parts/tank.cfg', PART)):
+        path = os.path.join(gamedata, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+    return gamedata
+
+
+def test_parse_config_text():
+    """ModuleManager decorations are stripped and deletes skipped."""
+    nodes = parse_config_text(SCIENCE_DEFS)
+    assert [(n['name'], n['filter']) for n in nodes] == [
+        ('EXPERIMENT_DEFINITION', None), ('EXPERIMENT_DEFINITION', 'crewReport')
+    ]
+    assert nodes[0]['values']['situationMask'] == '48'
+    assert nodes[0]['nodes'][0]['name'] == 'RESULTS'
+    assert nodes[1]['values'] == {'baseValue': '6'}
+
+
+def test_patches_to_other_definitions_skipped():
+    """Operator values and wildcard/multi-name edits don't become definitions."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'Rebalance.cfg')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("@EXPERIMENT_DEFINITION[*]:FINAL\n{\n    @baseValue *= 2\n}\n"
+                    "@EXPERIMENT_DEFINITION[crewReport,evaReport]\n{\n    @scienceCap = 10\n}\n"
+                    "@EXPERIMENT_DEFINITION[magnetometer]\n{\n    @baseValue += 4\n"
+                    "    @scienceCap = 30\n}\n")
+
+        experiments, _ = parse_definitions_file(path)
+        assert experiments == [{'id': 'magnetometer', 'science_cap': 30.0}]
+
+
+def test_bad_situation_masks_ignored():
+    """Masks too large for an int (or not numbers) give no situations."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ScienceDefs.cfg')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("EXPERIMENT_DEFINITION\n{\n    id = overflow\n    situationMask = 1e400\n"
+                    "    biomeMask = inf\n}\n"
+                    "EXPERIMENT_DEFINITION\n{\n    id = garbage\n    situationMask = lots\n"
+                    "    baseValue = 5\n}\n")
+
+        experiments, _ = parse_definitions_file(path)
+        assert experiments == [
+            {'id': 'overflow', 'situations': [], 'biome_situations': [], 'requires_biome': False},
+            {'id': 'garbage', 'situations': [], 'base_value': 5.0},
+        ]
+
+
+def test_gamedata_loader_and_cache():
+    """Definitions are extracted, cached and re-parsed only when files change."""
+    with tempfile.TemporaryDirectory() as tmp:
+        gamedata = _make_gamedata(tmp)
+        cache_dir = os.path.join(tmp, 'cache')
+
+        loader = GameDataLoader(gamedata, cache_dir=cache_dir)
+        mod_data = loader.load()
+        assert loader.parsed_files == 3
+
+        experiments = {e['id']: e for e in mod_data['experiments']}
+        assert experiments['magnetometer']['situations'] == ['InSpaceLow', 'InSpaceHigh']
+        assert experiments['magnetometer']['biome_situations'] == ['InSpaceLow']
+        assert experiments['crewReport'] == {'id': 'crewReport', 'base_value': 6.0}
+        assert 'mysteryGoo' not in experiments
+        (rald,) = mod_data['bodies']
+        assert rald['biomes'] == ['Highlands', 'NorthernIceShelf']
+        assert rald['has_atmosphere'] is False and rald['has_ocean'] is True
+
+        again = GameDataLoader(gamedata, cache_dir=cache_dir)
+        assert again.load()['fingerprint'] == mod_data['fingerprint']
+        assert again.parsed_files == 0
+
+        with open(os.path.join(gamedata, 'PlanetPack', 'Rald.cfg'), 'a') as f:
+            f.write("// edited\n")
+        edited = GameDataLoader(gamedata, cache_dir=cache_dir)
+        edited.load()
+        assert edited.parsed_files == 1
+
+
+def test_mod_data_merged_into_catalogue():
+    """Modded bodies and experiments show up in the generated catalogue."""
+    with tempfile.TemporaryDirectory() as tmp:
+        mod_data = GameDataLoader(_make_gamedata(tmp), cache_dir=os.path.join(tmp, 'cache')).load()
+        db = ScienceDatabase(snapshot_dir=os.path.join(tmp, 'catalogue'), mod_data=mod_data)
+
+        assert 'Rald' in db.get_body_names()
+        assert db.bodies['Rald']['situations'] == [
+            'SrfLanded', 'SrfSplashed', 'InSpaceLow', 'InSpaceHigh'
+        ]
+        # Biome results only in the situations biomeMask allows
+        high = db.query_experiments(body='Rald', experiment_type='magnetometer',
+                                    situation='InSpaceHigh')
+        assert [e.experiment_id.biome for e in high] == [None]
+        assert len(db.query_experiments(body='Rald', experiment_type='magnetometer',
+                                        situation='InSpaceLow')) == 2
+        assert db.get_experiment_name('magnetometer') == 'Magnetometer Report'
+        assert db.experiments['crewReport']['name'] == 'Crew Report'
+
+        exp_id = db.get_id_decoder().decode("surfaceSample@RaldSrfSplashedNorthernIceShelf")
+        assert exp_id.body == 'Rald' and exp_id.biome == 'NorthernIceShelf'
+
+        calculator = ScienceCalculator(db)
+        assert calculator._estimate_science_value(
+            ExperimentID('crewReport', 'Rald', 'SrfLanded')) == 6.0
+
+        # The modded catalogue gets its own snapshot
+        reloaded = ScienceDatabase(snapshot_dir=os.path.join(tmp, 'catalogue'), mod_data=mod_data)
+        assert reloaded.loaded_from_snapshot
+        assert reloaded.get_total_experiment_count() == db.get_total_experiment_count()
+        stock = ScienceDatabase(snapshot_dir=os.path.join(tmp, 'catalogue'))
+        assert 'Rald' not in stock.get_body_names()
@@ -0,0 +1,91 @@
+"""Test that a save changed on disk during a load is reloaded."""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from gui.main_window import MainWindow
+from gui.save_loader import SaveLoader
+from utils.file_watcher import FileWatcher
+
+
+class _Root:
+    """Stands in for Tk; the test delivers loader events itself."""
+
+    def after(self, ms, func):
+        pass
+
+
+def _wait_for(condition, timeout=5.0):
+    """Wait until condition() is true; return whether it became true."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+def test_change_during_load_is_reloaded():
+    """An autosave while a load is running supersedes it with a quiet reload."""
+    with tempfile.TemporaryDirectory() as tmp:
+        save_path = os.path.join(tmp, 'persistent.sfs')
+        with open(save_path, 'w', encoding='utf-8') as f:
+            f.write("GAME\n{\n}\n")
+
+        started = []
+        release = threading.Event()
+        done = []
+
+        def load_func(request, report):
+            started.append(request)
+            report("parse")
+            release.wait(5)
+            report("extract")
+            return request
+
+        loader = SaveLoader(_Root(), load_func,
+                            on_progress=lambda request, stage: None,
+                            on_done=lambda request, result: done.append(result),
+                            on_error=lambda request, error: done.append(error))
+        window = SimpleNamespace(selected_save=("Career", save_path), loader=loader)
+
+        loader.start("Career", save_path)
+        assert _wait_for(lambda: len(started) == 1)
+
+        watcher = FileWatcher(
+            save_path,
+            lambda path: MainWindow._on_save_file_changed(window, "Career", path),
+            poll_interval=0.02, settle_time=0.1
+        )
+        watcher.start()
+        try:
+            time.sleep(0.05)
+            with open(save_path, 'a', encoding='utf-8') as f:
+                f.write("// autosave\n")
+            assert _wait_for(lambda: len(started) == 2)
+        finally:
+            watcher.stop()
+
+        def delivered():
+            loader._poll()
+            return bool(done)
+
+        release.set()
+        assert _wait_for(delivered)
+        reload = started[1]
+        assert done == [reload]
+        assert reload.quiet
+        assert started[0].cancelled.is_set()
+
+
+def test_change_to_deselected_save_is_kept():
+    """A change to a save the user has moved away from is left unhandled."""
+    window = SimpleNamespace(selected_save=("Other", "/other/persistent.sfs"), loader=None)
+    assert MainWindow._on_save_file_changed(window, "Career", "/career/persistent.sfs") is False
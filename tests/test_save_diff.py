@@ -0,0 +1,112 @@
+"""Test incremental recalculation between two loads of a save."""
+
+import sys
+import os
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.experiment import CompletedExperiment, ExperimentID
+from models.save_data import SaveGameData
+from models.save_diff import diff_saves
+from models.science_database import ScienceDatabase
+from utils.last_session import LastSession
+from utils.science_calculator import ScienceCalculator
+
+
+def _save(*entries) -> SaveGameData:
+    save_data = SaveGameData("Test Career")
+    for ksp_id, earned, cap in entries:
+        save_data.add_completed_experiment(
+            CompletedExperiment(ExperimentID.from_ksp_id(ksp_id), earned, cap)
+        )
+    return save_data
+
+
+def test_diff_saves():
+    """Added, changed and removed subjects are reported."""
+    previous = _save(("crewReport@KerbinSrfLandedLaunchPad", 1.5, 1.5),
+                     ("evaReport@MunSrfLandedCanyons", 2.0, 8.0),
+                     ("mysteryGoo@MinmusInSpaceLow", 3.0, 10.0))
+    current = _save(("crewReport@KerbinSrfLandedLaunchPad", 1.5, 1.5),
+                    ("evaReport@MunSrfLandedCanyons", 6.0, 8.0),
+                    ("surfaceSample@MunSrfLandedCanyons", 12.0, 30.0))
+
+    delta = diff_saves(previous, current)
+    assert [e.experiment_id.to_ksp_id() for e in delta.added] == ["surfaceSample@MunSrfLandedCanyons"]
+    assert [new.science_earned for _, new in delta.changed] == [6.0]
+    assert [e.experiment_id.to_ksp_id() for e in delta.removed] == ["mysteryGoo@MinmusInSpaceLow"]
+    assert delta.earned_science_change() == 12.0 + 4.0 - 3.0
+    assert diff_saves(current, current).is_empty()
+
+
+def test_apply_delta_matches_full_recalculation():
+    """Applying a delta gives the same list and statistics as starting over."""
+    db = ScienceDatabase(use_snapshot=False)
+    calculator = ScienceCalculator(db)
+    previous = _save(("evaReport@MunSrfLandedCanyons", 2.0, 8.0),
+                     ("crewReport@KerbinFlyingLow", 1.0, 5.0))
+    current = _save(("evaReport@MunSrfLandedCanyons", 8.0, 8.0),
+                    ("crewReport@KerbinFlyingLow", 3.0, 5.0),
+                    ("surfaceSample@MunSrfLandedCanyons", 12.0, 30.0))
+
+    available = calculator.calculate_available_science(previous)
+    stats = calculator.calculate_statistics(available, previous)
+    delta = diff_saves(previous, current)
+    changes = calculator.apply_delta(available, delta, current)
+
+    expected = calculator.calculate_available_science(current)
+    assert not changes.recalculated
+    assert changes.available == expected
+    assert {e.experiment_id.to_ksp_id() for e in changes.removed} == {"evaReport@MunSrfLandedCanyons"}
+    assert len(changes.updated) == 2
+
+    new_stats = calculator.update_statistics(stats, changes, delta, current)
+    for key, value in calculator.calculate_statistics(expected, current).items():
+        assert abs(new_stats[key] - value) < 1e-9, key
+
+    # A subject that becomes available again forces a full recalculation
+    changes = calculator.apply_delta(expected, diff_saves(current, previous), previous)
+    assert changes.recalculated
+    assert changes.available == available
+
+
+def test_last_session_round_trip_revalidates():
+    """A saved session restores equal results that a reload can patch."""
+    db = ScienceDatabase(use_snapshot=False)
+    calculator = ScienceCalculator(db)
+    previous = _save(("evaReport@MunSrfLandedCanyons", 2.0, 8.0),
+                     ("crewReport@KerbinFlyingLow", 1.0, 5.0))
+    current = _save(("evaReport@MunSrfLandedCanyons", 8.0, 8.0),
+                    ("crewReport@KerbinFlyingLow", 3.0, 5.0))
+    available = calculator.calculate_available_science(previous)
+    stats = calculator.calculate_statistics(available, previous)
+    filters = {'body': "Mun", 'experiment': "All", 'show': "Available Only",
+               'group_by': "Experiment", 'search': "canyon"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_path = os.path.join(tmp, "persistent.sfs")
+        session = LastSession(os.path.join(tmp, "last_session.json"))
+        assert session.load() is None
+
+        open(save_path, 'w').close()
+        session.save("Test Career", save_path, previous, available, stats,
+                     filters=filters, choices={'body_names': ["Mun"]},
+                     catalogue_hash=db.source_hash)
+        restored = session.load()
+        assert restored['save_path'] == save_path
+        assert restored['filters'] == filters
+        assert restored['catalogue_hash'] == db.source_hash
+        assert restored['available'] == available
+        assert restored['stats'] == stats
+        assert restored['save_data'].completed_experiments == previous.completed_experiments
+
+        # Revalidating against the current save patches the restored results
+        delta = diff_saves(restored['save_data'], current)
+        changes = calculator.apply_delta(restored['available'], delta, current)
+        assert changes.available == calculator.calculate_available_science(current)
+
+        # A session whose save is gone is not shown
+        os.remove(save_path)
+        assert session.load() is None
@@ -0,0 +1,277 @@
+"""Test R&D-only science extraction against the full sfsutils parse."""
+
+import sys
+import os
+import json
+import tempfile
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parsers.sfs_parser import SFSParser
+from parsers.science_extractor import ScienceExtractor
+
+
+SAMPLE_SAVE = """GAME
+{
+\tversion = 1.12.5
+\tTitle = Test Career
+\tSCENARIO
+\t{
+\t\tname = ProgressTracking
+\t\tScience
+\t\t{
+\t\t\tid = decoy@KerbinSrfLanded
+\t\t}
+\t}
+\tSCENARIO
+\t{
+\t\tname = ResearchAndDevelopment
+\t\tsci = 42.5
+\t\tTech
+\t\t{
+\t\t\tid = start
+\t\t\tUnlocks
+\t\t\t{
+\t\t\t\tpart = mk1pod.v2
+\t\t\t}
+\t\t}
+\t\tScience
+\t\t{
+\t\t\tid = crewReport@KerbinSrfLandedLaunchPad
+\t\t\ttitle = Crew Report from LaunchPad
+\t\t\tsci = 1.5
+\t\t\tcap = 1.5
+\t\t}
+\t\tScience
+\t\t{
+\t\t\tid = recovery@KerbinFlew
+\t\t\tsci = 3
+\t\t\tcap = 3
+\t\t}
+\t\tScience
+\t\t{
+\t\t\tid = surfaceSample@MunSrfLandedCanyons
+\t\t\ttitle = Surface Sample from the Mun's Canyons
+\t\t\tsci = 12.25
+\t\t\tcap = 40
+\t\t}
+\t}
+\tFLIGHTSTATE
+\t{
+\t\tVESSEL
+\t\t{
+\t\t\tname = Science
+\t\t\tPART
+\t\t\t{
+\t\t\t\tname = mk1pod.v2
+\t\t\t}
+\t\t}
+\t}
+}
+"""
+
+
+def _write_sample(directory: str) -> str:
+    save_path = os.path.join(directory, 'persistent.sfs')
+    with open(save_path, 'w', encoding='utf-8') as f:
+        f.write(SAMPLE_SAVE)
+    return save_path
+
+
+def _as_tuples(save_data):
+    return sorted(
+        (exp.experiment_id.to_ksp_id(), exp.science_earned, exp.science_cap)
+        for exp in save_data.get_all_completed_experiments()
+    )
+
+
+def test_rd_scan_matches_full_parse():
+    """The R&D-only scan extracts exactly what the full parse does."""
+    parser = SFSParser(ksp_directory=tempfile.gettempdir())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_path = _write_sample(tmp)
+
+        full = ScienceExtractor.extract_science_data(
+            parser.parse_save_file(save_path), "Test"
+        )
+        scanned = parser.load_science_data(save_path, "Test", use_mmap=False)
+        mapped = parser.load_science_data(save_path, "Test", use_mmap=True)
+
+    assert _as_tuples(scanned) == _as_tuples(full)
+    assert _as_tuples(mapped) == _as_tuples(full)
+    assert _as_tuples(scanned) == [
+        ("crewReport@KerbinSrfLandedLaunchPad", 1.5, 1.5),
+        ("surfaceSample@MunSrfLandedCanyons", 12.25, 40.0),
+    ]
+
+
+def test_rd_scan_yields_raw_nodes():
+    """Science nodes keep the sfsutils key/value shape, including titles."""
+    parser = SFSParser(ksp_directory=tempfile.gettempdir())
+
+    for use_mmap in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            nodes = list(parser.iter_science_nodes(_write_sample(tmp), use_mmap))
+
+        assert [node['id'] for node in nodes] == [
+            "crewReport@KerbinSrfLandedLaunchPad",
+            "recovery@KerbinFlew",
+            "surfaceSample@MunSrfLandedCanyons",
+        ]
+        assert nodes[2]['title'] == "Surface Sample from the Mun's Canyons"
+        assert nodes[2]['sci'] == "12.25"
+
+
+def test_mmap_scan_empty_and_no_rd():
+    """Empty saves and saves without R&D yield nothing."""
+    parser = SFSParser(ksp_directory=tempfile.gettempdir())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        empty_path = os.path.join(tmp, 'empty.sfs')
+        open(empty_path, 'w').close()
+        no_rd_path = os.path.join(tmp, 'no_rd.sfs')
+        with open(no_rd_path, 'w') as f:
+            f.write("GAME\n{\n\tTitle = Sandbox\n}\n")
+
+        assert list(parser.iter_science_nodes(empty_path)) == []
+        assert list(parser.iter_science_nodes(no_rd_path)) == []
+
+
+def test_batch_decode_skips_only_invalid_ids():
+    """An unparseable id in a batch skips that entry, not the whole save."""
+    from models.science_database import ScienceDatabase
+
+    nodes = [
+        {'id': "crewReport@KerbinSrfLandedLaunchPad", 'sci': "5", 'cap': "5"},
+        {'id': "not-an-id", 'sci': "1", 'cap': "1"},
+        {'id': "evaReport@MunSrfLandedCanyons", 'sci': "2", 'cap': "8"},
+    ]
+    for decoder in (None, ScienceDatabase(use_snapshot=False).get_id_decoder()):
+        save_data = ScienceExtractor.extract_science_nodes(nodes, "Test", decoder)
+        assert _as_tuples(save_data) == [
+            ("crewReport@KerbinSrfLandedLaunchPad", 5.0, 5.0),
+            ("evaReport@MunSrfLandedCanyons", 2.0, 8.0),
+        ]
+
+
+def test_rd_scan_missing_file():
+    """Missing save files raise FileNotFoundError like parse_save_file."""
+    parser = SFSParser(ksp_directory=tempfile.gettempdir())
+
+    try:
+        parser.load_science_data(os.path.join(tempfile.gettempdir(), 'no-such-save.sfs'))
+    except FileNotFoundError:
+        return
+    assert False, "expected FileNotFoundError"
+
+
+def test_parse_cache_hits_and_invalidation():
+    """Unchanged saves hit the cache; modified saves miss."""
+    from parsers.parse_cache import ParseCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(cache_dir=os.path.join(tmp, 'cache'))
+        parser = SFSParser(ksp_directory=tmp, cache=cache)
+        save_path = _write_sample(tmp)
+
+        first = parser.load_science_data(save_path, "Test")
+        second = parser.load_science_data(save_path, "Renamed")
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second.save_name == "Renamed"
+        assert _as_tuples(second) == _as_tuples(first)
+
+        # Touched but unchanged: still a hit, decided by content hash
+        stat = os.stat(save_path)
+        os.utime(save_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        parser.load_science_data(save_path, "Test")
+        assert cache.hits == 2
+
+        # Modified content: miss, and the new values are returned
+        with open(save_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_SAVE.replace("sci = 12.25", "sci = 20.5"))
+        updated = parser.load_science_data(save_path, "Test")
+        assert cache.misses == 2
+        assert ("surfaceSample@MunSrfLandedCanyons", 20.5, 40.0) in _as_tuples(updated)
+
+        # A new cache instance reads the persisted index
+        reopened = ParseCache(cache_dir=os.path.join(tmp, 'cache'))
+        assert reopened.get(save_path) is not None
+        assert reopened.get_stats()['hits'] == 1
+
+
+def test_parse_cache_lru_eviction():
+    """The cache stays under its size bound by dropping the oldest entries."""
+    from parsers.parse_cache import ParseCache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(cache_dir=os.path.join(tmp, 'cache'))
+        parser = SFSParser(ksp_directory=tmp, cache=cache)
+
+        paths = []
+        for name in ("a", "b"):
+            os.makedirs(os.path.join(tmp, name))
+            paths.append(_write_sample(os.path.join(tmp, name)))
+
+        parser.load_science_data(paths[0])
+        # Room for one entry and a half
+        cache.max_bytes = cache.get_stats()['bytes'] * 3 // 2
+        parser.load_science_data(paths[1])
+
+        assert cache.get_stats()['entries'] == 1
+        assert cache.get(paths[0]) is None
+        assert cache.get(paths[1]) is not None
+
+
+def test_parse_cache_keys_on_bytes_read():
+    """Only the bytes up to the end of the R&D scenario decide a touched save."""
+    from parsers.parse_cache import ParseCache
+
+    def rewrite(save_path, text):
+        stat = os.stat(save_path)
+        with open(save_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.utime(save_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(cache_dir=os.path.join(tmp, 'cache'))
+        parser = SFSParser(ksp_directory=tmp, cache=cache)
+        save_path = _write_sample(tmp)
+        parser.load_science_data(save_path)
+
+        # Same size, changed only in FLIGHTSTATE: the science is the same
+        rewrite(save_path, SAMPLE_SAVE.replace("name = Science", "name = Sciencf"))
+        parser.load_science_data(save_path)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Same size, changed inside the R&D scenario
+        rewrite(save_path, SAMPLE_SAVE.replace("sci = 12.25", "sci = 12.75"))
+        updated = parser.load_science_data(save_path)
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert ("surfaceSample@MunSrfLandedCanyons", 12.75, 40.0) in _as_tuples(updated)
+
+
+def test_parse_cache_hits_written_lazily():
+    """A hit updates last-used times in memory; flush writes them."""
+    from parsers.parse_cache import ParseCache
+
+    def last_used():
+        with open(os.path.join(tmp, 'cache', ParseCache.INDEX_FILE), encoding='utf-8') as f:
+            return [entry['last_used'] for entry in json.load(f)['entries'].values()]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ParseCache(cache_dir=os.path.join(tmp, 'cache'))
+        parser = SFSParser(ksp_directory=tmp, cache=cache)
+        save_path = _write_sample(tmp)
+        parser.load_science_data(save_path)
+        stored = last_used()
+
+        time.sleep(0.01)
+        parser.load_science_data(save_path)
+        assert cache.hits == 1
+        assert last_used() == stored
+
+        cache.flush()
+        assert last_used()[0] > stored[0]
@@ -0,0 +1,129 @@
+"""Test the SQLite science history store."""
+
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.experiment import CompletedExperiment, ExperimentID
+from models.save_data import SaveGameData
+from parsers.sfs_parser import SFSParser
+from utils.science_history import ScienceHistory
+
+
+def _save(*entries) -> SaveGameData:
+    save_data = SaveGameData("Test Career")
+    for ksp_id, earned, cap in entries:
+        save_data.add_completed_experiment(
+            CompletedExperiment(ExperimentID.from_ksp_id(ksp_id), earned, cap)
+        )
+    return save_data
+
+
+def test_history_deduplicates_and_accepts_out_of_order_snapshots():
+    """Only changed subjects are logged, and late old snapshots keep values right."""
+    first = _save(("crewReport@KerbinSrfLandedLaunchPad", 1.5, 1.5),
+                  ("evaReport@MunSrfLandedCanyons", 2.0, 8.0))
+    second = _save(("crewReport@KerbinSrfLandedLaunchPad", 1.5, 1.5),
+                   ("evaReport@MunSrfLandedCanyons", 6.0, 8.0),
+                   ("mysteryGoo@MinmusInSpaceLow", 3.0, 10.0))
+    third = _save(("crewReport@KerbinSrfLandedLaunchPad", 1.5, 1.5),
+                  ("evaReport@MunSrfLandedCanyons", 8.0, 8.0))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = ScienceHistory(os.path.join(tmp, 'history.sqlite3'))
+        path = os.path.join(tmp, 'persistent.sfs')
+
+        assert history.record("Test Career", path, first, recorded_at=100.0) is not None
+        assert history.record("Test Career", path, third, recorded_at=300.0) is not None
+        # Same time, or same science as the snapshot before: nothing new
+        assert history.record("Test Career", path, third, recorded_at=300.0) is None
+        assert history.record("Test Career", path, third, recorded_at=400.0) is None
+        # An older snapshot arriving late
+        assert history.record("Test Career", path, second, recorded_at=200.0) is not None
+
+        with sqlite3.connect(history.path) as conn:
+            logged = conn.execute("SELECT COUNT(*) FROM changes").fetchone()[0]
+        # 2 at first; Mun and Minmus at second; Mun and Minmus (removed) at third
+        assert logged == 6
+
+        for recorded_at, save_data in ((100.0, first), (200.0, second), (300.0, third)):
+            assert history.subjects_at(path, recorded_at) == {
+                exp_id: (exp.science_earned, exp.science_cap)
+                for exp_id, exp in save_data.completed_experiments.items()
+            }
+
+        trend = history.trend("Test Career")
+        assert [row['recorded_at'] for row in trend] == [100.0, 200.0, 300.0]
+        assert [row['earned'] for row in trend] == [3.5, 10.5, 9.5]
+        assert [row['subjects'] for row in trend] == [2, 3, 2]
+        assert [row['earned'] for row in history.trend(path, limit=2)] == [10.5, 9.5]
+
+        by_body = history.trend("Test Career", by='body', limit=1)
+        assert {row['group']: row['earned'] for row in by_body} == {'Kerbin': 1.5, 'Mun': 8.0}
+        assert history.trend("Other Career") == []
+
+
+def _write_save(path, sci, mtime):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(
+            "GAME\n{\n\tSCENARIO\n\t{\n\t\tname = ResearchAndDevelopment\n"
+            "\t\tScience\n\t\t{\n\t\t\tid = evaReport@MunSrfLandedCanyons\n"
+            f"\t\t\tsci = {sci}\n\t\t\tcap = 8\n\t\t}}\n\t}}\n}}\n"
+        )
+    os.utime(path, (mtime, mtime))
+
+
+def test_history_records_save_at_time_it_was_read():
+    """A save rewritten after it was read is recorded at the read version's time."""
+    with tempfile.TemporaryDirectory() as tmp:
+        history = ScienceHistory(os.path.join(tmp, 'history.sqlite3'))
+        path = os.path.join(tmp, 'persistent.sfs')
+        parser = SFSParser()
+
+        _write_save(path, 2, 1000.0)
+        read = parser.load_science_data(path, "Test Career")
+        # KSP autosaves before the load is recorded
+        _write_save(path, 6, 2000.0)
+        assert history.record("Test Career", path, read) is not None
+        assert history.record("Test Career", path, parser.load_science_data(path)) is not None
+
+        trend = history.trend(path)
+        assert [row['recorded_at'] for row in trend] == [1000.0, 2000.0]
+        assert [row['earned'] for row in trend] == [2.0, 6.0]
+
+
+def test_history_forgets_subject_ids_of_rolled_back_records():
+    """A rowid from a rolled back insert is not trusted when another subject gets it."""
+    class FailingHistory(ScienceHistory):
+        fail = True
+
+        def _insert_changes(self, *args):
+            if self.fail:
+                raise sqlite3.OperationalError("disk I/O error")
+            ScienceHistory._insert_changes(*args)
+
+    mun = _save(("evaReport@MunSrfLandedCanyons", 2.0, 8.0))
+    minmus = _save(("mysteryGoo@MinmusInSpaceLow", 3.0, 10.0))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'history.sqlite3')
+        path = os.path.join(tmp, 'persistent.sfs')
+        history = FailingHistory(db_path)
+        try:
+            history.record("Test Career", path, mun, recorded_at=100.0)
+            assert False, "record should have failed"
+        except sqlite3.OperationalError:
+            pass
+
+        # Another process takes the rolled back subject's rowid
+        ScienceHistory(db_path).record("Test Career", path, minmus, recorded_at=100.0)
+
+        history.fail = False
+        history.record("Test Career", path, mun, recorded_at=200.0)
+        assert history.subjects_at(path, 200.0) == {
+            ExperimentID.from_ksp_id("evaReport@MunSrfLandedCanyons"): (2.0, 8.0)
+        }